@@ -171,7 +171,80 @@ PROCESSING_SETTINGS = {
     'CHUNK_SIZE': 1000,
     'MAX_TOKENS': 8000,
     'ENABLE_TABLE_EXTRACTION': True,
-    'ENABLE_IMAGE_ANALYSIS': True
+    'ENABLE_IMAGE_ANALYSIS': True,
+    # PDF parse engine: 'pymupdf' (single pass) or 'legacy' (pdf2docx + pdfplumber + fitz)
+    'PDF_PARSE_ENGINE': os.environ.get('PDF_PARSE_ENGINE', 'pymupdf'),
+    # Worker processes for page-parallel parsing of large PDFs (1 = serial)
+    'PDF_PARSE_WORKERS': int(os.environ.get('PDF_PARSE_WORKERS', 1)),
+    'PDF_PARSE_PARALLEL_MIN_PAGES': 50,
+    # Keep parser output in memory instead of writing text/CSV/image/JSON temp files
+    'PDF_PARSE_IN_MEMORY': True,
+    # Images smaller than this many pixels (width * height) are treated as decoration and skipped
+    'PDF_IMAGE_MIN_PIXELS': 64 * 64,
+    # Extracted images are written once to a persistent content-addressed store
+    'IMAGE_STORE_ENABLED': True,
+    'IMAGE_STORE_ROOT': os.environ.get('IMAGE_STORE_ROOT') or None,
+    # Table engine: 'pymupdf' (find_tables) or 'pdfplumber', unset uses the parse engine's own
+    'PDF_TABLE_ENGINE': os.environ.get('PDF_TABLE_ENGINE') or None,
+    # Skip the table search on pages without horizontal and vertical ruling lines
+    'PDF_TABLE_PRECHECK': True,
+    # Downloaded PDFs larger than this are parsed from a memory-mapped spool file
+    'PDF_SPOOL_THRESHOLD_BYTES': 32 * 1024 * 1024,
+    # Streaming downloads share one pooled HTTP session and abort above the size cap
+    'DOWNLOAD_MAX_BYTES': int(os.environ.get('DOWNLOAD_MAX_BYTES', 100 * 1024 * 1024)),
+    'DOWNLOAD_TIMEOUT': 30,
+    'DOWNLOAD_CHUNK_SIZE': 256 * 1024,
+    'DOWNLOAD_POOL_SIZE': 10,
+    # Long documents are parsed and stored in page batches, searchable after the first one
+    'PROGRESSIVE_MIN_PAGES': 150,
+    'PROGRESSIVE_FIRST_BATCH_PAGES': 20,
+    'PROGRESSIVE_BATCH_PAGES': 100,
+    'REFERENCE_SCAN_MAX_PAGES': 60,
+    # 'semantic' splits text at detected headings into sections of up to SECTION_MAX_TOKENS,
+    # merging ones under SECTION_MIN_TOKENS, 'page' stores one section per page
+    'SECTIONING': os.environ.get('SECTIONING', 'semantic'),
+    'SECTION_MAX_TOKENS': 2000,
+    'SECTION_MIN_TOKENS': 800,
+    # Strip running headers, footers and page numbers and rejoin hyphenated words before sectioning
+    'TEXT_NORMALIZATION': True,
+    # Sections per INSERT when a batch of pages is stored
+    'SECTION_BULK_BATCH_SIZE': 200,
+    # Ingest progress within a stage is written to the document at most this often
+    'PROGRESS_MIN_INTERVAL_SECONDS': 2.0,
+    # The ingest parse stage runs in a spawned process pool per job worker, processes are
+    # replaced after PARSE_POOL_MAX_TASKS_PER_CHILD parses and stopped above PARSE_POOL_RSS_LIMIT_MB
+    'PARSE_PROCESS_POOL': True,
+    'PARSE_POOL_WORKERS': 1,
+    'PARSE_POOL_MAX_TASKS_PER_CHILD': 20,
+    'PARSE_POOL_RSS_LIMIT_MB': int(os.environ.get('PARSE_POOL_RSS_LIMIT_MB', 2048)),
+    # The ingest summary is generated from the first two pages in a thread while the
+    # document is parsed and its sections stored, instead of between those stages
+    'INGEST_PIPELINING': True,
+    # Database job queue run by manage.py run_workers, the web processes only enqueue
+    'JOB_WORKERS': int(os.environ.get('JOB_WORKERS', 2)),
+    'JOB_POLL_INTERVAL_SECONDS': 1.0,
+    # A running job refreshes its heartbeat this often, one silent for JOB_STALE_SECONDS is requeued
+    'JOB_HEARTBEAT_SECONDS': 30,
+    'JOB_STALE_SECONDS': 300,
+    # A failed job is retried after this many seconds, doubled per attempt, up to its max_attempts
+    'JOB_RETRY_BACKOFF_SECONDS': 30,
+    # Jobs of each workload class running at once across all worker processes and hosts,
+    # enforced with leases in the database that expire LEASE_TTL_SECONDS after their last renewal
+    'CONCURRENCY_LIMITS': {
+        'ingest': int(os.environ.get('INGEST_CONCURRENCY', 3)),
+        'search': int(os.environ.get('SEARCH_CONCURRENCY', 3)),
+        'literature_review': int(os.environ.get('LITERATURE_REVIEW_CONCURRENCY', 2)),
+    },
+    'LEASE_TTL_SECONDS': 120,
+    # Uploads beyond this many queued ingest jobs are refused with 503 and Retry-After
+    'JOB_QUEUE_MAX_PENDING': int(os.environ.get('JOB_QUEUE_MAX_PENDING', 100)),
+    # Content-addressed cache of parse results keyed by PDF SHA-256 + parser version
+    'PARSE_CACHE_ENABLED': True,
+    'PARSE_CACHE_MAX_BYTES': int(os.environ.get('PARSE_CACHE_MAX_BYTES', 512 * 1024 * 1024)),
+    # Ingest stages are checkpointed, downloaded PDFs are kept here until the document completes
+    'INGEST_CHECKPOINT_ROOT': os.environ.get('INGEST_CHECKPOINT_ROOT') or None,
+    # resume_stale_ingests takes over documents not updated for this long, well above gunicorn's timeout
+    'INGEST_STALE_SECONDS': int(os.environ.get('INGEST_STALE_SECONDS', 600)),
 }
 
 
@@ -0,0 +1,88 @@
+# src/research_assistant/management/commands/benchmark_citation_scanner.py
+
+# python manage.py benchmark_citation_scanner
+#  \\ More pages and runs:
+# python manage.py benchmark_citation_scanner --pages 500 --repeat 5
+
+import re
+import time
+
+from django.core.management.base import BaseCommand
+
+from research_assistant.services.citation_scanner import get_scanner
+from research_assistant.util.synthetic_pdf import REFERENCE_STYLES, generate_text
+
+# The patterns as they were before the scanner, kept here as the baseline
+PER_PATTERN_CITATION_PATTERNS = {
+    'numbered': r'\[(\d+(?:,\s*\d+)*)\]',
+    'parenthetical': r'\(([A-Za-z]+\s+et\s+al\.,\s*\d{4})\)',
+    'narrative': r'([A-Za-z]+\s+et\s+al\.\s*\(\d{4}\))',
+    'with_page': r'\(([A-Za-z]+,\s*\d{4},\s*p\.\s*\d+)\)',
+    'author_year': r'\(([A-Za-z]+,\s*[A-Za-z]\.,\s*\d{4}(?:-\d{4})?\.?)\)'
+}
+
+
+def _per_pattern_scan(text):
+    """The previous approach: normalise, then one uncompiled finditer per pattern"""
+    cleaned_text = re.sub(r'\s+', ' ', text).strip()
+    found = []
+    for pattern_type, pattern in PER_PATTERN_CITATION_PATTERNS.items():
+        for match in re.finditer(pattern, cleaned_text):
+            found.append((pattern_type, match.span()))
+    return found
+
+
+class Command(BaseCommand):
+    help = 'Compare the single-pass citation scanner with per-pattern scanning on page-sized texts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--pages',
+            type=int,
+            default=200,
+            help='Number of synthetic pages to scan',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            help='Runs per approach, the fastest run is reported',
+        )
+
+    def handle(self, *args, **options):
+        # Citation styles rotate across pages, one page in four has none
+        styles = list(REFERENCE_STYLES) + [None]
+        pages = [
+            generate_text(paragraphs=6, seed=page, reference_style=styles[page % len(styles)])
+            for page in range(options['pages'])
+        ]
+        scanner = get_scanner()
+
+        # Both approaches must find the same citations before timing means anything
+        for text in pages:
+            expected = sorted(_per_pattern_scan(text))
+            actual = sorted((match.type, match.span) for match in scanner.scan(text))
+            if expected != actual:
+                self.stderr.write(self.style.ERROR('Scanner and per-pattern results differ'))
+                return
+
+        average_chars = sum(len(text) for text in pages) // len(pages)
+        self.stdout.write(f"{len(pages)} pages, {average_chars} characters on average")
+        self.stdout.write(f"{'approach':>14} {'seconds':>9} {'us/page':>9} {'speedup':>8}")
+
+        baseline = None
+        for name, scan in (('per-pattern', _per_pattern_scan), ('single-pass', scanner.scan)):
+            elapsed = min(self._time(scan, pages) for _ in range(options['repeat']))
+            baseline = baseline or elapsed
+            self.stdout.write(
+                f"{name:>14} {elapsed:>9.4f} {1e6 * elapsed / len(pages):>9.1f} {baseline / elapsed:>7.2f}x"
+            )
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _time(self, scan, pages):
+        """Scan every page once and return the wall time in seconds"""
+        start = time.perf_counter()
+        for text in pages:
+            scan(text)
+        return time.perf_counter() - start
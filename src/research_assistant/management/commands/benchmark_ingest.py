@@ -0,0 +1,150 @@
+# src/research_assistant/management/commands/benchmark_ingest.py
+
+# python manage.py benchmark_ingest --output bench/ingest.json
+#  \\ Subset of documents and modes, best of 3 runs:
+# python manage.py benchmark_ingest --documents article book --modes pymupdf legacy --repeat 3
+#  \\ Peak Python heap of the pipeline on the 500-page document:
+# python manage.py benchmark_ingest --documents thesis --modes pymupdf --trace-memory
+#  \\ Compare two releases:
+# diff <(jq -S . old.json) <(jq -S . new.json)
+
+import json
+import multiprocessing
+import os
+import platform
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import fitz
+import pdfplumber
+from django.core.management.base import BaseCommand, CommandError
+
+from research_assistant.services.document_processor import PARSER_VERSION
+from research_assistant.util.ingest_benchmark import run_case
+from research_assistant.util.synthetic_pdf import generate_pdf
+
+# Synthetic documents, generated offline so every run parses identical input
+CORPUS = [
+    {'name': 'short', 'pages': 12, 'table_every': 0, 'image_every': 0,
+     'reference_style': 'numbered_bracket', 'reference_count': 20},
+    {'name': 'article', 'pages': 40, 'table_every': 5, 'image_every': 4,
+     'reference_style': 'author_year', 'reference_count': 60},
+    {'name': 'report', 'pages': 120, 'table_every': 2, 'image_every': 10,
+     'reference_style': 'numbered_dot', 'reference_count': 80},
+    {'name': 'book', 'pages': 400, 'table_every': 25, 'image_every': 15,
+     'reference_style': 'author_year', 'reference_count': 200},
+    {'name': 'thesis', 'pages': 500, 'table_every': 20, 'image_every': 25,
+     'reference_style': 'numbered_bracket', 'reference_count': 250},
+]
+
+# DocumentProcessor attribute overrides per mode
+MODES = {
+    'pymupdf': {'parse_engine': 'pymupdf', 'parse_workers': 1},
+    'pymupdf-no-precheck': {'parse_engine': 'pymupdf', 'parse_workers': 1, 'table_precheck': False},
+    'pymupdf-pdfplumber-tables': {'parse_engine': 'pymupdf', 'parse_workers': 1, 'table_engine': 'pdfplumber'},
+    'pymupdf-parallel': {'parse_engine': 'pymupdf', 'parse_workers': max(2, os.cpu_count() or 1),
+                         'parallel_min_pages': 1},
+    'pymupdf-disk': {'parse_engine': 'pymupdf', 'parse_workers': 1, 'parse_in_memory': False},
+    'legacy': {'parse_engine': 'legacy', 'parse_workers': 1},
+}
+
+
+class Command(BaseCommand):
+    help = 'Benchmark DocumentProcessor ingest on a synthetic corpus and emit JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--documents',
+            nargs='+',
+            choices=[spec['name'] for spec in CORPUS],
+            default=[spec['name'] for spec in CORPUS],
+            help='Corpus documents to run',
+        )
+        parser.add_argument(
+            '--modes',
+            nargs='+',
+            choices=list(MODES),
+            default=list(MODES),
+            help='Engine/mode combinations to run',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=1,
+            help='Runs per case, the fastest run is reported',
+        )
+        parser.add_argument(
+            '--output',
+            help='JSON report path, defaults to ingest_benchmark_<timestamp>.json',
+        )
+        parser.add_argument(
+            '--trace-memory',
+            action='store_true',
+            help='Also report the peak Python heap of an extra, untimed run',
+        )
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError('--repeat must be at least 1')
+
+        corpus = [spec for spec in CORPUS if spec['name'] in options['documents']]
+        created_at = datetime.now()
+        # Settings and app start-up print to stdout, so the report always goes to a file
+        output_path = options['output'] or f"ingest_benchmark_{created_at:%Y%m%d_%H%M%S}.json"
+
+        report = {
+            'benchmark': 'ingest',
+            'created_at': created_at.isoformat(),
+            'parser_version': PARSER_VERSION,
+            'environment': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+                'pymupdf': fitz.VersionBind,
+                'pdfplumber': pdfplumber.__version__
+            },
+            'corpus': corpus,
+            'results': []
+        }
+
+        self.stdout.write(f"{'document':>10} {'mode':>26} {'pages':>6} {'seconds':>9} {'pages/s':>8} {'peak MB':>8} {'heap MB':>8}")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_store_root = os.path.join(tmp_dir, 'images')
+            for spec in corpus:
+                pdf_path = os.path.join(tmp_dir, f"{spec['name']}.pdf")
+                generate_pdf(
+                    pdf_path,
+                    spec['pages'],
+                    table_every=spec['table_every'],
+                    image_every=spec['image_every'],
+                    reference_style=spec['reference_style'],
+                    reference_count=spec['reference_count']
+                )
+
+                for mode in options['modes']:
+                    result = self._run_isolated(
+                        pdf_path, MODES[mode], options['repeat'], image_store_root, options['trace_memory']
+                    )
+                    result.update({'document': spec['name'], 'mode': mode, 'options': MODES[mode]})
+                    report['results'].append(result)
+
+                    peak = max(result['peak_rss_mb']['self'] or 0, result['peak_rss_mb']['children'] or 0)
+                    heap = result.get('peak_traced_mb')
+                    self.stdout.write(
+                        f"{spec['name']:>10} {mode:>26} {result['pages']:>6} {result['wall_seconds']:>9.2f} "
+                        f"{result['pages_per_second']:>8.1f} {peak:>8.1f} {'-' if heap is None else heap:>8}"
+                    )
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True, default=str)
+            f.write('\n')
+        self.stdout.write(self.style.SUCCESS(f"Report written to {output_path}"))
+
+    def _run_isolated(self, pdf_path, mode_options, repeat, image_store_root, trace_memory=False):
+        """Run one case in a fresh process so its peak memory is its own"""
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+            return executor.submit(
+                run_case, pdf_path, mode_options, repeat, image_store_root, trace_memory
+            ).result()
@@ -0,0 +1,76 @@
+# src/research_assistant/management/commands/benchmark_parallel_parse.py
+
+# python manage.py benchmark_parallel_parse
+#  \\ Custom page counts and worker counts:
+# python manage.py benchmark_parallel_parse --pages 100 300 600 --workers 1 2 4
+
+import logging
+import os
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+
+from research_assistant.services.pdf_parser import PDFParser
+from research_assistant.util.synthetic_pdf import generate_pdf
+
+
+class Command(BaseCommand):
+    help = 'Benchmark page-parallel PDF parsing against page count and worker count'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--pages',
+            type=int,
+            nargs='+',
+            default=[50, 200, 600],
+            help='Page counts of the synthetic PDFs to parse',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            nargs='+',
+            default=[1, 2, 4],
+            help='Worker process counts to compare',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=1,
+            help='Runs per combination, the fastest run is reported',
+        )
+
+    def handle(self, *args, **options):
+        # Per-page parser logging would swamp the timings
+        logging.getLogger(PDFParser.__module__).setLevel(logging.WARNING)
+
+        worker_counts = sorted(set(options['workers']) | {1})
+        self.stdout.write(f"CPUs available: {os.cpu_count()}")
+        self.stdout.write(f"{'pages':>6} {'workers':>8} {'seconds':>9} {'pages/s':>9} {'speedup':>8}")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for page_count in options['pages']:
+                pdf_path = os.path.join(tmp_dir, f'synthetic_{page_count}.pdf')
+                generate_pdf(pdf_path, page_count, table_every=3, image_every=4)
+
+                baseline = None
+                for workers in worker_counts:
+                    elapsed = min(
+                        self._time_parse(pdf_path, workers)
+                        for _ in range(options['repeat'])
+                    )
+                    if workers == 1:
+                        baseline = elapsed
+                    self.stdout.write(
+                        f"{page_count:>6} {workers:>8} {elapsed:>9.2f} "
+                        f"{page_count / elapsed:>9.1f} {baseline / elapsed:>7.2f}x"
+                    )
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _time_parse(self, pdf_path, workers):
+        """Parse once and return the wall time in seconds"""
+        parser = PDFParser(pdf_path, engine='pymupdf', workers=workers, parallel_min_pages=1)
+        start = time.perf_counter()
+        parser.parse()
+        return time.perf_counter() - start
@@ -0,0 +1,127 @@
+# src/research_assistant/management/commands/benchmark_parse_isolation.py
+
+# python manage.py benchmark_parse_isolation
+#  \\ A bigger synthetic document, or a real one:
+# python manage.py benchmark_parse_isolation --pages 600
+# python manage.py benchmark_parse_isolation --pdf path/to/document.pdf
+
+import contextlib
+import io
+import logging
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from research_assistant.services.document_processor import DocumentProcessor
+from research_assistant.services.parse_pool import get_parse_pool
+from research_assistant.services.pdf_parser import PDFParser
+from research_assistant.util.synthetic_pdf import generate_pdf
+from research_assistant.views.document_management import DocumentManagementViewSet
+
+PROBE_USERNAME = 'benchmark-parse-isolation'
+
+
+class Command(BaseCommand):
+    help = 'Measure API request latency in a process while it parses a document, in-process and in the parse pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--pages',
+            type=int,
+            default=300,
+            help='Page count of the synthetic PDF to parse',
+        )
+        parser.add_argument(
+            '--pdf',
+            help='Parse this PDF instead of a synthetic one',
+        )
+        parser.add_argument(
+            '--probe-interval',
+            type=float,
+            default=0.01,
+            help='Seconds between probe requests',
+        )
+
+    def handle(self, *args, **options):
+        # Per-page parser logging would swamp the timings
+        logging.getLogger(PDFParser.__module__).setLevel(logging.WARNING)
+        self.user, _ = User.objects.get_or_create(username=PROBE_USERNAME, defaults={'email': f'{PROBE_USERNAME}@example.com'})
+        self.view = DocumentManagementViewSet.as_view({'get': 'processing_capacity'})
+        self.probe_interval = options['probe_interval']
+
+        # Pool processes start once, as in a long-running worker
+        get_parse_pool().run(DocumentProcessor().pool_state(include_config=True), self._warmup_pdf())
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pdf_path = options['pdf']
+            if not pdf_path:
+                pdf_path = os.path.join(tmp_dir, f"synthetic_{options['pages']}.pdf")
+                generate_pdf(pdf_path, options['pages'], table_every=3, image_every=4)
+
+            self.stdout.write(
+                f"{'mode':<12} {'requests':>9} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'parse s':>8}"
+            )
+            self._report('idle', *self._measure(lambda: time.sleep(3)))
+            self._report('in-process', *self._measure(lambda: self._parse(pdf_path, use_pool=False)))
+            self._report('parse pool', *self._measure(lambda: self._parse(pdf_path, use_pool=True)))
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _warmup_pdf(self):
+        path = os.path.join(tempfile.gettempdir(), 'benchmark_parse_isolation_warmup.pdf')
+        if not os.path.exists(path):
+            generate_pdf(path, 2)
+        return path
+
+    def _parse(self, pdf_path, use_pool):
+        processor = DocumentProcessor(document_id='benchmark')
+        processor.use_parse_pool = use_pool
+        # The parser prints per stage
+        with contextlib.redirect_stdout(io.StringIO()):
+            processor.process_file(pdf_path)
+
+    def _measure(self, work):
+        """Probe request latencies (ms) from a thread while work runs, and work's wall time"""
+        latencies = []
+        done = threading.Event()
+
+        def probe():
+            factory = APIRequestFactory()
+            try:
+                while not done.is_set():
+                    request = factory.get('/')
+                    force_authenticate(request, user=self.user)
+                    start = time.perf_counter()
+                    self.view(request)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    time.sleep(self.probe_interval)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=probe)
+        thread.start()
+        start = time.perf_counter()
+        try:
+            work()
+        finally:
+            elapsed = time.perf_counter() - start
+            done.set()
+            thread.join()
+        return latencies, elapsed
+
+    def _report(self, mode, latencies, elapsed):
+        if not latencies:
+            self.stdout.write(f"{mode:<12} {0:>9}")
+            return
+        ordered = sorted(latencies)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        self.stdout.write(
+            f"{mode:<12} {len(ordered):>9} {statistics.median(ordered):>8.1f} {p99:>8.1f} "
+            f"{ordered[-1]:>8.1f} {elapsed:>8.2f}"
+        )
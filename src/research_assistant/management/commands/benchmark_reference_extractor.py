@@ -0,0 +1,262 @@
+# src/research_assistant/management/commands/benchmark_reference_extractor.py
+
+# python manage.py benchmark_reference_extractor
+#  \\ Add real documents to the fixture corpus:
+# python manage.py benchmark_reference_extractor --pdf paper.pdf thesis.pdf --repeat 5
+
+import contextlib
+import io
+import logging
+import os
+import re
+import tempfile
+import time
+
+import fitz
+from django.core.management.base import BaseCommand
+
+from research_assistant.services.document_processor import DocumentProcessor
+from research_assistant.services.pdf_parser import PDFParser
+from research_assistant.services.reference_section import REFERENCE_SECTION_TITLES, extract_reference_section
+from research_assistant.util.synthetic_pdf import REFERENCE_STYLES, generate_pdf
+
+# Reference list entries of each synthetic document
+SYNTHETIC_REFERENCE_COUNT = 120
+
+# The entry patterns as they were before the single-pass extractor, kept here as the baseline
+LEGACY_REFERENCE_PATTERNS = {
+    'numbered_bracket': r'^\s*\[(\d+)\]',
+    'numbered_dot': r'^\s*(\d+)\.',
+    'author_year': r'^\s*\[([A-Za-z]+(?:\s*,\s*[A-Za-z]+)*\s*\(\d{4}[a-z]?\))\]',
+    'parenthetical': r'^\s*\(([A-Za-z]+\s*,\s*\d{4})\)',
+    'narrative': r'^([A-Za-z]+\s+et\s+al\.\s*\(\d{4}\))',
+    'standard': r'^([A-Za-z]+\s*,\s*[A-Za-z]+\s*\.\s*\d{4})'
+}
+
+# Fixtures the previous extractor read wrongly, checked by entry count instead:
+# it found no entries in APA/Harvard style lists
+LEGACY_DIFFERS = {'synthetic-author_year'}
+
+# Hand-written page texts for the cases synthetic documents do not produce
+EDGE_CASES = {
+    'acknowledgements-first': [
+        "Body text\nAcknowledgements\nWe thank everyone.\n1. Funding came from a grant in 2019.",
+        "References\n[1] A. Smith, Some title. Journal of Things, 2001.\n[2] B. Jones, Other title,\n"
+        "Journal of Stuff, 2003.",
+    ],
+    'heading-after-numbered-line': [
+        "2. Methods\nReferences\n[1] A. Smith, Merged away. Journal, 2001.",
+        "References\n[1] A. Smith, Kept. Journal of Things, 2001.\n[2] B. Jones, Also kept. 2004.",
+    ],
+    'continued-across-pages': [
+        "Intro\nBibliography\n[1] A. Smith, First. Journal, 2001.\n[2] B. Jones, Runs over",
+        "the page break and ends here, 2002.\n[3] C. Chen, Third one. Journal, 2003.\n[1] D. Duplicate id, 2005.",
+        "",
+        "[4] E. Kim, Last page entry. https://example.org/paper",
+    ],
+    'mixed-styles': [
+        "Works Cited\n(Smith, 2001) Smith, A. A title of a book.\nPress, 2001.\n"
+        "Kim et al. (2016) Some narrative entry text\nwith more text 2016.\n"
+        "Ammann P., Offutt.J. 2008 Introduction to software testing\n"
+        "[Chen(2019a)] Chen, A bracketed author-year reference.\nhttps://example.org/chen and trailing\n"
+        "7. Dotted entry http://example.com/x\nleftover line",
+    ],
+    'no-references': [
+        "Just a page\nwith nothing of note",
+        "Another page 2001.\n[1] looks like a reference but there is no heading",
+    ],
+    'heading-on-last-page': [
+        "Body",
+        "--- References ---\n[1] A. Smith, Only entry. Journal, 2001.\n[2] B. Jones, Second entry here.",
+    ],
+}
+
+
+def _legacy_preprocess_reference_text(page_texts):
+    """Pre-process pages to join split references before main extraction"""
+    processed_pages = []
+    for page_text in page_texts:
+        lines = page_text.split('\n')
+        joined_lines = []
+        current_line = ""
+        for line in lines:
+            if (re.match(r'^\s*\[\d+\]', line) or
+                    re.match(r'^\s*\d+\.', line) or
+                    re.match(r'^\s*\[.*?\(\d{4}[a-z]?\)\]', line) or
+                    re.match(r'^\s*\([A-Za-z]+,\s*\d{4}\)', line)):
+                if current_line:
+                    joined_lines.append(current_line)
+                current_line = line
+            elif current_line:
+                current_line += " " + line.strip()
+            else:
+                joined_lines.append(line)
+        if current_line:
+            joined_lines.append(current_line)
+        processed_pages.append('\n'.join(joined_lines))
+    return processed_pages
+
+
+def _legacy_extract_reference_section(page_texts):
+    """The previous DocumentProcessor._extract_reference_section, kept as the baseline"""
+    page_texts = _legacy_preprocess_reference_text(page_texts)
+    reference_data = {
+        'entries': {},
+        'type': 'unknown',
+        'start_page': None,
+        'end_page': None
+    }
+
+    def combine_reference_lines(lines, start_idx):
+        combined = lines[start_idx]
+        current_idx = start_idx + 1
+        while current_idx < len(lines):
+            next_line = lines[current_idx].strip()
+            if any(re.match(pattern, next_line) for pattern in LEGACY_REFERENCE_PATTERNS.values()):
+                break
+            if re.search(r'\d{4}\.|\b(?:https?://|www\.)\S+', next_line):
+                combined += ' ' + next_line
+                break
+            combined += ' ' + next_line
+            current_idx += 1
+        return combined, current_idx - 1
+
+    def read_entries(lines, current_line):
+        while current_line < len(lines):
+            line = lines[current_line].strip()
+            for ref_type, pattern in LEGACY_REFERENCE_PATTERNS.items():
+                ref_match = re.match(pattern, line)
+                if ref_match:
+                    ref_id = ref_match.group(1)
+                    full_ref, current_line = combine_reference_lines(lines, current_line)
+                    if len(full_ref) > 10:
+                        reference_data['entries'][ref_id] = {
+                            'text': full_ref,
+                            'type': ref_type
+                        }
+                    break
+            current_line += 1
+
+    reference_section_found = False
+    for page_idx, page_text in enumerate(page_texts):
+        if not page_text:
+            continue
+        lines = page_text.split('\n')
+        for line_idx, line in enumerate(lines):
+            for pattern in REFERENCE_SECTION_TITLES:
+                if re.search(pattern, line.lower().strip()):
+                    reference_section_found = True
+                    if reference_data['start_page'] is None:
+                        reference_data['start_page'] = page_idx + 1
+                    break
+            if reference_section_found:
+                break
+        if reference_section_found:
+            read_entries(lines, line_idx + 1)
+
+    if reference_section_found:
+        for page_idx in range(reference_data['start_page'], len(page_texts)):
+            read_entries(page_texts[page_idx].split('\n'), 0)
+            reference_data['end_page'] = page_idx + 1
+
+    return reference_data
+
+
+def _pdf_page_texts(pdf_path):
+    with fitz.open(pdf_path) as doc:
+        return [page.get_text().strip() for page in doc]
+
+
+class Command(BaseCommand):
+    help = 'Check the single-pass reference extractor against the previous one on a fixture corpus and time both'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--pages',
+            type=int,
+            default=300,
+            help='Body pages of each synthetic document',
+        )
+        parser.add_argument(
+            '--pdf',
+            nargs='*',
+            default=[],
+            help='Real PDFs to add to the corpus',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            help='Runs per approach, the fastest run is reported',
+        )
+
+    def handle(self, *args, **options):
+        corpus = dict(EDGE_CASES)
+        expected_counts = {}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for style in REFERENCE_STYLES:
+                pdf_path = os.path.join(tmp_dir, f"{style}.pdf")
+                generate_pdf(
+                    pdf_path, options['pages'], reference_style=style, reference_count=SYNTHETIC_REFERENCE_COUNT
+                )
+                corpus[f"synthetic-{style}"] = _pdf_page_texts(pdf_path)
+                expected_counts[f"synthetic-{style}"] = SYNTHETIC_REFERENCE_COUNT
+            unresolved = self._check_citations_resolve(tmp_dir)
+        for pdf_path in options['pdf']:
+            corpus[os.path.basename(pdf_path)] = _pdf_page_texts(pdf_path)
+
+        # Entries, type and page bounds must match before timing means anything
+        mismatches = 0
+        for name, page_texts in corpus.items():
+            actual = extract_reference_section(page_texts)
+            matches = name in LEGACY_DIFFERS or actual == _legacy_extract_reference_section(page_texts)
+            if name in expected_counts:
+                matches = matches and len(actual['entries']) == expected_counts[name]
+            status = 'ok' if matches else 'MISMATCH'
+            mismatches += status != 'ok'
+            self.stdout.write(
+                f"{name:>32} {len(page_texts):>5} pages {len(actual['entries']):>5} entries "
+                f"pages {actual['start_page']}-{actual['end_page']} {status}"
+            )
+        if mismatches:
+            self.stderr.write(self.style.ERROR(f"{mismatches} fixture(s) differ from the expected entries"))
+            return
+        if unresolved:
+            self.stderr.write(self.style.ERROR(f"{unresolved} citation(s) of the synthetic documents did not resolve"))
+            return
+
+        self.stdout.write(f"{'approach':>14} {'seconds':>9} {'speedup':>8}")
+        baseline = None
+        for name, extract in (('previous', _legacy_extract_reference_section),
+                              ('single-pass', extract_reference_section)):
+            elapsed = min(self._time(extract, corpus) for _ in range(options['repeat']))
+            baseline = baseline or elapsed
+            self.stdout.write(f"{name:>14} {elapsed:>9.4f} {baseline / elapsed:>7.2f}x")
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _check_citations_resolve(self, tmp_dir):
+        """Parse a short synthetic document per style end to end, returns the citations left without references"""
+        # Per-page parser logging would swamp the report
+        logging.getLogger(PDFParser.__module__).setLevel(logging.WARNING)
+        unresolved = 0
+        for style in REFERENCE_STYLES:
+            pdf_path = os.path.join(tmp_dir, f"resolve_{style}.pdf")
+            generate_pdf(pdf_path, 20, reference_style=style, reference_count=60)
+            processor = DocumentProcessor(document_id='benchmark')
+            processor.use_parse_pool = False
+            # The parser prints per stage
+            with contextlib.redirect_stdout(io.StringIO()):
+                sections, _ = processor.process_file(pdf_path)
+            citations = [citation for section in sections for citation in section['citations']]
+            missing = sum(not citation['references'] for citation in citations)
+            unresolved += missing
+            self.stdout.write(f"{'resolve-' + style:>32} {len(citations):>5} citations {missing:>5} unresolved")
+        return unresolved
+
+    def _time(self, extract, corpus):
+        """Extract every fixture once and return the wall time in seconds"""
+        start = time.perf_counter()
+        for page_texts in corpus.values():
+            extract(page_texts)
+        return time.perf_counter() - start
@@ -0,0 +1,105 @@
+# src/research_assistant/management/commands/benchmark_table_engines.py
+
+# python manage.py benchmark_table_engines
+#  \\ Compare engines on your own PDFs (files or directories):
+# python manage.py benchmark_table_engines --pdf ~/papers ~/books/thesis.pdf
+
+import logging
+import os
+import tempfile
+
+from django.core.management.base import BaseCommand
+
+from research_assistant.services.pdf_parser import PDFParser
+from research_assistant.util.synthetic_pdf import generate_pdf
+
+
+class Command(BaseCommand):
+    help = 'Compare table extraction engines, with and without the ruling-line pre-check'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--pdf',
+            nargs='+',
+            default=[],
+            help='PDF files or directories of PDFs, a synthetic corpus is used when omitted',
+        )
+        parser.add_argument(
+            '--pages',
+            type=int,
+            default=60,
+            help='Page count of the synthetic PDF',
+        )
+        parser.add_argument(
+            '--slowest',
+            type=int,
+            default=5,
+            help='Number of slowest pages to list per engine',
+        )
+
+    def handle(self, *args, **options):
+        logging.getLogger(PDFParser.__module__).setLevel(logging.WARNING)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pdf_paths = self._collect_pdfs(options['pdf'])
+            if not pdf_paths:
+                pdf_path = os.path.join(tmp_dir, 'synthetic.pdf')
+                generate_pdf(pdf_path, options['pages'], table_every=5, image_every=4)
+                pdf_paths = [pdf_path]
+
+            self.stdout.write(
+                f"{'engine':>11} {'precheck':>9} {'pages':>6} {'skipped':>8} "
+                f"{'tables':>7} {'seconds':>9} {'ms/page':>8}"
+            )
+            for table_engine in PDFParser.TABLE_ENGINES:
+                for precheck in (False, True):
+                    self._run(pdf_paths, table_engine, precheck, options['slowest'])
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _collect_pdfs(self, paths):
+        """Expand directories into the PDF files they contain"""
+        pdf_paths = []
+        for path in paths:
+            path = os.path.expanduser(path)
+            if os.path.isdir(path):
+                pdf_paths.extend(
+                    os.path.join(path, name) for name in sorted(os.listdir(path))
+                    if name.lower().endswith('.pdf')
+                )
+            else:
+                pdf_paths.append(path)
+        return pdf_paths
+
+    def _run(self, pdf_paths, table_engine, precheck, slowest):
+        """Extract tables from every PDF and print the aggregated timings"""
+        pages = skipped = tables = 0
+        seconds = 0.0
+        page_times = []
+
+        for pdf_path in pdf_paths:
+            parser = PDFParser(
+                pdf_path,
+                engine='legacy',
+                in_memory=True,
+                table_engine=table_engine,
+                table_precheck=precheck
+            )
+            found = parser.extract_tables()
+            stats = parser.result["metadata"]["table_extraction"]
+
+            pages += stats['pages_searched'] + stats['pages_skipped']
+            skipped += stats['pages_skipped']
+            tables += sum(len(page_tables) for page_tables in found.values())
+            seconds += stats['total_seconds']
+            name = os.path.basename(pdf_path)
+            page_times.extend(
+                (page_seconds, name, page_num) for page_num, page_seconds in stats['page_seconds'].items()
+            )
+
+        self.stdout.write(
+            f"{table_engine:>11} {str(precheck):>9} {pages:>6} {skipped:>8} "
+            f"{tables:>7} {seconds:>9.2f} {1000 * seconds / max(pages, 1):>8.1f}"
+        )
+        for page_seconds, name, page_num in sorted(page_times, reverse=True)[:slowest]:
+            self.stdout.write(f"{'':>11} slowest: {name} p{page_num} {1000 * page_seconds:.1f} ms")
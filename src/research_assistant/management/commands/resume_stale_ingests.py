@@ -0,0 +1,90 @@
+# src/research_assistant/management/commands/resume_stale_ingests.py
+
+# python manage.py resume_stale_ingests
+#  \\ List the abandoned documents and their last completed stage only:
+# python manage.py resume_stale_ingests --dry-run
+#  \\ Keep running as a reaper, checking every minute:
+# python manage.py resume_stale_ingests --interval 60
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from research_assistant.models import IngestCheckpoint
+from research_assistant.services.concurrency import LeaseSemaphore
+from research_assistant.services.ingest_pipeline import IngestPipeline, claim_document, stale_documents
+
+
+class Command(BaseCommand):
+    help = 'Resume documents left pending or processing by a stopped worker, from their last completed stage'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--stale-seconds',
+            type=int,
+            help='Seconds without an update before a document counts as abandoned, '
+                 'defaults to PROCESSING_SETTINGS INGEST_STALE_SECONDS',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=10,
+            help='Documents to resume per check',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='List the abandoned documents without resuming them',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            help='Check again every this many seconds instead of exiting',
+        )
+
+    def handle(self, *args, **options):
+        if options['limit'] < 1:
+            raise CommandError('--limit must be at least 1')
+
+        while True:
+            self._reap(options['stale_seconds'], options['limit'], options['dry_run'])
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+
+    def _reap(self, stale_seconds, limit, dry_run):
+        documents = list(stale_documents(stale_seconds)[:limit])
+        if not documents:
+            self.stdout.write('No stale documents')
+            return
+
+        for document in documents:
+            checkpoint = IngestCheckpoint.objects.filter(document=document).first()
+            stage = checkpoint.stage if checkpoint else None
+            self.stdout.write(
+                f"{document.id} {document.processing_status} since {document.updated_at:%Y-%m-%d %H:%M:%S}, "
+                f"last completed stage: {stage or 'none'}"
+            )
+            if dry_run:
+                continue
+
+            # Resumed ingests count against the same limit as the job workers' ones
+            lease = LeaseSemaphore('ingest')
+            if not lease.try_acquire():
+                self.stdout.write('Ingest concurrency limit reached, the rest wait for the next check')
+                return
+
+            with lease.hold():
+                # Another reaper, or the original worker, touched it since it was listed
+                if not claim_document(document):
+                    self.stdout.write(f"{document.id} taken over elsewhere, skipped")
+                    continue
+
+                document.refresh_from_db()
+                pipeline = IngestPipeline(document)
+                try:
+                    pipeline.run()
+                    self.stdout.write(self.style.SUCCESS(f"{document.id} completed"))
+                except Exception as e:
+                    pipeline.fail(e)
+                    self.stdout.write(self.style.ERROR(f"{document.id} failed: {str(e)}"))
@@ -0,0 +1,105 @@
+# src/research_assistant/management/commands/run_workers.py
+
+# python manage.py run_workers
+#  \\ Four worker processes, only taking ingest jobs:
+# python manage.py run_workers --workers 4 --kinds ingest
+#  \\ Run the queued jobs in this process and exit when the queue is empty:
+# python manage.py run_workers --drain
+
+import multiprocessing
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from research_assistant.models import Job
+from research_assistant.services.job_queue import JOB_WORKERS, JobWorker
+
+# A worker process that exits is restarted after this many seconds
+RESTART_DELAY_SECONDS = 5
+
+
+def _run_worker(kinds, poll_interval):
+    """Entry point of a forked worker process"""
+    worker = JobWorker(kinds=kinds, poll_interval=poll_interval)
+    worker.install_signal_handlers()
+    worker.run()
+
+
+class Command(BaseCommand):
+    help = 'Run worker processes that take jobs from the database job queue'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Worker processes, defaults to PROCESSING_SETTINGS JOB_WORKERS',
+        )
+        parser.add_argument(
+            '--kinds',
+            nargs='+',
+            choices=Job.KINDS,
+            help='Only take jobs of these kinds',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            help='Seconds between polls of an empty queue',
+        )
+        parser.add_argument(
+            '--drain',
+            action='store_true',
+            help='Run queued jobs in this process until the queue is empty, then exit',
+        )
+
+    def handle(self, *args, **options):
+        if options['drain']:
+            processed = JobWorker(kinds=options['kinds'], poll_interval=options['poll_interval']).run(drain=True)
+            self.stdout.write(self.style.SUCCESS(f"Ran {processed} jobs"))
+            return
+
+        workers = options['workers'] or getattr(settings, 'PROCESSING_SETTINGS', {}).get('JOB_WORKERS', JOB_WORKERS)
+        if workers < 1:
+            raise CommandError('--workers must be at least 1')
+
+        # Workers are forked, each must open its own database connection
+        connections.close_all()
+        context = multiprocessing.get_context('fork')
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        processes = [self._start(context, options) for _ in range(workers)]
+        self.stdout.write(f"Started {workers} workers: {', '.join(str(p.pid) for p in processes)}")
+
+        while not self._stopping:
+            time.sleep(1)
+            for index, process in enumerate(processes):
+                if not process.is_alive() and not self._stopping:
+                    self.stdout.write(self.style.WARNING(
+                        f"Worker {process.pid} exited with {process.exitcode}, restarting"
+                    ))
+                    time.sleep(RESTART_DELAY_SECONDS)
+                    processes[index] = self._start(context, options)
+
+        # Each worker exits after its current job
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+        self.stdout.write('Workers stopped')
+
+    def _start(self, context, options):
+        process = context.Process(
+            target=_run_worker,
+            args=(options['kinds'], options['poll_interval']),
+            daemon=False
+        )
+        process.start()
+        return process
+
+    def _stop(self, signum, frame):
+        self._stopping = True
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:02
+
+from django.db import migrations, models
+import django.utils.timezone
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research_assistant', '0008_literaturereview'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParsedDocumentCache',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('content_hash', models.CharField(max_length=64)),
+                ('parser_version', models.CharField(max_length=50)),
+                ('sections', models.JSONField(default=list)),
+                ('reference_data', models.JSONField(default=dict)),
+                ('total_pages', models.IntegerField(default=0)),
+                ('size_bytes', models.BigIntegerField(default=0)),
+                ('hit_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_accessed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'parsed_document_cache',
+                'indexes': [models.Index(fields=['last_accessed_at'], name='parsed_docu_last_ac_92afd8_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='parseddocumentcache',
+            constraint=models.UniqueConstraint(fields=('content_hash', 'parser_version'), name='unique_parse_cache_entry'),
+        ),
+    ]
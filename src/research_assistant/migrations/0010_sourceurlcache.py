@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:05
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research_assistant', '0009_parseddocumentcache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SourceURLCache',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('url', models.URLField(max_length=500, unique=True)),
+                ('etag', models.CharField(blank=True, max_length=255, null=True)),
+                ('last_modified', models.CharField(blank=True, max_length=100, null=True)),
+                ('content_hash', models.CharField(max_length=64)),
+                ('size_bytes', models.BigIntegerField(default=0)),
+                ('fetched_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'source_url_cache',
+                'indexes': [models.Index(fields=['fetched_at'], name='source_url__fetched_e81280_idx')],
+            },
+        ),
+    ]
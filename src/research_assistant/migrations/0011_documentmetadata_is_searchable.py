@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:09
+
+from django.db import migrations, models
+
+
+def mark_completed_searchable(apps, schema_editor):
+    DocumentMetadata = apps.get_model('research_assistant', 'DocumentMetadata')
+    DocumentMetadata.objects.filter(processing_status='completed').update(is_searchable=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research_assistant', '0010_sourceurlcache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentmetadata',
+            name='is_searchable',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(mark_completed_searchable, migrations.RunPython.noop),
+    ]
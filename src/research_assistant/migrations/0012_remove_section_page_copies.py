@@ -0,0 +1,39 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:28
+
+from django.db import migrations
+
+
+def restore_neighbour_text(apps, schema_editor):
+    """On rollback, fill the re-added columns from the adjacent pages' rows"""
+    DocumentSection = apps.get_model('research_assistant', 'DocumentSection')
+    document_ids = DocumentSection.objects.values_list('document_id', flat=True).distinct()
+    for document_id in document_ids.iterator():
+        sections = list(
+            DocumentSection.objects.filter(document_id=document_id).only('id', 'section_start_page_number', 'content')
+        )
+        by_page = {section.section_start_page_number: section.content for section in sections}
+        for section in sections:
+            section.prev_page_text = by_page.get(section.section_start_page_number - 1)
+            section.next_page_text = by_page.get(section.section_start_page_number + 1)
+        DocumentSection.objects.bulk_update(sections, ['prev_page_text', 'next_page_text'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research_assistant', '0011_documentmetadata_is_searchable'),
+    ]
+
+    # Neighbour context is computed from the adjacent rows, nothing needs carrying
+    # forward, the reverse step rebuilds the copies
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, restore_neighbour_text),
+        migrations.RemoveField(
+            model_name='documentsection',
+            name='next_page_text',
+        ),
+        migrations.RemoveField(
+            model_name='documentsection',
+            name='prev_page_text',
+        ),
+    ]
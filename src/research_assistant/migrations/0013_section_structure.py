@@ -0,0 +1,53 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:33
+
+from django.db import migrations, models
+
+
+def number_existing_sections(apps, schema_editor):
+    """Existing sections are one per page, in page order"""
+    DocumentSection = apps.get_model('research_assistant', 'DocumentSection')
+    document_ids = DocumentSection.objects.values_list('document_id', flat=True).distinct()
+    for document_id in document_ids.iterator():
+        sections = list(
+            DocumentSection.objects.filter(document_id=document_id)
+            .only('id', 'section_start_page_number')
+            .order_by('section_start_page_number')
+        )
+        for index, section in enumerate(sections):
+            section.section_index = index
+            section.section_end_page_number = section.section_start_page_number
+        DocumentSection.objects.bulk_update(sections, ['section_index', 'section_end_page_number'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research_assistant', '0012_remove_section_page_copies'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='documentsection',
+            options={'ordering': ['section_start_page_number', 'section_index']},
+        ),
+        migrations.AddField(
+            model_name='documentsection',
+            name='section_end_page_number',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='documentsection',
+            name='section_index',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='documentsection',
+            name='title',
+            field=models.CharField(max_length=500, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='documentsection',
+            index=models.Index(fields=['document', 'section_index'], name='document_se_documen_ced7ed_idx'),
+        ),
+        migrations.RunPython(number_existing_sections, migrations.RunPython.noop),
+    ]
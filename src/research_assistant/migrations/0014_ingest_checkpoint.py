@@ -0,0 +1,40 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:45
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research_assistant', '0013_section_structure'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IngestCheckpoint',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('file_id', models.CharField(max_length=255, null=True)),
+                ('stage', models.CharField(choices=[('download', 'Download'), ('parse', 'Parse'), ('references', 'References'), ('summary', 'Summary'), ('persist', 'Persist')], max_length=20, null=True)),
+                ('attempts', models.IntegerField(default=0)),
+                ('content_hash', models.CharField(max_length=64, null=True)),
+                ('pdf_path', models.CharField(max_length=500, null=True)),
+                ('sections', models.JSONField(null=True)),
+                ('reference_data', models.JSONField(null=True)),
+                ('total_pages', models.IntegerField(null=True)),
+                ('pages_processed', models.IntegerField(default=0)),
+                ('text_pages', models.IntegerField(default=0)),
+                ('summary', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, null=True)),
+                ('sections_persisted', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('document', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='ingest_checkpoint', to='research_assistant.documentmetadata')),
+            ],
+            options={
+                'db_table': 'ingest_checkpoints',
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research_assistant', '0014_ingest_checkpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentmetadata',
+            name='page_count',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='documentmetadata',
+            name='pages_parsed',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='documentmetadata',
+            name='processing_started_at',
+            field=models.DateTimeField(null=True),
+        ),
+    ]
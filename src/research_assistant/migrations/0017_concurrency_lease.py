@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research_assistant', '0016_job_queue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConcurrencyLease',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50)),
+                ('slot', models.IntegerField()),
+                ('holder', models.CharField(max_length=100)),
+                ('acquired_at', models.DateTimeField()),
+                ('expires_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'concurrency_leases',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='concurrencylease',
+            constraint=models.UniqueConstraint(fields=('name', 'slot'), name='unique_concurrency_lease_slot'),
+        ),
+    ]
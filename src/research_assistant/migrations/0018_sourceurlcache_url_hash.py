@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-17 21:10
+
+from django.db import migrations, models
+
+
+def clear_validators(apps, schema_editor):
+    # Rows were keyed on the truncated URL, the cache refills on the next downloads
+    apps.get_model('research_assistant', 'SourceURLCache').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('research_assistant', '0017_concurrency_lease'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_validators, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='sourceurlcache',
+            name='url',
+            field=models.TextField(),
+        ),
+        migrations.AddField(
+            model_name='sourceurlcache',
+            name='url_hash',
+            field=models.CharField(default='', max_length=64, unique=True),
+            preserve_default=False,
+        ),
+    ]
@@ -2,11 +2,14 @@
 # research_assistant/models.py
 # models.py
 from django.db import models
+from django.core.serializers.json import DjangoJSONEncoder
 import uuid
 import json
+import hashlib
 from django.utils import timezone
 from datetime import timedelta
 from django.contrib.auth.models import User 
+from .util.page_context import context_window
 
 class DocumentMetadata(models.Model):    
     """Store document metadata with processing status"""
@@ -37,6 +40,12 @@ class DocumentMetadata(models.Model):
     )
     processing_progress = models.FloatField(default=0.0)
     processing_stage = models.CharField(max_length=100, null=True)
+    # Pages extracted so far out of page_count, written while the parse stage runs
+    pages_parsed = models.IntegerField(default=0)
+    page_count = models.IntegerField(null=True)
+    processing_started_at = models.DateTimeField(null=True)
+    # True once the first batch of sections is stored, before processing completes
+    is_searchable = models.BooleanField(default=False)
     error_message = models.TextField(null=True, blank=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
@@ -77,13 +86,13 @@ class DocumentSection(models.Model):
     """Store document sections with metadata"""
     id = models.UUIDField(primary_key=True, default=uuid.uuid4)
     document = models.ForeignKey(DocumentMetadata, on_delete=models.CASCADE, related_name='sections')
-    section_type = models.CharField(max_length=100)  # 'text', 'table', 'image'
-    content = models.TextField()  # Main page content
+    section_type = models.CharField(max_length=100)  # 'text', 'references'
+    content = models.TextField()  # Main section content
     section_start_page_number = models.IntegerField()
-    
-    # Context text from adjacent pages
-    prev_page_text = models.TextField(null=True)
-    next_page_text = models.TextField(null=True)
+    section_end_page_number = models.IntegerField(null=True)
+    # Position of the section within its document, sections can share a start page
+    section_index = models.IntegerField(null=True)
+    title = models.CharField(max_length=500, null=True)  # Heading the section starts with
     
     # Content flags
     has_citations = models.BooleanField(default=False)
@@ -97,12 +106,32 @@ class DocumentSection(models.Model):
     
     class Meta:
         db_table = 'document_sections'
-        ordering = ['section_start_page_number']
+        ordering = ['section_start_page_number', 'section_index']
         indexes = [
             models.Index(fields=['document', 'section_start_page_number']),
+            models.Index(fields=['document', 'section_index']),
             models.Index(fields=['section_type'])
         ]
 
+    def get_context_text(self, window_size: int = 0) -> str:
+        """Content with window_size words from each adjacent section, read from the neighbouring rows"""
+        if window_size <= 0 or self.section_index is None:
+            return self.content
+
+        index = self.section_index
+        neighbours = dict(
+            DocumentSection.objects.filter(
+                document_id=self.document_id,
+                section_index__in=(index - 1, index + 1)
+            ).values_list('section_index', 'content')
+        )
+        return context_window(
+            self.content,
+            prev_text=neighbours.get(index - 1),
+            next_text=neighbours.get(index + 1),
+            window_size=window_size
+        )
+
     def set_elements(self, elements_list):
         """Transform and set tables and images data"""
         print(f"[DocumentSection] Processing {len(elements_list)} elements")
@@ -116,7 +145,10 @@ class DocumentSection(models.Model):
                     if element.get('type') == 'table':
                         tables.append(element.get('content'))
                     elif element.get('type') == 'image':
-                        images.append(element.get('metadata'))
+                        # Processor elements are flat, get_elements() output nests metadata
+                        images.append(element.get('metadata') or {
+                            key: value for key, value in element.items() if key != 'type'
+                        })
                 
             except Exception as e:
                 print(f"[DocumentSection] Error processing element: {str(e)}")
@@ -140,6 +172,162 @@ class DocumentSection(models.Model):
         return elements
 
 
+class ParsedDocumentCache(models.Model):
+    """Content-addressed cache of DocumentProcessor output, shared across users"""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    content_hash = models.CharField(max_length=64)  # SHA-256 of the PDF bytes
+    parser_version = models.CharField(max_length=50)
+    
+    # Cached processing output
+    sections = models.JSONField(default=list)
+    reference_data = models.JSONField(default=dict)
+    total_pages = models.IntegerField(default=0)
+    
+    # LRU bookkeeping
+    size_bytes = models.BigIntegerField(default=0)
+    hit_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_accessed_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        db_table = 'parsed_document_cache'
+        constraints = [
+            models.UniqueConstraint(fields=['content_hash', 'parser_version'], name='unique_parse_cache_entry')
+        ]
+        indexes = [
+            models.Index(fields=['last_accessed_at'])
+        ]
+
+    def __str__(self):
+        return f"Parse cache {self.content_hash[:12]} ({self.parser_version})"
+
+
+class SourceURLCache(models.Model):
+    """HTTP validators of previously downloaded document URLs for conditional re-fetch"""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    # Keyed on the hash, signed URLs with long query strings do not fit an index
+    url_hash = models.CharField(max_length=64, unique=True)
+    url = models.TextField()
+    etag = models.CharField(max_length=255, null=True, blank=True)
+    last_modified = models.CharField(max_length=100, null=True, blank=True)
+    content_hash = models.CharField(max_length=64)  # SHA-256 of the last downloaded body
+    size_bytes = models.BigIntegerField(default=0)
+    fetched_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'source_url_cache'
+        indexes = [
+            models.Index(fields=['fetched_at'])
+        ]
+
+    @staticmethod
+    def hash_url(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+class IngestCheckpoint(models.Model):
+    """Outputs of the completed ingest stages of a document, so an interrupted ingest resumes"""
+    STAGES = ['download', 'parse', 'references', 'summary', 'persist']
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    document = models.OneToOneField(DocumentMetadata, on_delete=models.CASCADE, related_name='ingest_checkpoint')
+    file_id = models.CharField(max_length=255, null=True)  # Client file id, prefix of the section ids
+    # Last completed stage, None before the download finished
+    stage = models.CharField(max_length=20, null=True, choices=[(stage, stage.title()) for stage in STAGES])
+    attempts = models.IntegerField(default=0)
+
+    # download: the PDF kept on disk, path None when the parse cache already has it
+    content_hash = models.CharField(max_length=64, null=True)
+    pdf_path = models.CharField(max_length=500, null=True)
+    # parse: sections of documents parsed in one go, batched documents store
+    # each batch as it is parsed and only record how far they got
+    sections = models.JSONField(null=True)
+    reference_data = models.JSONField(null=True)
+    total_pages = models.IntegerField(null=True)
+    pages_processed = models.IntegerField(default=0)
+    text_pages = models.IntegerField(default=0)
+    # summary: the metadata fields written to the document
+    summary = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+    # persist: sections stored so far, in section_index order
+    sections_persisted = models.IntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'ingest_checkpoints'
+
+    def __str__(self):
+        return f"Ingest checkpoint {self.document_id} ({self.stage})"
+
+    def completed(self, stage: str) -> bool:
+        """Whether stage and every stage before it are done"""
+        return self.stage is not None and self.STAGES.index(self.stage) >= self.STAGES.index(stage)
+
+
+class Job(models.Model):
+    """Background work queued by the web processes and run by run_workers"""
+    KINDS = ['ingest', 'search', 'literature_review']
+    STATUSES = ['queued', 'running', 'completed', 'failed']
+    # Jobs a worker will still run, or is running
+    ACTIVE_STATUSES = ('queued', 'running')
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    kind = models.CharField(max_length=50, choices=[(kind, kind.replace('_', ' ').title()) for kind in KINDS])
+    payload = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    # The document the job works on, so work already queued for it is not queued twice
+    document = models.ForeignKey(
+        DocumentMetadata, on_delete=models.CASCADE, related_name='jobs', null=True, blank=True
+    )
+    status = models.CharField(
+        max_length=20, choices=[(value, value.title()) for value in STATUSES], default='queued'
+    )
+    # Runs started, a job that failed or whose worker died is queued again until max_attempts
+    attempts = models.IntegerField(default=0)
+    max_attempts = models.IntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, null=True, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    # Refreshed by the worker while the job runs
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    error_message = models.TextField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'jobs'
+        indexes = [
+            models.Index(fields=['status', 'run_after']),
+            models.Index(fields=['status', 'heartbeat_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} job {self.id} ({self.status})"
+
+
+class ConcurrencyLease(models.Model):
+    """
+    One held slot of a named semaphore shared by every process using the
+    database, see services/concurrency.py
+    """
+    name = models.CharField(max_length=50)
+    slot = models.IntegerField()
+    holder = models.CharField(max_length=100)
+    acquired_at = models.DateTimeField()
+    # A holder that stops renewing loses the slot at this time
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'concurrency_leases'
+        constraints = [
+            models.UniqueConstraint(fields=['name', 'slot'], name='unique_concurrency_lease_slot'),
+        ]
+
+    def __str__(self):
+        return f"{self.name}[{self.slot}] held by {self.holder}"
+
+
 class SearchQuery(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4)
     user = models.ForeignKey(
@@ -0,0 +1,186 @@
+# src/research_assistant/services/citation_scanner.py
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .reference_index import ReferenceIndex
+
+# In-text citation patterns, each with exactly one capturing group for the cited value
+CITATION_PATTERNS = {
+    'numbered': r'\[(\d+(?:,\s*\d+)*)\]',          # [1] or [1,2,3]
+    'parenthetical': r'\(([A-Za-z]+\s+et\s+al\.,\s*\d{4}[a-z]?)\)',  # (Kim et al., 2016a)
+    # The lookbehind only starts matches at the first letter of a word, which is
+    # where a match would start anyway, and avoids retrying inside every word
+    'narrative': r'(?<![A-Za-z])([A-Za-z]+\s+et\s+al\.\s*\(\d{4}[a-z]?\))',  # Author et al. (2023)
+    'with_page': r'\(([A-Za-z]+,\s*\d{4}[a-z]?,\s*p\.\s*\d+)\)',  # (Smith, 2020, p.45)
+    'author_year': r'\(([A-Za-z]+,\s*[A-Za-z]\.,\s*\d{4}(?:-\d{4})?\.?)\)'  # (Tatham, S., 2001-2015.)
+}
+
+_WHITESPACE = re.compile(r'\s+')
+
+# Patterns of the form \((...)\) share their parentheses in the combined regex
+_PAREN_OPEN = r'\(('
+_PAREN_CLOSE = r')\)'
+
+
+@dataclass(frozen=True)
+class CitationMatch:
+    """A citation found in text, span offsets refer to the whitespace-normalised text"""
+    type: str
+    text: str
+    value: str
+    start: int
+    end: int
+
+    @property
+    def span(self) -> Tuple[int, int]:
+        return self.start, self.end
+
+    @property
+    def ref_numbers(self) -> List[str]:
+        """Reference numbers of a numbered citation, e.g. ['1', '3'] for [1, 3]"""
+        if self.type != 'numbered':
+            return []
+        return [num.strip() for num in self.value.split(',')]
+
+
+class CitationScanner:
+    """
+    Find in-text citations of several styles in one pass over the text.
+
+    All patterns are compiled once into a single alternation of named groups,
+    so each text is scanned once instead of once per citation style. Styles
+    wrapped in parentheses are factored behind one literal "(" so the engine
+    tries them together. The patterns do not overlap, so the matches are the
+    same as running each pattern separately, returned in text order.
+    """
+
+    def __init__(self, types: Iterable[str] = None):
+        self.types = tuple(types) if types else tuple(CITATION_PATTERNS)
+        unknown = set(self.types) - set(CITATION_PATTERNS)
+        if unknown:
+            raise ValueError(f"Unknown citation types {sorted(unknown)}, expected {list(CITATION_PATTERNS)}")
+
+        parenthesised = [
+            citation_type for citation_type in self.types
+            if CITATION_PATTERNS[citation_type].startswith(_PAREN_OPEN)
+            and CITATION_PATTERNS[citation_type].endswith(_PAREN_CLOSE)
+        ]
+        branches = []
+        if parenthesised:
+            # A factored style's named group is its value group, the inner pattern
+            # without its own capturing parentheses
+            branches.append(r'\((?:' + '|'.join(
+                f"(?P<{citation_type}>{CITATION_PATTERNS[citation_type][len(_PAREN_OPEN):-len(_PAREN_CLOSE)]})"
+                for citation_type in parenthesised
+            ) + r')\)')
+        # Branches opening with a literal fail fastest, the ones starting on any
+        # letter are tried last
+        others = [citation_type for citation_type in self.types if citation_type not in parenthesised]
+        others.sort(key=lambda citation_type: not CITATION_PATTERNS[citation_type].startswith('\\'))
+        branches.extend(f"(?P<{citation_type}>{CITATION_PATTERNS[citation_type]})" for citation_type in others)
+        self.regex = re.compile('|'.join(branches))
+
+        self._value_groups = {
+            citation_type: (
+                citation_type if citation_type in parenthesised
+                # The pattern's own capturing group directly follows its named group
+                else self.regex.groupindex[citation_type] + 1
+            )
+            for citation_type in self.types
+        }
+        # Every pattern needs one of these, texts without them are skipped outright
+        self._markers = ('[', '(')
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Collapse whitespace the way citation positions have always been computed"""
+        return _WHITESPACE.sub(' ', text).strip()
+
+    def scan(self, text: str, normalize: bool = True, limit: int = None) -> List[CitationMatch]:
+        """
+        Return the citations in text.
+
+        Args:
+            text (str): Text to scan
+            normalize (bool): Collapse whitespace first, spans then refer to the normalised text
+            limit (int): Stop after this many matches
+
+        Returns:
+            List[CitationMatch]: Matches in text order
+        """
+        if not text or not any(marker in text for marker in self._markers):
+            return []
+        if normalize:
+            text = self.normalize(text)
+
+        matches = []
+        for match in self.regex.finditer(text):
+            citation_type = match.lastgroup
+            matches.append(CitationMatch(
+                type=citation_type,
+                text=match.group(0),
+                value=match.group(self._value_groups[citation_type]),
+                start=match.start(),
+                end=match.end()
+            ))
+            if limit is not None and len(matches) >= limit:
+                break
+        return matches
+
+
+@lru_cache(maxsize=None)
+def get_scanner(types: Tuple[str, ...] = None) -> CitationScanner:
+    """Shared scanner per set of citation types, compiled on first use"""
+    return CitationScanner(types)
+
+
+def citation_to_dict(match: CitationMatch, reference_index: ReferenceIndex) -> Dict[str, Any]:
+    """
+    Build the citation dict stored on sections, linked to the reference entries it cites.
+
+    Numbered citations carry 'ref_numbers', the other styles carry 'matched_text'.
+    """
+    if match.type == 'numbered':
+        return {
+            'text': match.text,
+            'type': match.type,
+            'position': match.span,
+            'ref_numbers': match.ref_numbers,
+            'references': reference_index.resolve(match.type, match.value)
+        }
+    return {
+        'text': match.text,
+        'type': match.type,
+        'position': match.span,
+        'matched_text': match.value,
+        'references': reference_index.resolve(match.type, match.value)
+    }
+
+
+def extract_citations(
+    text: str,
+    reference_data: Optional[Dict[str, Any]] = None,
+    types: Tuple[str, ...] = None,
+    limit: int = None,
+    reference_index: ReferenceIndex = None
+) -> List[Dict[str, Any]]:
+    """
+    Scan text once and return citation dicts linked to reference_data.
+
+    Args:
+        text (str): Text to scan
+        reference_data (Dict): Reference data with an 'entries' dict, optional
+        types (Tuple[str, ...]): Citation types to look for, all of CITATION_PATTERNS by default
+        limit (int): Stop after this many citations
+        reference_index (ReferenceIndex): Index over reference_data, pass one built once
+            per document when scanning many texts so author-year lookups are not rebuilt
+    """
+    if reference_index is None:
+        reference_index = ReferenceIndex(reference_data)
+    return [
+        citation_to_dict(match, reference_index)
+        for match in get_scanner(types).scan(text, limit=limit)
+    ]
@@ -0,0 +1,177 @@
+# src/research_assistant/services/concurrency.py
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from ..models import ConcurrencyLease
+
+logger = logging.getLogger(__name__)
+
+# Concurrent holders per workload class, overridden by PROCESSING_SETTINGS CONCURRENCY_LIMITS
+DEFAULT_LIMITS = {
+    'ingest': 3,
+    'search': 3,
+    'literature_review': 2,
+}
+# A lease not renewed for this long is free again, its holder is taken to be dead
+LEASE_TTL_SECONDS = 120
+
+
+def concurrency_limit(name: str) -> int:
+    limits = getattr(settings, 'PROCESSING_SETTINGS', {}).get('CONCURRENCY_LIMITS', {})
+    return limits.get(name, DEFAULT_LIMITS.get(name, 1))
+
+
+def _lease_ttl() -> int:
+    return getattr(settings, 'PROCESSING_SETTINGS', {}).get('LEASE_TTL_SECONDS', LEASE_TTL_SECONDS)
+
+
+def available(names: Iterable[str]) -> List[str]:
+    """The names among names with a free slot, in one query"""
+    names = list(names)
+    in_use = dict(
+        ConcurrencyLease.objects.filter(name__in=names, expires_at__gte=timezone.now())
+        .values_list('name')
+        .annotate(count=Count('id'))
+    )
+    return [name for name in names if in_use.get(name, 0) < concurrency_limit(name)]
+
+
+def utilisation() -> Dict[str, Dict[str, Any]]:
+    """Limit, slots in use and current holders of every workload class"""
+    leases = ConcurrencyLease.objects.filter(expires_at__gte=timezone.now()).order_by('name', 'slot')
+    names = set(DEFAULT_LIMITS) | set(getattr(settings, 'PROCESSING_SETTINGS', {}).get('CONCURRENCY_LIMITS', {}))
+    report = {name: {'limit': concurrency_limit(name), 'in_use': 0, 'holders': []} for name in sorted(names)}
+    for lease in leases:
+        entry = report.setdefault(lease.name, {'limit': concurrency_limit(lease.name), 'in_use': 0, 'holders': []})
+        entry['in_use'] += 1
+        entry['holders'].append({
+            'holder': lease.holder,
+            'slot': lease.slot,
+            'acquired_at': lease.acquired_at,
+            'expires_at': lease.expires_at
+        })
+    return report
+
+
+class LeaseSemaphore:
+    """
+    Named counting semaphore held across threads, processes and hosts.
+
+    Each of the limit slots is a row of the lease table, unique on (name,
+    slot), so the database decides which of two competing holders gets a
+    slot. Holders renew their lease while they work; a process that dies
+    without releasing loses its slots once the lease expires, no cleanup
+    needed. Works the same on PostgreSQL and SQLite.
+
+        semaphore = LeaseSemaphore('ingest')
+        if semaphore.try_acquire():
+            with semaphore.hold():
+                ...
+    """
+
+    def __init__(self, name: str, limit: int = None, holder: str = None, ttl: int = None):
+        self.name = name
+        self.limit = limit if limit is not None else concurrency_limit(name)
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.ttl = ttl or _lease_ttl()
+        self.slot = None
+
+    @property
+    def held(self) -> bool:
+        return self.slot is not None
+
+    def try_acquire(self) -> bool:
+        """Take a free slot without waiting, False when all limit slots are held"""
+        if self.held:
+            return True
+        now = timezone.now()
+        ConcurrencyLease.objects.filter(name=self.name, expires_at__lt=now).delete()
+        taken = set(ConcurrencyLease.objects.filter(name=self.name).values_list('slot', flat=True))
+
+        for slot in range(self.limit):
+            if slot in taken:
+                continue
+            try:
+                with transaction.atomic():
+                    ConcurrencyLease.objects.create(
+                        name=self.name,
+                        slot=slot,
+                        holder=self.holder,
+                        acquired_at=now,
+                        expires_at=now + timedelta(seconds=self.ttl)
+                    )
+            except IntegrityError:
+                # Taken by another holder since the read
+                continue
+            self.slot = slot
+            return True
+        return False
+
+    def acquire(self, timeout: float = None, poll_interval: float = 1.0) -> bool:
+        """Wait for a slot, up to timeout seconds when given"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.try_acquire():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+        return True
+
+    def renew(self) -> bool:
+        """Extend the lease, False when it expired and the slot was lost"""
+        if not self.held:
+            return False
+        renewed = ConcurrencyLease.objects.filter(name=self.name, slot=self.slot, holder=self.holder).update(
+            expires_at=timezone.now() + timedelta(seconds=self.ttl)
+        )
+        if not renewed:
+            logger.warning(f"Lease {self.name}[{self.slot}] of {self.holder} expired before renewal")
+            self.slot = None
+        return bool(renewed)
+
+    def release(self) -> None:
+        if not self.held:
+            return
+        ConcurrencyLease.objects.filter(name=self.name, slot=self.slot, holder=self.holder).delete()
+        self.slot = None
+
+    @contextmanager
+    def hold(self):
+        """Keep an acquired lease renewed for the duration of the block, release it after"""
+        done = threading.Event()
+        renewer = threading.Thread(target=self._renew_until, args=(done,), daemon=True)
+        renewer.start()
+        try:
+            yield self
+        finally:
+            done.set()
+            renewer.join()
+            self.release()
+
+    def _renew_until(self, done: threading.Event) -> None:
+        try:
+            while not done.wait(self.ttl / 3) and self.held:
+                self.renew()
+        finally:
+            # The thread's own connection
+            connection.close()
+
+    def __enter__(self):
+        self.acquire()
+        self._hold = self.hold()
+        return self._hold.__enter__()
+
+    def __exit__(self, *exc_info):
+        return self._hold.__exit__(*exc_info)
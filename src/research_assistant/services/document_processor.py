@@ -2,8 +2,20 @@
 
 
 from .pdf_parser import PDFParser
-from typing import Dict, List, Tuple, Any, Optional
+from .parse_cache import ParseCache
+from .pdf_source import DEFAULT_SPOOL_THRESHOLD
+from .downloader import PDFDownloader
+from .image_store import ImageStore
+from .citation_scanner import CITATION_PATTERNS, extract_citations
+from .reference_index import ReferenceIndex
+from .semantic_sectioner import SECTION_MAX_TOKENS, SECTION_MIN_TOKENS, SemanticSectioner, page_at
+from .text_normalizer import NormalizationStats, TextNormalizer
+from .parse_pool import get_parse_pool
+from ..util.page_context import context_window
+from .reference_section import extract_reference_section, is_reference_heading, might_contain_heading
+from typing import Dict, List, Tuple, Any, Optional, Generator, Iterable, Mapping
 import time
+import bisect
 from datetime import datetime
 import fitz  # PyMuPDF
 from pathlib import Path
@@ -15,45 +27,47 @@ import re
 import json
 import logging
 from dataclasses import dataclass
+from django.conf import settings
 
 
 
 from pdf2docx import Converter
 import pdfplumber
 
+logger = logging.getLogger(__name__)
 
-# Reference section markers - keeping existing ones and adding new
-REFERENCE_SECTION_TITLES = [
-    r'^\s*references?\s*$',
-    r'^\s*bibliography\s*$', 
-    r'^\s*works\s+cited\s*$',
-    r'^\s*reference\s+list\s*$',
-    r'^\s*(?:\d+\.|[ivx]+\.|\[\d+\])\s*references?\s*$',
-    r'^[-_*=]{2,}\s*references?\s*[-_*=]{2,}$',
-    r'^\s*references?\s*[-_*=]{2,}$',
-    r'^[-_*=]{2,}\s*references?\s*$',
-    r'^\s*acknowledgements?\s*$',
-]
 
+# Version of the processing output stored in the parse cache.
+# Bump whenever a change alters the sections or reference data produced.
+PARSER_VERSION = '7'
 
-# Define reference patterns
-REFERENCE_PATTERNS = {
-    'numbered_bracket': r'^\s*\[(\d+)\]',           # [1]
-    'numbered_dot': r'^\s*(\d+)\.',                 # 1.
-    'author_year': r'^\s*\[([A-Za-z]+(?:\s*,\s*[A-Za-z]+)*\s*\(\d{4}[a-z]?\))\]',  # [Author(2023a)]
-    'parenthetical': r'^\s*\(([A-Za-z]+\s*,\s*\d{4})\)',  # (john,2024)
-    'narrative': r'^([A-Za-z]+\s+et\s+al\.\s*\(\d{4}\))',  # AuthorName et al.(2016)
-    'standard': r'^([A-Za-z]+\s*,\s*[A-Za-z]+\s*\.\s*\d{4})'  # Ammann P., Offutt.J. 2008
-}
+# Documents with at least this many pages are parsed and stored in batches
+PROGRESSIVE_MIN_PAGES = 150
+# The first batch is small so the document becomes searchable quickly
+FIRST_BATCH_PAGES = 20
+BATCH_PAGES = 100
+# How far back from the last page to look for the reference section heading
+REFERENCE_SCAN_MAX_PAGES = 60
 
-# In-text citation patterns
-CITATION_PATTERNS = {
-    'numbered': r'\[(\d+(?:,\s*\d+)*)\]',          # [1] or [1,2,3]
-    'parenthetical': r'\(([A-Za-z]+\s+et\s+al\.,\s*\d{4})\)',  # (Kim et al., 2016)
-    'narrative': r'([A-Za-z]+\s+et\s+al\.\s*\(\d{4}\))',  # Author et al. (2023)
-    'with_page': r'\(([A-Za-z]+,\s*\d{4},\s*p\.\s*\d+)\)',  # (Smith, 2020, p.45)
-    'author_year': r'\(([A-Za-z]+,\s*[A-Za-z]\.,\s*\d{4}(?:-\d{4})?\.?)\)'  # (Tatham, S., 2001-2015.)
-}
+# 'semantic' splits text at detected headings into token-budgeted sections,
+# 'page' makes one section per page
+SECTIONING_MODES = ('semantic', 'page')
+
+# Configuration a parse in the process pool takes from the calling processor
+POOL_CONFIG = (
+    'parse_engine', 'parse_workers', 'parallel_min_pages', 'parse_in_memory', 'table_engine',
+    'table_precheck', 'min_image_pixels', 'sectioning', 'section_max_tokens', 'section_min_tokens',
+    'normalize_text'
+)
+# State carried across the batches of a document, and the outputs of a parse
+POOL_STATE = (
+    'reference_data', 'sections_emitted', 'text_normalizer', 'normalization_stats',
+    'text_page_count', 'total_pages', 'stage_timings', 'parse_metadata'
+)
+
+
+# Reference section titles and entry patterns now live in reference_section
+# In-text citation patterns now live in citation_scanner.CITATION_PATTERNS
 
 
 
@@ -69,45 +83,50 @@ class ImageMetadata:
     image_index: int
     width: int = None
     height: int = None
+    content_hash: str = None
 
 class Section:
-    """Represents a processed document section (page)"""
+    """Represents a processed document section, one page or a run of text under a heading"""
+    __slots__ = (
+        'text', 'type', 'section_start_page_number', 'section_end_page_number', 'title', 'page_starts',
+        'document_id', 'section_id', 'tables', 'images', 'page_texts'
+    )
+
     def __init__(
         self,
         text: str,
         section_type: str,
         section_start_page_number: int,
         document_id: str,
-        prev_page_text: Optional[str] = None,
-        next_page_text: Optional[str] = None,
         tables: Optional[List[List[List[str]]]] = None,
-        images: Optional[List[ImageMetadata]] = None
+        images: Optional[List[ImageMetadata]] = None,
+        page_texts: Optional[Mapping[int, str]] = None,
+        section_end_page_number: Optional[int] = None,
+        title: Optional[str] = None,
+        page_starts: Optional[List[Tuple[int, int]]] = None
     ):
         self.text = text
         self.type = section_type
         self.section_start_page_number = section_start_page_number
+        self.section_end_page_number = section_end_page_number or section_start_page_number
+        self.title = title
+        # (offset in the normalised text, page number) for each page the section spans
+        self.page_starts = page_starts or [(0, section_start_page_number)]
         self.document_id = document_id
         self.section_id = f"{document_id}_p{section_start_page_number}_{uuid.uuid4().hex[:8]}"
-        self.prev_page_text = prev_page_text
-        self.next_page_text = next_page_text
         self.tables = tables or []
         self.images = images or []
+        # Shared page number -> text mapping of the parse (a PageBuffer), neighbours are looked up not copied
+        self.page_texts = page_texts or {}
 
     def get_context_text(self, window_size: int = 0) -> str:
         """Gets context from adjacent pages with specified word window"""
-        context = []
-        if self.prev_page_text:
-            prev_words = self.prev_page_text.split()[-window_size:]
-            context.append(' '.join(prev_words))
-            
-        context.append(self.text)
-        
-        if self.next_page_text:
-            next_words = self.next_page_text.split()[:window_size]
-            context.append(' '.join(next_words))
-            
-        # return '\n'.join(context)
-        return self.text
+        return context_window(
+            self.text,
+            prev_text=self.page_texts.get(self.section_start_page_number - 1),
+            next_text=self.page_texts.get(self.section_end_page_number + 1),
+            window_size=window_size
+        )
 
 class DocumentProcessor:
     """Enhanced document processor with custom PDF parsing"""
@@ -124,37 +143,56 @@ class DocumentProcessor:
         self.sections = []
         self.total_pages = 0
         self.reference_data = {}
+        # Built once per reference data so citations resolve without rescanning entries
+        self._reference_index = None
+        self._indexed_reference_data = None
+
+        processing_settings = getattr(settings, 'PROCESSING_SETTINGS', {})
+        self.parse_engine = processing_settings.get('PDF_PARSE_ENGINE', PDFParser.DEFAULT_ENGINE)
+        self.parse_workers = processing_settings.get('PDF_PARSE_WORKERS', 1)
+        self.parallel_min_pages = processing_settings.get('PDF_PARSE_PARALLEL_MIN_PAGES', PDFParser.PARALLEL_MIN_PAGES)
+        self.parse_in_memory = processing_settings.get('PDF_PARSE_IN_MEMORY', True)
+        self.table_engine = processing_settings.get('PDF_TABLE_ENGINE')
+        self.table_precheck = processing_settings.get('PDF_TABLE_PRECHECK', True)
+        self.min_image_pixels = processing_settings.get('PDF_IMAGE_MIN_PIXELS', 0)
+        self.image_store = ImageStore() if processing_settings.get('IMAGE_STORE_ENABLED', True) else None
+        self.spool_threshold = processing_settings.get('PDF_SPOOL_THRESHOLD_BYTES', DEFAULT_SPOOL_THRESHOLD)
+        self.sectioning = processing_settings.get('SECTIONING', 'semantic')
+        self.section_max_tokens = processing_settings.get('SECTION_MAX_TOKENS', SECTION_MAX_TOKENS)
+        self.section_min_tokens = processing_settings.get('SECTION_MIN_TOKENS', SECTION_MIN_TOKENS)
+        # Strip running headers, footers and page numbers and rejoin hyphenated words
+        self.normalize_text = processing_settings.get('TEXT_NORMALIZATION', True)
+        self.text_normalizer = TextNormalizer()
+        # Tokens before and after normalization, summed over a document's batches
+        self.normalization_stats = NormalizationStats()
+        # Called with (page_number, page_count) as the parser extracts each page
+        self.progress_callback = None
+        # Parse PDFs on disk in the long-lived parse process pool, see process_file
+        self.use_parse_pool = processing_settings.get('PARSE_PROCESS_POOL', True)
+
+        self.parse_cache = ParseCache()
+        self.content_hash = None
+        self.downloader = PDFDownloader(spool_threshold=self.spool_threshold)
+
+        # Progressive ingest of long documents, see iter_document_batches
+        self.progressive_min_pages = processing_settings.get('PROGRESSIVE_MIN_PAGES', PROGRESSIVE_MIN_PAGES)
+        self.first_batch_pages = processing_settings.get('PROGRESSIVE_FIRST_BATCH_PAGES', FIRST_BATCH_PAGES)
+        self.batch_pages = processing_settings.get('PROGRESSIVE_BATCH_PAGES', BATCH_PAGES)
+        self.reference_scan_max_pages = processing_settings.get('REFERENCE_SCAN_MAX_PAGES', REFERENCE_SCAN_MAX_PAGES)
+        self.document_page_count = 0
+        self.pages_processed = 0
+        # Running section number across batches, and pages with text in the last parse
+        self.sections_emitted = 0
+        self.text_page_count = 0
+
+        # Wall time per stage of the last process_document call, and the parser metadata
+        self.stage_timings: Dict[str, float] = {}
+        self.parse_metadata: Dict[str, Any] = {}
             
 
 
 
 
-    def _download_file(self, url: str) -> str:
-        """Download file from URL with better error handling"""
-
-        
-        try:
-            # Use a timeout to prevent hanging
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            # Use system temp directory instead of relative path
-            # This is crucial for container environments
-            import tempfile
-            fd, file_path = tempfile.mkstemp(suffix=".pdf")
-            
-            with os.fdopen(fd, 'wb') as f:
-                f.write(response.content)
-            
-
-            return file_path
-        except requests.exceptions.RequestException as e:
-
-            raise
-        except IOError as e:
-
-            raise
-
     def _cleanup_temp_file(self, file_path):
         """Delete temporary PDF file."""
         try:
@@ -170,6 +208,31 @@ class DocumentProcessor:
 
         return self.total_pages
 
+    @property
+    def parser_version(self) -> str:
+        """Parse cache version, output differs per engine so it is part of the key"""
+        version = f"{PARSER_VERSION}-{self.parse_engine}"
+        if self.table_engine:
+            version += f"-{self.table_engine}"
+        if self.sectioning == 'semantic':
+            version += f"-s{self.section_max_tokens}.{self.section_min_tokens}"
+        else:
+            version += f"-{self.sectioning}"
+        if not self.normalize_text:
+            version += "-raw"
+        return version
+
+    def load_cached(self, content_hash: str) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+        """Return cached sections rebound to this document, or None on a miss"""
+        cached = self.parse_cache.get(content_hash, self.parser_version)
+        if cached is None:
+            return None
+        self.content_hash = content_hash
+        self.reference_data = cached['reference_data']
+        self.total_pages = cached['total_pages']
+        sections = ParseCache.rebind_sections(cached['sections'], self.document_id)
+        return sections, cached['reference_data']
+
     def process_document_from_url(self, url: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """Process document from URL
         
@@ -185,8 +248,11 @@ class DocumentProcessor:
         {
             'document_id': str,
             'section_id': str,
-            'section_type': str,
+            'section_type': str,  # 'text' or 'references'
             'section_start_page_number': int,
+            'section_end_page_number': int,
+            'section_index': int,
+            'title': str,  # Heading the section starts with, None if any
             'content': {
                 'text': str,
                 'type': str,
@@ -198,66 +264,333 @@ class DocumentProcessor:
         """
 
 
-        file_path = self._download_file(url)
-        sections, reference_data = self.process_document(file_path)
-        # self._cleanup_temp_file(file_path)
-
+        # Only revalidate the URL when its last known content is still in the parse cache
+        result = self.downloader.download(
+            url,
+            reuse_check=lambda content_hash: self.parse_cache.contains(content_hash, self.parser_version)
+        )
+        if result.not_modified:
+            cached = self.load_cached(result.content_hash)
+            if cached is not None:
+                return cached
+            # Evicted between the check and the lookup, fetch the bytes again
+            result = self.downloader.download(url)
+
+        # The source owns any spool file and removes it on exit, even on errors
+        with result.source as source:
+            self.content_hash = source.content_hash
+
+            # Reuse the result of an identical file processed before, by any user
+            cached = self.load_cached(self.content_hash)
+            if cached is not None:
+                return cached
+
+            sections, reference_data = self.process_document(pdf_path=source.path, pdf_bytes=source.data)
+
+        self.parse_cache.put(
+            self.content_hash,
+            self.parser_version,
+            sections,
+            reference_data,
+            self.total_pages
+        )
 
+        return sections, reference_data
 
+    def iter_document_from_url(self, url: str) -> Generator[List[Dict[str, Any]], None, None]:
+        """Progressive counterpart of process_document_from_url
+        
+        Yields lists of section data as each batch of pages is parsed, so the
+        caller can store and expose the first pages of a long document while the
+        rest is still being processed. A cache hit is yielded as a single batch.
+        Reference data is available in self.reference_data from the first batch.
+        """
+        result = self.downloader.download(
+            url,
+            reuse_check=lambda content_hash: self.parse_cache.contains(content_hash, self.parser_version)
+        )
+        if result.not_modified:
+            cached = self.load_cached(result.content_hash)
+            if cached is not None:
+                self.document_page_count = self.pages_processed = self.total_pages
+                yield cached[0]
+                return
+            result = self.downloader.download(url)
+
+        all_sections = []
+        with result.source as source:
+            self.content_hash = source.content_hash
+
+            cached = self.load_cached(self.content_hash)
+            if cached is not None:
+                self.document_page_count = self.pages_processed = self.total_pages
+                yield cached[0]
+                return
+
+            for sections in self.iter_document_batches(pdf_path=source.path, pdf_bytes=source.data):
+                all_sections.extend(sections)
+                yield sections
+
+        self.parse_cache.put(
+            self.content_hash,
+            self.parser_version,
+            all_sections,
+            self.reference_data,
+            self.total_pages
+        )
+
+    def iter_document_batches(
+        self,
+        file_path: str = None,
+        pdf_bytes: bytes = None,
+        pdf_path: str = None,
+        start_page: int = 1
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """Parse a document in page batches, yielding the sections of each batch
+        
+        Documents shorter than progressive_min_pages are processed in one go with
+        process_document. Longer ones get a small first batch followed by
+        batch_pages sized batches, with the reference section located up front
+        from the table of contents or the last pages so citations can be linked
+        in every batch.
+
+        start_page resumes an interrupted ingest at a batch boundary: the caller
+        restores reference_data and sections_emitted from its checkpoint, and
+        total_pages only counts the pages parsed by this call.
+        """
+        page_count = self.count_pages(file_path or pdf_path, pdf_bytes)
+        self.document_page_count = page_count
+        self.pages_processed = 0
+
+        if not self.is_progressive(page_count):
+            sections, _ = self._process_pages(file_path, pdf_bytes, pdf_path)
+            self.pages_processed = page_count
+            yield sections
+            return
+
+        if start_page <= 1:
+            self.reference_data = self.locate_reference_data(file_path or pdf_path, pdf_bytes)
+            self.sections_emitted = 0
+        elif not self.reference_data:
+            self.reference_data = self.locate_reference_data(file_path or pdf_path, pdf_bytes)
+
+        self.text_normalizer = TextNormalizer()
+        self.normalization_stats = NormalizationStats()
+        text_pages = 0
+        first = max(start_page, 1)
+        # Later batches start after the small first one, resumed runs keep those boundaries
+        batch_size = self.first_batch_pages if first == 1 else self.batch_pages
+        self.pages_processed = first - 1
+        while first <= page_count:
+            last = min(first + batch_size - 1, page_count)
+            logger.info(f"Processing pages {first}-{last} of {page_count}")
+            sections, _ = self._process_pages(file_path, pdf_bytes, pdf_path, page_range=(first, last))
+            text_pages += self.text_page_count
+            self.pages_processed = last
+            yield sections
+
+            first = last + 1
+            batch_size = self.batch_pages
+
+        # Same meaning as a single pass: the number of pages with text
+        self.total_pages = text_pages
+
+    def _process_pages(
+        self,
+        file_path: str,
+        pdf_bytes: bytes,
+        pdf_path: str,
+        page_range: Tuple[int, int] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """process_document, through process_file when the PDF is on disk only"""
+        if pdf_bytes is None and (file_path or pdf_path):
+            return self.process_file(file_path or pdf_path, page_range=page_range)
+        return self.process_document(file_path, pdf_bytes=pdf_bytes, pdf_path=pdf_path, page_range=page_range)
+
+    def process_file(
+        self,
+        pdf_path: str,
+        page_range: Tuple[int, int] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        process_document for a PDF on disk, run in this process's ParsePool when
+        use_parse_pool is set so the CPU-bound parse does not hold this
+        process's GIL. The result and the processor state afterwards are the
+        same as an in-process call.
+        """
+        if not self.use_parse_pool:
+            return self.process_document(pdf_path=pdf_path, page_range=page_range)
+        sections, reference_data, state = get_parse_pool().run(
+            self.pool_state(include_config=True), pdf_path, page_range=page_range, progress=self.progress_callback
+        )
+        self.load_pool_state(state)
         return sections, reference_data
 
+    def pool_state(self, include_config: bool = False) -> Dict[str, Any]:
+        """What a parse in another process needs from this processor, or hands back from it"""
+        state = {name: getattr(self, name) for name in POOL_STATE}
+        if include_config:
+            state.update({name: getattr(self, name) for name in POOL_CONFIG})
+            state['document_id'] = self.document_id
+            state['document_url'] = self.document_url
+        return state
+
+    def load_pool_state(self, state: Dict[str, Any]) -> None:
+        for name in POOL_STATE + POOL_CONFIG:
+            if name in state:
+                setattr(self, name, state[name])
+
+    def count_pages(self, pdf_path: str = None, pdf_bytes: bytes = None) -> int:
+        """Number of pages in the PDF, without parsing any of them"""
+        with PDFParser(pdf_path, pdf_bytes=pdf_bytes)._open_document() as doc:
+            return len(doc)
+
+    def leading_pages(self, pdf_path: str, page_count: int = 2) -> List[Dict[str, Any]]:
+        """Raw text of the first page_count pages as sections, enough for DocumentSummarizer, without parsing"""
+        with PDFParser(pdf_path)._open_document() as doc:
+            return [
+                {
+                    'content': {'type': 'text', 'text': doc[index].get_text()},
+                    'section_start_page_number': index + 1
+                }
+                for index in range(min(page_count, len(doc)))
+            ]
+
+    def is_progressive(self, page_count: int) -> bool:
+        """Whether iter_document_batches parses a document of page_count pages in batches"""
+        return page_count >= self.progressive_min_pages
+
+    def locate_reference_data(self, pdf_path: str = None, pdf_bytes: bytes = None) -> Dict[str, Any]:
+        """Find and extract the reference section without reading the whole document
+        
+        The heading page comes from the PDF outline when it has a references entry,
+        otherwise from scanning backwards from the last page, at most
+        reference_scan_max_pages pages. Page numbers in the result are absolute.
+        """
+        with PDFParser(pdf_path, pdf_bytes=pdf_bytes)._open_document() as doc:
+            page_count = len(doc)
+            start_index = None
+
+            # The last outline entry wins, earlier ones may be chapter reference lists
+            for _, title, page_number in doc.get_toc(simple=True):
+                if page_number >= 1 and is_reference_heading(title):
+                    start_index = page_number - 1
+
+            if start_index is None:
+                stop = max(-1, page_count - 1 - self.reference_scan_max_pages)
+                for page_index in range(page_count - 1, stop, -1):
+                    page_text = doc[page_index].get_text()
+                    if might_contain_heading(page_text) and any(
+                        is_reference_heading(line) for line in page_text.split('\n')
+                    ):
+                        start_index = page_index
+                        break
+
+            if start_index is None:
+                print("No reference section found")
+                return self._extract_reference_section([])
+
+            page_texts = [doc[page_index].get_text().strip() for page_index in range(start_index, page_count)]
+
+        reference_data = self._extract_reference_section(page_texts)
+        for key in ('start_page', 'end_page'):
+            if reference_data[key] is not None:
+                reference_data[key] += start_index
+        return reference_data
+
     # In DocumentProcessor.process_document
-    def process_document(self, file_path: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-        """Process PDF with memory management and error handling"""
+    def process_document(
+        self,
+        file_path: str = None,
+        pdf_bytes: bytes = None,
+        pdf_path: str = None,
+        page_range: Tuple[int, int] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Process PDF with memory management and error handling
+        
+        Input:
+            file_path: str - Path to a PDF on disk
+            pdf_bytes: bytes | memoryview - PDF content, parsed without touching disk
+            pdf_path: str - Alias of file_path, used alongside pdf_bytes for spooled sources
+            page_range: Tuple[int, int] - First and last page (1-based, inclusive) to
+                parse. Only those pages become sections and the reference section
+                is located directly instead of from the full text.
+        """
 
         
         start_time = time.time()
+        if self.sectioning not in SECTIONING_MODES:
+            raise ValueError(f"Unknown sectioning '{self.sectioning}', expected one of {SECTIONING_MODES}")
+        if page_range is None:
+            self.sections_emitted = 0
+            self.text_normalizer = TextNormalizer()
+            self.normalization_stats = NormalizationStats()
         
         try:
             # Initialize custom PDF parser
-            parser = PDFParser(file_path)
+            parser = PDFParser(
+                file_path or pdf_path,
+                pdf_bytes=pdf_bytes,
+                engine=self.parse_engine,
+                workers=self.parse_workers,
+                parallel_min_pages=self.parallel_min_pages,
+                in_memory=self.parse_in_memory,
+                page_range=page_range,
+                table_engine=self.table_engine,
+                table_precheck=self.table_precheck,
+                image_store=self.image_store,
+                min_image_pixels=self.min_image_pixels,
+                progress=self.progress_callback
+            )
             
             # Extract all content with memory limits
+            stage_start = time.perf_counter()
             result = parser.parse()
+            self.parse_metadata = result["metadata"]
+            self.stage_timings = {'parse': time.perf_counter() - stage_start}
+
+            # Remove boilerplate before references and sections see the text
+            if self.normalize_text:
+                stage_start = time.perf_counter()
+                result["pages"], stats = self.text_normalizer.normalize(result["pages"], result.get("layout"))
+                self.normalization_stats.add(stats)
+                self.stage_timings['normalize'] = time.perf_counter() - stage_start
             
             # Process pages into sections
             processed_sections = []
             
             # Extract references
-            reference_data = self._extract_reference_section([p for p in result["pages"].values()])
-            self.reference_data = reference_data
+            stage_start = time.perf_counter()
+            if page_range is None:
+                # Pages are read one at a time from the buffer, not copied into a list
+                reference_data = self._extract_reference_section(result["pages"].values())
+                self.reference_data = reference_data
+            else:
+                if not self.reference_data:
+                    self.reference_data = self.locate_reference_data(file_path or pdf_path, pdf_bytes)
+                reference_data = self.reference_data
             
-            # Free memory by processing pages one by one
-            for page_num, page_text in result["pages"].items():
-                prev_text = result["pages"].get(page_num - 1)
-                next_text = result["pages"].get(page_num + 1)
-                
-                # Get any tables/images for this page
-                tables = result["tables"].get(page_num, [])
-                images = result["images"].get(page_num, [])
-                
-                # Create section
-                section = Section(
-                    text=page_text,
-                    section_type='text',
-                    section_start_page_number=page_num,
-                    document_id=self.document_id,
-                    prev_page_text=prev_text,
-                    next_page_text=next_text,
-                    tables=tables, 
-                    images=images
-                )
-                
+            self.stage_timings['references'] = time.perf_counter() - stage_start
+
+            # Free memory by processing sections one by one
+            stage_start = time.perf_counter()
+            for section in self._iter_sections(result):
                 # Process section data
                 section_data = self._create_section_data(section)
+                section_data['section_index'] = self.sections_emitted
+                self.sections_emitted += 1
                 processed_sections.append(section_data)
                 
                 # Clear references to conserve memory
                 del section
-                del tables
-                del images
             
-            self.total_pages = len(processed_sections)
+            self.stage_timings['sections'] = time.perf_counter() - stage_start
+
+            self.text_page_count = len(result["pages"])
+            if page_range is None:
+                self.total_pages = self.text_page_count
+            else:
+                self.total_pages = result["metadata"]["page_count"]
             
             # Ensure cleanup happens
             # self._cleanup_temp_file(file_path)
@@ -271,6 +604,56 @@ class DocumentProcessor:
 
 
 
+    def _iter_sections(self, result: Dict[str, Any]) -> Generator[Section, None, None]:
+        """Sections of a parse result, per page or per logical section depending on self.sectioning"""
+        pages = result["pages"]
+        if self.sectioning == 'page':
+            for page_num, page_text in pages.items():
+                yield Section(
+                    text=page_text,
+                    section_type='text',
+                    section_start_page_number=page_num,
+                    document_id=self.document_id,
+                    tables=result["tables"].get(page_num, []),
+                    images=result["images"].get(page_num, []),
+                    page_texts=pages
+                )
+            return
+
+        sectioner = SemanticSectioner(max_tokens=self.section_max_tokens, min_tokens=self.section_min_tokens)
+        logical_sections = sectioner.split(pages, result.get("layout"))
+        if not logical_sections:
+            return
+
+        # Tables and images go to the first section covering their page, pages
+        # without text (figure-only pages) to the section before them
+        owners = {}
+        for index, logical_section in enumerate(logical_sections):
+            for page_num in logical_section.pages:
+                owners.setdefault(page_num, index)
+        section_starts = [logical_section.start_page for logical_section in logical_sections]
+        elements = [{'tables': [], 'images': []} for _ in logical_sections]
+        for kind in ('tables', 'images'):
+            for page_num in sorted(result[kind]):
+                owner = owners.get(page_num)
+                if owner is None:
+                    owner = max(bisect.bisect_right(section_starts, page_num) - 1, 0)
+                elements[owner][kind].extend(result[kind][page_num])
+
+        for logical_section, section_elements in zip(logical_sections, elements):
+            yield Section(
+                text=logical_section.text,
+                section_type=logical_section.section_type,
+                section_start_page_number=logical_section.start_page,
+                document_id=self.document_id,
+                tables=section_elements['tables'],
+                images=section_elements['images'],
+                page_texts=pages,
+                section_end_page_number=logical_section.end_page,
+                title=logical_section.title,
+                page_starts=logical_section.page_starts()
+            )
+
     def _create_section_data(self, section: Section) -> Dict[str, Any]:
         """Create section data dictionary with citations and references
         
@@ -284,12 +667,14 @@ class DocumentProcessor:
                 'section_id': str, 
                 'section_type': str,
                 'section_start_page_number': int,
+                'section_end_page_number': int,
+                'title': str,
                 'content': {
                     'text': str,
                     'type': str,
                     'has_citations': bool
                 },
-                'citations': List[Dict],
+                'citations': List[Dict],  # Each with the 'page_number' it is on
                 'elements': List[Dict]  # Tables and images
             }
         """
@@ -301,6 +686,8 @@ class DocumentProcessor:
 
         # Extract citations
         citations = self._extract_citations(section_text, self.reference_data)
+        for citation in citations:
+            citation['page_number'] = page_at(section.page_starts, citation['position'][0])
 
 
 
@@ -329,6 +716,7 @@ class DocumentProcessor:
                 'height': image['height'],
                 'filename': image['filename'],
                 'path': image['path'],
+                'content_hash': image.get('content_hash'),
                 'extraction_date': image['extraction_date']
             })
         
@@ -338,6 +726,8 @@ class DocumentProcessor:
             'section_id': section.section_id,
             'section_type': section.type,
             'section_start_page_number': section.section_start_page_number,
+            'section_end_page_number': section.section_end_page_number,
+            'title': section.title,
             'content': {
                 'text': section_text,
                 'type': section.type,
@@ -352,222 +742,20 @@ class DocumentProcessor:
     
 
 
-    def _preprocess_reference_text(self, page_texts: List[str]) -> List[str]:
-        """Pre-process pages to join split references before main extraction"""
-        processed_pages = []
-        
-        for page_text in page_texts:
-            lines = page_text.split('\n')
-            joined_lines = []
-            current_line = ""
-            
-            for line in lines:
-                # If line starts with any reference pattern, it's a new reference
-                if (re.match(r'^\s*\[\d+\]', line) or      # [1]
-                    re.match(r'^\s*\d+\.', line) or        # 1.
-                    re.match(r'^\s*\[.*?\(\d{4}[a-z]?\)\]', line) or  # [Author(2023a)]
-                    re.match(r'^\s*\([A-Za-z]+,\s*\d{4}\)', line)):   # (john,2024)
-                    if current_line:  # Save previous reference if exists
-                        joined_lines.append(current_line)
-                    current_line = line
-                # If we're in a reference and line doesn't start with pattern
-                elif current_line:
-                    current_line += " " + line.strip()
-                else:
-                    joined_lines.append(line)
-                        
-            # Add final reference
-            if current_line:
-                joined_lines.append(current_line)
-                    
-            processed_pages.append('\n'.join(joined_lines))
-        
-        return processed_pages
-
     def _extract_citations(self, text: str, reference_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract citations and match with references"""
-
-
-        
-        citations = []
-        cleaned_text = re.sub(r'\s+', ' ', text).strip()
-        
-        # First handle numbered citations (keep existing functionality)
-        for match in re.finditer(r'\[(\d+(?:,\s*\d+)*)\]', cleaned_text):
-            citation_text = match.group(0)
-            ref_numbers = [num.strip() for num in match.group(1).split(',')]
-            
-            citation_data = {
-                'text': citation_text,
-                'type': 'numbered',
-                'position': match.span(),
-                'ref_numbers': ref_numbers,
-                'references': []
-            }
-            
-            # Match references (keep existing logic)
-            if reference_data and 'entries' in reference_data:
-                for ref_num in ref_numbers:
-                    if ref_num in reference_data['entries']:
-                        citation_data['references'].append(
-                            reference_data['entries'][ref_num]
-                        )
-            
-            citations.append(citation_data)
-
-        # Add additional citation pattern matching
-        for pattern_type, pattern in CITATION_PATTERNS.items():
-            if pattern_type == 'numbered':
-                continue  # Skip as already handled above
-            
-            for match in re.finditer(pattern, cleaned_text):
-                citation_data = {
-                    'text': match.group(0),
-                    'type': pattern_type,
-                    'position': match.span(),
-                    'matched_text': match.group(1),
-                    'references': []
-                }
-                citations.append(citation_data)
-        
-
-
-        
-        return citations
-
-    def _extract_reference_section(self, page_texts: List[str]) -> Dict[str, Any]:
-        """Extract reference section and entries from document"""
-
-
-        page_texts = self._preprocess_reference_text(page_texts)
-
-        
-        reference_data = {
-            'entries': {},
-            'type': 'unknown',
-            'start_page': None,
-            'end_page': None
-        }
-
-        def is_likely_reference_entry(line: str) -> bool:
-            """Check if line looks like a reference entry"""
-
-            if not line.strip():
-                return False
-                
-            patterns = [
-                r'^\s*\[\d+\]',          # [1] Style
-                r'^\s*\(\d+\)',          # (1) Style  
-                r'^\s*\d+\.',            # 1. Style
-                r'^[A-Z][a-zA-Z\'-]+',   # Starts with capitalized word
-                r'^[A-Z]\.',             # Starts with initial
-                r'et\s+al\.?,',          # et al.
-                r'\(\d{4}\)[,.]',        # Year in parentheses
-                r'doi:',                 # DOI
-                r'ISBN:?',               # ISBN
-                r'vol\.',                # Volume indicator
-                r'pp\.',                 # Page indicators
-                r'http[s]?://'           # URLs
-            ]
-            return any(re.search(pattern, line) for pattern in patterns)
-        
-        def combine_reference_lines(lines: List[str], start_idx: int) -> Tuple[str, int]:
-            """Combines multi-line references into single string"""
-            combined = lines[start_idx]
-            current_idx = start_idx + 1
-            
-            while current_idx < len(lines):
-                next_line = lines[current_idx].strip()
-                
-                # Stop if we hit next reference (any pattern)
-                if any(re.match(pattern, next_line) for pattern in REFERENCE_PATTERNS.values()):
-                    break
-                    
-                # Stop if we found completion marker
-                if re.search(r'\d{4}\.|\b(?:https?://|www\.)\S+', next_line):
-                    combined += ' ' + next_line
-                    break
-                    
-                combined += ' ' + next_line
-                current_idx += 1
-                
-            return combined, current_idx - 1
-
-        # Process each page (keeping your existing page processing)
-        reference_section_found = False
-        for page_idx, page_text in enumerate(page_texts):
-            if not page_text:
-                continue
-                
-            lines = page_text.split('\n')
-            
-            # Look for reference section marker
-            for line_idx, line in enumerate(lines):
-                for pattern in REFERENCE_SECTION_TITLES:
-                    if re.search(pattern, line.lower().strip()):
-
-                        reference_section_found = True
-                        if reference_data['start_page'] is None:
-                            reference_data['start_page'] = page_idx + 1
-                        break
-                if reference_section_found:
-                    break
-
-            if reference_section_found:
-                # Process references line by line
-                current_line = line_idx + 1
-                while current_line < len(lines):
-                    line = lines[current_line].strip()
-                    
-                    # First try all reference patterns
-                    for ref_type, pattern in REFERENCE_PATTERNS.items():
-                        ref_match = re.match(pattern, line)
-                        if ref_match:
-                            # Get reference identifier based on type
-                            if ref_type == 'numbered_bracket':
-                                ref_id = ref_match.group(1)
-                            elif ref_type == 'numbered_dot':
-                                ref_id = ref_match.group(1)
-                            else:
-                                ref_id = ref_match.group(1)
-                                
-                            # Combine multi-line reference
-                            full_ref, current_line = combine_reference_lines(lines, current_line)
-                            
-                            if len(full_ref) > 10:  # Basic validation
-                                reference_data['entries'][ref_id] = {
-                                    'text': full_ref,
-                                    'type': ref_type
-                                }
-                            break
-                    
-                    current_line += 1
-
-        # Continue processing subsequent pages (keeping your existing logic)
-        if reference_section_found:
-            for page_idx in range(reference_data['start_page'], len(page_texts)):
-                page_text = page_texts[page_idx]
-                lines = page_text.split('\n')
-                current_line = 0
-                while current_line < len(lines):
-                    line = lines[current_line].strip()
-                    
-                    # Process reference patterns
-                    for ref_type, pattern in REFERENCE_PATTERNS.items():
-                        ref_match = re.match(pattern, line)
-                        if ref_match:
-                            ref_id = ref_match.group(1)
-                            full_ref, current_line = combine_reference_lines(lines, current_line)
-                            
-                            if len(full_ref) > 10:
-                                reference_data['entries'][ref_id] = {
-                                    'text': full_ref,
-                                    'type': ref_type
-                                }
-                            break
-                    
-                    current_line += 1
-                reference_data['end_page'] = page_idx + 1
+        """Extract citations and match with references, in one scan over the text"""
+        return extract_citations(text, reference_index=self._get_reference_index(reference_data))
+
+    def _get_reference_index(self, reference_data: Dict[str, Any]) -> ReferenceIndex:
+        """Reference index for reference_data, reused until the reference data changes"""
+        if self._reference_index is None or self._indexed_reference_data is not reference_data:
+            self._reference_index = ReferenceIndex(reference_data)
+            self._indexed_reference_data = reference_data
+        return self._reference_index
+
+    def _extract_reference_section(self, page_texts: Iterable[str]) -> Dict[str, Any]:
+        """Extract reference section and entries from document, in one pass over the pages"""
+        reference_data = extract_reference_section(page_texts)
 
         if reference_data['entries']:
             print("We have reference data")
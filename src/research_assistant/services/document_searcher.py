@@ -11,6 +11,8 @@ from research_assistant.services.document_processor import DocumentProcessor
 from ..models import DocumentMetadata
 from .search.relevance_scorer import RelevanceScorer
 from .document_processor import DocumentProcessor
+from .citation_scanner import extract_citations
+from .reference_index import ReferenceIndex
 from django.utils import timezone
 
 class SearchMatch(BaseModel):
@@ -636,6 +638,9 @@ class DocumentSearcher:
             "total_matches": 0
         }
 
+        # Built once so citations in every section resolve against the same lookup
+        reference_index = ReferenceIndex(reference_data)
+
         # Process each section
         for section in sections:
             results = self.analyze_section(
@@ -667,7 +672,7 @@ class DocumentSearcher:
                     print("Has Matching Context Text: \n", match["context"])
                     section_matches['context_matches'].append({
                         'text': match["context"],
-                        'citations': self._extract_citations(match['context'], reference_data)
+                        'citations': self._extract_citations(match['context'], reference_data, reference_index)
                     })
 
                 # Keyword matches
@@ -725,43 +730,20 @@ class DocumentSearcher:
         }
     
 
-    def _extract_citations(self, text: str, reference_data: Dict) -> List[Dict]:
+    def _extract_citations(self, text: str, reference_data: Dict, reference_index: ReferenceIndex = None) -> List[Dict]:
         """Extract citations from text and link to references
         
         Input:
             text: str - Text containing citations
             reference_data: Dict - Reference data dictionary
+            reference_index: ReferenceIndex - Index over reference_data, built once per document
             
         Output:
             List[Dict] - List of found citations with references in same format as document processor
         """
         try:
-            # Use the cleaned text approach
-            cleaned_text = re.sub(r'\s+', ' ', text).strip()
-            citations = []
-            
-            # Extract numbered citations with comma separation - matching document processor format
-            for match in re.finditer(r'\[(\d+(?:,\s*\d+)*)\]', cleaned_text):
-                citation_text = match.group(0)
-                ref_numbers = [num.strip() for num in match.group(1).split(',')]
-                
-                citation_data = {
-                    'text': citation_text,
-                    'type': 'numbered',
-                    'position': match.span(),
-                    'ref_numbers': ref_numbers,
-                    'references': []
-                }
-                
-                # Match references just like document processor
-                if reference_data and 'entries' in reference_data:
-                    for ref_num in ref_numbers:
-                        if ref_num in reference_data['entries']:
-                            citation_data['references'].append(
-                                reference_data['entries'][ref_num]
-                            )
-                
-                citations.append(citation_data)
+            # Same format as the document processor, author-year citations included
+            citations = extract_citations(text, reference_data, reference_index=reference_index)
             print("search citations: \n", citations)
             return citations
             
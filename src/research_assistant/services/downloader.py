@@ -0,0 +1,168 @@
+# src/research_assistant/services/downloader.py
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.conf import settings
+
+from ..models import SourceURLCache
+from .pdf_source import PDFSource, DEFAULT_SPOOL_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+DEFAULT_TIMEOUT = 30
+DEFAULT_CHUNK_SIZE = 256 * 1024
+DEFAULT_POOL_SIZE = 10
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class DownloadTooLargeError(Exception):
+    """Raised when a download exceeds the configured size limit"""
+
+
+def get_session() -> requests.Session:
+    """
+    Process-wide HTTP session shared by every download.
+
+    Reusing one connection pool means a bulk upload of several files from
+    the same storage host pays for TCP and TLS set-up once.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                pool_size = getattr(settings, 'PROCESSING_SETTINGS', {}).get('DOWNLOAD_POOL_SIZE', DEFAULT_POOL_SIZE)
+                retries = Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=['GET']
+                )
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+                session = requests.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _session = session
+    return _session
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of a download, source is None when the server answered 304"""
+    content_hash: str
+    source: Optional[PDFSource] = None
+    not_modified: bool = False
+
+
+class PDFDownloader:
+    """Stream documents from URLs with pooled connections, size limits and conditional re-fetch"""
+
+    def __init__(
+        self,
+        max_bytes: int = None,
+        timeout: int = None,
+        chunk_size: int = None,
+        spool_threshold: int = None
+    ):
+        processing_settings = getattr(settings, 'PROCESSING_SETTINGS', {})
+        self.max_bytes = max_bytes or processing_settings.get('DOWNLOAD_MAX_BYTES', DEFAULT_MAX_BYTES)
+        self.timeout = timeout or processing_settings.get('DOWNLOAD_TIMEOUT', DEFAULT_TIMEOUT)
+        self.chunk_size = chunk_size or processing_settings.get('DOWNLOAD_CHUNK_SIZE', DEFAULT_CHUNK_SIZE)
+        self.spool_threshold = spool_threshold or processing_settings.get(
+            'PDF_SPOOL_THRESHOLD_BYTES', DEFAULT_SPOOL_THRESHOLD
+        )
+
+    def download(
+        self,
+        url: str,
+        reuse_check: Callable[[str], bool] = None,
+        progress: Callable[[int, Optional[int]], None] = None
+    ) -> DownloadResult:
+        """
+        Download url into a PDFSource, streaming chunks and aborting early when too large.
+
+        Args:
+            url (str): Document URL
+            reuse_check (Callable): Given the content hash recorded for this URL, returns
+                True when the caller can work without the bytes (e.g. the parse result is
+                cached). Only then is the request made conditional with the stored
+                ETag/Last-Modified, so a 304 never leaves the caller without content.
+            progress (Callable): Called after each chunk with the bytes read so far and
+                the Content-Length, None when the server did not send one
+
+        Returns:
+            DownloadResult: the source to parse, or not_modified with the known content hash
+        """
+        headers = {}
+        cached = self._get_validators(url) if reuse_check else None
+        if cached and reuse_check(cached.content_hash):
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        with get_session().get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            if response.status_code == 304 and headers:
+                logger.info(f"Source unchanged, reusing content {cached.content_hash[:12]} for {url}")
+                return DownloadResult(content_hash=cached.content_hash, not_modified=True)
+
+            response.raise_for_status()
+
+            content_length = response.headers.get('Content-Length')
+            content_length = int(content_length) if content_length and content_length.isdigit() else None
+            if content_length is not None and content_length > self.max_bytes:
+                raise DownloadTooLargeError(
+                    f"Document is {content_length} bytes, the limit is {self.max_bytes} bytes"
+                )
+
+            source = PDFSource(spool_threshold=self.spool_threshold)
+            try:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if source.size + len(chunk) > self.max_bytes:
+                        raise DownloadTooLargeError(f"Document exceeds the {self.max_bytes} byte limit")
+                    source.write(chunk)
+                    if progress is not None:
+                        progress(source.size, content_length)
+                source.finish()
+            except Exception:
+                source.close()
+                raise
+
+            self._store_validators(url, response, source)
+            return DownloadResult(content_hash=source.content_hash, source=source)
+
+    def _get_validators(self, url: str) -> Optional[SourceURLCache]:
+        """Fetch stored validators for a URL, failures only disable the conditional request"""
+        try:
+            return SourceURLCache.objects.filter(url_hash=SourceURLCache.hash_url(url)).first()
+        except Exception as e:
+            logger.warning(f"Source URL cache lookup failed: {str(e)}")
+            return None
+
+    def _store_validators(self, url: str, response: requests.Response, source: PDFSource) -> None:
+        """Remember ETag/Last-Modified of a fresh download"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        try:
+            SourceURLCache.objects.update_or_create(
+                url_hash=SourceURLCache.hash_url(url),
+                defaults={
+                    'url': url,
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'content_hash': source.content_hash,
+                    'size_bytes': source.size
+                }
+            )
+        except Exception as e:
+            logger.warning(f"Source URL cache store failed: {str(e)}")
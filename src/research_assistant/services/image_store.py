@@ -0,0 +1,80 @@
+# src/research_assistant/services/image_store.py
+
+import hashlib
+import logging
+import os
+import tempfile
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def default_store_root() -> str:
+    """Image store directory from settings, falling back to <BASE_DIR>/media/images"""
+    root = getattr(settings, 'PROCESSING_SETTINGS', {}).get('IMAGE_STORE_ROOT')
+    if root:
+        return str(root)
+    return os.path.join(str(settings.BASE_DIR), 'media', 'images')
+
+
+class ImageStore:
+    """
+    Persistent content-addressed store for images extracted from documents.
+
+    Each image is written once under <root>/<hash[:2]>/<hash>.<ext>, so the same
+    figure or logo in any number of pages or documents shares one file, and
+    the stored path stays valid after the parser's temporary output is removed.
+    """
+
+    def __init__(self, root: str = None):
+        self.root = root or default_store_root()
+
+    @staticmethod
+    def key_for(content_hash: str, ext: str) -> str:
+        """Relative location of an image within the store"""
+        return os.path.join(content_hash[:2], f"{content_hash}.{ext}")
+
+    def path(self, key: str) -> str:
+        """Absolute file path for a store key"""
+        return os.path.join(self.root, key)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def put(self, data: bytes, ext: str, content_hash: str = None) -> str:
+        """
+        Store image bytes unless an identical image is already present.
+
+        Args:
+            data (bytes): Encoded image
+            ext (str): File extension reported by the PDF, e.g. 'png'
+            content_hash (str): SHA-256 of data when the caller already has it
+
+        Returns:
+            str: The store key
+        """
+        content_hash = content_hash or hashlib.sha256(data).hexdigest()
+        key = self.key_for(content_hash, ext)
+        image_path = self.path(key)
+        if os.path.exists(image_path):
+            return key
+
+        os.makedirs(os.path.dirname(image_path), exist_ok=True)
+        # Write to a sibling temp file and rename so readers never see a partial image
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(image_path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, image_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        logger.info(f"Stored image {key}")
+        return key
+
+    def get(self, key: str) -> bytes:
+        """Read a stored image"""
+        with open(self.path(key), 'rb') as f:
+            return f.read()
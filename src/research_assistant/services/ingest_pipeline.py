@@ -0,0 +1,436 @@
+# src/research_assistant/services/ingest_pipeline.py
+
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Dict, List
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from ..models import DocumentMetadata, DocumentSection, IngestCheckpoint, Job
+from .document_processor import DocumentProcessor
+from .document_summarizer import DocumentSummarizer
+from .ingest_progress import ProgressReporter
+
+logger = logging.getLogger(__name__)
+
+# Documents without an update for this long are taken to be abandoned by their worker
+STALE_AFTER_SECONDS = 600
+# Statuses an abandoned document is left in, pending when the worker died before starting
+RESUMABLE_STATUSES = ('pending', 'processing')
+
+
+def default_checkpoint_root() -> str:
+    """Checkpointed PDF directory from settings, falling back to <BASE_DIR>/media/ingest"""
+    root = getattr(settings, 'PROCESSING_SETTINGS', {}).get('INGEST_CHECKPOINT_ROOT')
+    if root:
+        return str(root)
+    return os.path.join(str(settings.BASE_DIR), 'media', 'ingest')
+
+
+def stale_documents(stale_after_seconds: int = None):
+    """
+    Documents still pending or processing with no update for stale_after_seconds,
+    oldest first. Documents with a queued or running ingest job are left to the
+    job queue, which requeues jobs whose worker died.
+    """
+    if stale_after_seconds is None:
+        stale_after_seconds = getattr(settings, 'PROCESSING_SETTINGS', {}).get(
+            'INGEST_STALE_SECONDS', STALE_AFTER_SECONDS
+        )
+    cutoff = timezone.now() - timedelta(seconds=stale_after_seconds)
+    return DocumentMetadata.objects.filter(
+        processing_status__in=RESUMABLE_STATUSES,
+        updated_at__lt=cutoff
+    ).exclude(
+        id__in=Job.objects.filter(kind='ingest', status__in=Job.ACTIVE_STATUSES).values('document_id')
+    ).order_by('updated_at')
+
+
+def claim_document(document: DocumentMetadata) -> bool:
+    """
+    Take over a stale document by bumping its updated_at, only if nobody touched it
+    since it was read, so two reapers never resume the same document
+    """
+    return DocumentMetadata.objects.filter(
+        id=document.id,
+        updated_at=document.updated_at
+    ).update(updated_at=timezone.now()) == 1
+
+
+class IngestPipeline:
+    """
+    Ingest one document in checkpointed stages: download, parse, references,
+    summary, persist.
+
+    Each stage commits its output to the document's IngestCheckpoint in the
+    same transaction as the stage marker, so when a worker dies mid-ingest
+    (a gunicorn timeout, a deploy) the next run starts after the last
+    completed stage instead of at the download:
+
+    - download keeps the PDF under INGEST_CHECKPOINT_ROOT, named by content
+      hash, or only the hash when the parse cache already has the document
+    - parse keeps the sections and reference data
+    - references writes the reference data to the document
+    - summary writes the generated metadata to the document
+    - persist stores the sections, each batch committed with the count stored
+
+    Documents that DocumentProcessor parses in page batches store each batch
+    as it is parsed, so they become searchable after the first one as before.
+    Their parse stage records the pages done and resumes at the next batch,
+    the summary is generated from the first batch.
+
+    Every stage saves the document, which keeps its updated_at fresh while
+    it runs; stale_documents finds the ones whose worker stopped doing so.
+    Within a stage a ProgressReporter publishes bytes downloaded, pages
+    parsed and sections stored as processing_progress, with throttled writes.
+
+    With INGEST_PIPELINING the summary LLM call does not wait for the parse:
+    it starts in a thread once the download is done, from the raw text of
+    the first two pages (from the first sections on a parse cache hit), and
+    the parse, references and section storage run meanwhile. The summary
+    stage joins it after storing the sections, so the document completes
+    once the slower of the two is done. The stage markers keep their order,
+    sections stored before the summary finished are counted in
+    sections_persisted and not stored again on resume.
+    """
+
+    def __init__(self, document: DocumentMetadata, file_id: str = None, checkpoint_root: str = None):
+        self.document = document
+        self.checkpoint, _ = IngestCheckpoint.objects.get_or_create(
+            document=document,
+            defaults={'file_id': file_id}
+        )
+        self.checkpoint_root = checkpoint_root or default_checkpoint_root()
+        self.section_batch_size = getattr(settings, 'PROCESSING_SETTINGS', {}).get('SECTION_BULK_BATCH_SIZE', 200)
+        self.processor = DocumentProcessor(
+            document_id=self.checkpoint.file_id or str(document.id),
+            document_url=document.url
+        )
+        self.progress = ProgressReporter(document)
+        self.processor.progress_callback = self.progress.pages
+        self._summarizer = None
+        self.pipelined = getattr(settings, 'PROCESSING_SETTINGS', {}).get('INGEST_PIPELINING', True)
+        self._summary_executor = None
+        self._summary_future = None
+
+    def run(self) -> DocumentMetadata:
+        """Run the stages not completed yet, returns the completed document"""
+        checkpoint = self.checkpoint
+        checkpoint.attempts += 1
+        if checkpoint.stage is not None:
+            logger.info(
+                f"Resuming ingest of {self.document.id} after stage '{checkpoint.stage}' "
+                f"(attempt {checkpoint.attempts})"
+            )
+        self.document.processing_status = 'processing'
+        if self.document.processing_started_at is None:
+            self.document.processing_started_at = timezone.now()
+        with transaction.atomic():
+            checkpoint.save()
+            self.document.save()
+
+        try:
+            for stage in IngestCheckpoint.STAGES:
+                if not checkpoint.completed(stage):
+                    self.progress.start_stage(stage)
+                    getattr(self, f'_{stage}')()
+                if self.pipelined and stage in ('download', 'parse'):
+                    self._start_summary()
+        finally:
+            if self._summary_executor is not None:
+                # A failed run does not wait for the LLM call
+                self._summary_executor.shutdown(wait=False, cancel_futures=True)
+                self._summary_executor = None
+
+        self._complete()
+        return self.document
+
+    def fail(self, error: Exception) -> None:
+        """Mark the document failed and drop everything stored for it so far"""
+        document = self.document
+        document.processing_status = 'failed'
+        document.error_message = str(error)
+        document.is_searchable = False
+        # Batches stored before the failure would leave a partial document behind
+        with transaction.atomic():
+            DocumentSection.objects.filter(document=document).delete()
+            IngestCheckpoint.objects.filter(id=self.checkpoint.id).delete()
+            document.save()
+        self._discard_pdf()
+
+    def _advance(self, stage: str, **outputs: Any) -> None:
+        """Record stage as completed together with its outputs and the document"""
+        for name, value in outputs.items():
+            setattr(self.checkpoint, name, value)
+        self.checkpoint.stage = stage
+        with transaction.atomic():
+            self.checkpoint.save()
+            self.document.save()
+        logger.info(f"Ingest of {self.document.id}: {stage} done")
+
+    def _download(self) -> None:
+        processor = self.processor
+        result = processor.downloader.download(
+            self.document.url,
+            reuse_check=lambda content_hash: processor.parse_cache.contains(content_hash, processor.parser_version),
+            progress=self.progress.download_bytes
+        )
+        if result.not_modified:
+            # The parse stage reads the cached result, the bytes are not needed
+            self._advance('download', content_hash=result.content_hash, pdf_path=None)
+            return
+
+        with result.source as source:
+            pdf_path = self._keep_pdf(source)
+            self._advance('download', content_hash=source.content_hash, pdf_path=pdf_path)
+
+    def _keep_pdf(self, source) -> str:
+        """Write a downloaded source to the checkpoint directory, once per content hash"""
+        os.makedirs(self.checkpoint_root, exist_ok=True)
+        pdf_path = os.path.join(self.checkpoint_root, f"{source.content_hash}.pdf")
+        if not os.path.exists(pdf_path):
+            # Write then rename, a killed worker never leaves a truncated PDF under the final name
+            fd, tmp_path = tempfile.mkstemp(dir=self.checkpoint_root, suffix='.part')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(source.data)
+                os.replace(tmp_path, pdf_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        return pdf_path
+
+    def _pdf_path(self) -> str:
+        """The checkpointed PDF, downloaded again when it is gone"""
+        pdf_path = self.checkpoint.pdf_path
+        if pdf_path and os.path.exists(pdf_path):
+            return pdf_path
+        result = self.processor.downloader.download(self.document.url)
+        with result.source as source:
+            pdf_path = self._keep_pdf(source)
+        self.checkpoint.content_hash = result.content_hash
+        self.checkpoint.pdf_path = pdf_path
+        self.checkpoint.save()
+        return pdf_path
+
+    def _parse(self) -> None:
+        processor = self.processor
+        checkpoint = self.checkpoint
+
+        if checkpoint.pages_processed == 0 and checkpoint.content_hash:
+            cached = processor.load_cached(checkpoint.content_hash)
+            if cached is not None:
+                sections, reference_data = cached
+                # Nothing is parsed, the pages are all done at once
+                self.document.pages_parsed = self.document.page_count = processor.total_pages
+                self.progress.advance(1.0, save=False)
+                self._advance('parse', sections=sections, reference_data=reference_data,
+                              total_pages=processor.total_pages)
+                return
+
+        pdf_path = self._pdf_path()
+        page_count = processor.count_pages(pdf_path)
+        if processor.is_progressive(page_count):
+            self._parse_in_batches(pdf_path)
+            return
+
+        sections, reference_data = processor.process_file(pdf_path)
+        processor.parse_cache.put(
+            checkpoint.content_hash, processor.parser_version, sections, reference_data, processor.total_pages
+        )
+        self.progress.advance(1.0, save=False)
+        self._advance('parse', sections=sections, reference_data=reference_data, total_pages=processor.total_pages)
+
+    def _parse_in_batches(self, pdf_path: str) -> None:
+        """Parse and store a long document batch by batch, resuming after the last stored batch"""
+        processor = self.processor
+        checkpoint = self.checkpoint
+        document = self.document
+
+        # Continue the reference data and section numbering of the batches already stored
+        processor.reference_data = checkpoint.reference_data or {}
+        processor.sections_emitted = checkpoint.sections_persisted
+        start_page = checkpoint.pages_processed + 1
+        # Only a run that saw every batch can fill the parse cache
+        all_sections = [] if start_page == 1 else None
+
+        for sections in processor.iter_document_batches(pdf_path=pdf_path, start_page=start_page):
+            if checkpoint.summary is None and sections:
+                if self._summary_future is None:
+                    self._summarize(sections)
+                elif self._summary_future.done():
+                    # Commits with this batch, the document has its title before the parse ends
+                    self._join_summary()
+
+            document.reference = processor.reference_data
+            document.pages_parsed = processor.pages_processed
+            document.page_count = processor.document_page_count
+            self.progress.advance(processor.pages_processed / processor.document_page_count, save=False)
+            checkpoint.reference_data = processor.reference_data
+            checkpoint.pages_processed = processor.pages_processed
+            checkpoint.text_pages += processor.text_page_count
+
+            # A batch, the document state that exposes it and the checkpoint commit together
+            with transaction.atomic():
+                self._store_sections(sections)
+                checkpoint.save()
+                document.save()
+
+            if all_sections is not None:
+                all_sections.extend(sections)
+
+        if all_sections is not None:
+            processor.parse_cache.put(
+                checkpoint.content_hash, processor.parser_version, all_sections,
+                processor.reference_data, checkpoint.text_pages
+            )
+        self._advance('parse', total_pages=checkpoint.text_pages)
+
+    def _references(self) -> None:
+        self.document.reference = self.checkpoint.reference_data or {}
+        self._advance('references')
+
+    def _summary(self) -> None:
+        if self._summary_future is not None:
+            # Store the sections while the summary is generated, then wait for it
+            self.progress.start_stage('persist')
+            self._store_remaining_sections()
+            self.progress.start_stage('summary')
+            self._join_summary()
+        elif self.checkpoint.summary is None:
+            sections = self.checkpoint.sections or []
+            if sections:
+                self._summarize(sections)
+            else:
+                # Nothing to summarise, record that the stage ran
+                self.checkpoint.summary = {}
+        self._advance('summary')
+
+    def _start_summary(self) -> None:
+        """Start generating the summary in a thread when its input is available and it is not running or done"""
+        checkpoint = self.checkpoint
+        if self._summary_future is not None or checkpoint.summary is not None or checkpoint.completed('summary'):
+            return
+        if checkpoint.completed('parse') and checkpoint.sections:
+            sections = checkpoint.sections[:2]
+        elif checkpoint.pdf_path and os.path.exists(checkpoint.pdf_path):
+            sections = self.processor.leading_pages(checkpoint.pdf_path)
+        else:
+            # Parse cache hit, the cached sections are read by the parse stage
+            return
+        if not any(section['content'].get('text') for section in sections):
+            # Scanned first pages, the summary stage uses the parsed sections
+            return
+        self._summary_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'summary-{self.document.id}')
+        self._summary_future = self._summary_executor.submit(self._generate_summary_in_thread, sections)
+
+    def _join_summary(self) -> None:
+        """Wait for the summary started by _start_summary and apply it, raises what the LLM call raised"""
+        future, self._summary_future = self._summary_future, None
+        self._apply_summary(future.result())
+
+    def _generate_summary_in_thread(self, sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+        try:
+            return self._generate_summary(sections)
+        finally:
+            # The thread's own connection
+            connection.close()
+
+    def _summarize(self, sections: List[Dict[str, Any]]) -> None:
+        """Generate the metadata from the first sections onto the document and the checkpoint"""
+        self._apply_summary(self._generate_summary(sections))
+
+    def _generate_summary(self, sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+        if self._summarizer is None:
+            self._summarizer = DocumentSummarizer()
+        return self._summarizer.generate_summary(sections[:2], self.document.id)
+
+    def _apply_summary(self, metadata: Dict[str, Any]) -> None:
+        for field, value in metadata.items():
+            setattr(self.document, field, value)
+        self.checkpoint.summary = metadata
+
+    def _persist(self) -> None:
+        self._store_remaining_sections()
+        self._advance('persist')
+
+    def _store_remaining_sections(self) -> None:
+        """Store the parsed sections not stored yet, each batch committed with the count stored"""
+        checkpoint = self.checkpoint
+        # Batched documents stored their sections during the parse stage
+        sections = checkpoint.sections or []
+        while checkpoint.sections_persisted < len(sections):
+            batch = sections[checkpoint.sections_persisted:checkpoint.sections_persisted + self.section_batch_size]
+            with transaction.atomic():
+                self._store_sections(batch)
+                self.progress.advance(checkpoint.sections_persisted / len(sections), save=False)
+                checkpoint.save()
+                self.document.save()
+
+    def _store_sections(self, sections: List[Dict[str, Any]]) -> None:
+        """Store one batch of processed sections with bulk INSERTs, call inside a transaction"""
+        rows = []
+        for section_data in sections:
+            section = DocumentSection(
+                document=self.document,
+                section_type=section_data['content'].get('type', 'text'),
+                content=section_data['content'].get('text', ''),
+                section_start_page_number=int(section_data['section_start_page_number']),
+                section_end_page_number=section_data.get('section_end_page_number'),
+                section_index=section_data.get('section_index'),
+                title=(section_data.get('title') or '')[:500] or None,
+                has_citations=bool(section_data['content'].get('has_citations', False)),
+                citations=section_data.get('citations', {})
+            )
+
+            # Tables and images are resolved before insert so each row is written once
+            if 'elements' in section_data:
+                section.set_elements(section_data['elements'])
+            rows.append(section)
+
+        DocumentSection.objects.bulk_create(rows, batch_size=self.section_batch_size)
+        self.checkpoint.sections_persisted += len(rows)
+        if rows:
+            self.document.is_searchable = True
+
+    def _complete(self) -> None:
+        document = self.document
+        document.processing_status = 'completed'
+        document.processing_stage = 'completed'
+        document.processing_progress = 1.0
+        document.is_searchable = True
+        document.total_pages = self.checkpoint.total_pages
+        with transaction.atomic():
+            document.save()
+            IngestCheckpoint.objects.filter(id=self.checkpoint.id).delete()
+        self._discard_pdf()
+        self._report_normalization()
+
+    def _report_normalization(self) -> None:
+        """Log the tokens text normalization saved on the pages this run parsed, once per document"""
+        stats = self.processor.normalization_stats.to_dict()
+        if not stats['tokens_before']:
+            # Parse cache hit or the parse finished in an earlier run
+            return
+        logger.info(
+            f"Ingest of {self.document.id}: normalization saved {stats['tokens_saved']} of "
+            f"{stats['tokens_before']} tokens ({stats['saved_percent']}%, {stats['lines_removed']} "
+            f"boilerplate lines, {stats['words_joined']} hyphenated words)"
+        )
+
+    def _discard_pdf(self) -> None:
+        """Remove the checkpointed PDF unless another ingest of the same file still needs it"""
+        pdf_path = self.checkpoint.pdf_path
+        if not pdf_path or IngestCheckpoint.objects.filter(pdf_path=pdf_path).exists():
+            return
+        try:
+            os.unlink(pdf_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove checkpointed PDF {pdf_path}: {str(e)}")
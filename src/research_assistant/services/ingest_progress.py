@@ -0,0 +1,109 @@
+# src/research_assistant/services/ingest_progress.py
+
+import logging
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from ..models import DocumentMetadata
+
+logger = logging.getLogger(__name__)
+
+# Share of the overall progress each ingest stage covers, parsing dominates the run time
+STAGE_SPANS = {
+    'download': (0.0, 0.05),
+    'parse': (0.05, 0.85),
+    'references': (0.85, 0.87),
+    'summary': (0.87, 0.95),
+    'persist': (0.95, 1.0),
+}
+# Progress within a stage is written at most this often, stage changes are written at once
+MIN_WRITE_INTERVAL_SECONDS = 2.0
+# Bounds of the poll interval suggested to clients
+POLL_MIN_SECONDS = 2
+POLL_MAX_SECONDS = 30
+
+PROGRESS_FIELDS = ['processing_stage', 'processing_progress', 'pages_parsed', 'page_count', 'updated_at']
+
+
+class ProgressReporter:
+    """
+    Publish an ingest's progress on its DocumentMetadata.
+
+    Stages map onto STAGE_SPANS of processing_progress, work inside a stage
+    (bytes downloaded, pages parsed, sections stored) moves progress through
+    its span. Writes only touch the progress fields with update_fields and,
+    within a stage, happen at most every min_interval seconds, so a parse
+    reporting every page costs a handful of UPDATEs per document.
+
+    Progress never goes backwards: a resumed ingest restarts its stage's
+    span at wherever the last run got to.
+    """
+
+    def __init__(self, document: DocumentMetadata, min_interval: float = None):
+        self.document = document
+        if min_interval is None:
+            min_interval = getattr(settings, 'PROCESSING_SETTINGS', {}).get(
+                'PROGRESS_MIN_INTERVAL_SECONDS', MIN_WRITE_INTERVAL_SECONDS
+            )
+        self.min_interval = min_interval
+        self.stage = None
+        self._last_write = 0.0
+
+    def start_stage(self, stage: str) -> None:
+        """Enter stage, written immediately"""
+        self.stage = stage
+        self.document.processing_stage = stage
+        self._set_progress(STAGE_SPANS[stage][0])
+        self._write()
+
+    def advance(self, fraction: float, save: bool = True) -> None:
+        """
+        Move to fraction (0-1) of the current stage's span, save=False when the
+        caller is about to save the document anyway
+        """
+        start, end = STAGE_SPANS[self.stage]
+        self._set_progress(start + (end - start) * min(max(fraction, 0.0), 1.0))
+        if save and time.monotonic() - self._last_write >= self.min_interval:
+            self._write()
+
+    def pages(self, pages_parsed: int, page_count: int) -> None:
+        """Parser callback, pages_parsed of page_count pages have been extracted"""
+        self.document.pages_parsed = max(self.document.pages_parsed or 0, pages_parsed)
+        self.document.page_count = page_count
+        if page_count:
+            self.advance(self.document.pages_parsed / page_count)
+
+    def download_bytes(self, bytes_read: int, total_bytes: Optional[int]) -> None:
+        """Downloader callback, only moves progress when the size is known"""
+        if total_bytes:
+            self.advance(bytes_read / total_bytes)
+
+    def _set_progress(self, progress: float) -> None:
+        self.document.processing_progress = max(self.document.processing_progress or 0.0, progress)
+
+    def _write(self) -> None:
+        self._last_write = time.monotonic()
+        self.document.save(update_fields=PROGRESS_FIELDS)
+
+
+def suggest_poll_seconds(document: DocumentMetadata, wait_seconds: Optional[float] = None) -> Optional[int]:
+    """
+    Seconds a client should wait before polling the document again, from the
+    time left at its rate so far, or None once it is completed or failed.
+    wait_seconds is the estimated wait of a document still queued for a worker.
+    """
+    if document.processing_status not in ('pending', 'processing'):
+        return None
+    if wait_seconds is not None:
+        return int(min(max(wait_seconds / 2, POLL_MIN_SECONDS), POLL_MAX_SECONDS))
+    progress = document.processing_progress or 0.0
+    started = document.processing_started_at
+    if not started or progress <= 0:
+        return POLL_MIN_SECONDS
+    elapsed = (timezone.now() - started).total_seconds()
+    remaining = elapsed * (1 - progress) / progress
+    # A few polls over the expected remaining time
+    return int(min(max(remaining / 4, POLL_MIN_SECONDS), POLL_MAX_SECONDS))
@@ -0,0 +1,206 @@
+# src/research_assistant/services/job_handlers.py
+
+import logging
+from decimal import Decimal
+from typing import Any, Dict
+
+from django.contrib.auth.models import User
+
+from ..models import AIAPIUsage, DocumentMetadata, DocumentSection, LiteratureReview, SearchResult
+from .ingest_pipeline import IngestPipeline
+from .literature_extractor import LiteratureExtractor
+from .search.search_manager import SearchManager
+
+logger = logging.getLogger(__name__)
+
+# Handlers run by JobWorker, one per job kind in job_queue.JOB_HANDLERS.
+# Each takes the job payload, records failures on its own model and
+# re-raises them, so the worker retries or fails the job.
+
+
+def ingest_document(payload: Dict[str, Any]) -> None:
+    """Ingest an uploaded document, payload: document_id, file_id"""
+    document_id = payload['document_id']
+    pipeline = None
+    try:
+        document = DocumentMetadata.objects.get(id=document_id)
+        logger.info(f"Starting processing of {document.file_name}")
+
+        # Stages are checkpointed, a job requeued after its worker died
+        # continues after the last completed stage
+        pipeline = IngestPipeline(document, file_id=payload.get('file_id'))
+        pipeline.run()
+        logger.info(f"Completed processing document: {document.id}")
+
+    except DocumentMetadata.DoesNotExist:
+        logger.info(f"Document {document_id} was deleted before processing")
+    except Exception as e:
+        logger.error(f"Error processing document {document_id}: {str(e)}")
+        if pipeline is None:
+            DocumentMetadata.objects.filter(id=document_id).update(
+                processing_status='failed',
+                error_message=str(e),
+                is_searchable=False
+            )
+        else:
+            pipeline.fail(e)
+        raise
+
+
+def run_search(payload: Dict[str, Any]) -> None:
+    """Search one document for a pending SearchResult, payload: search_id"""
+    search_id = payload['search_id']
+    try:
+        search_result = SearchResult.objects.select_related('document', 'user').get(id=search_id)
+    except SearchResult.DoesNotExist:
+        logger.info(f"Search {search_id} was removed before processing")
+        return
+
+    document = search_result.document
+    user = search_result.user
+    context = search_result.query_context
+    try:
+        logger.info(f"Processing search {search_id} for document: {document.file_name}")
+        search_result.processing_status = 'processing'
+        search_result.save()
+
+        search_data = [{
+            'file_name': document.file_name,
+            'context': context,
+            'keywords': search_result.keywords,
+            'user': user
+        }]
+        results = SearchManager().search_documents(
+            search_data=search_data,
+            context=context,
+            keywords=search_result.keywords,
+            user=user
+        )
+
+        if 'api_usage' in results:
+            _store_api_usage(results['api_usage'], search_result, document, user, context)
+
+        for result in results.get('results', []):
+            if str(result['document_id']) == str(document.id):
+                search_result.matching_sections = result['matching_sections']
+                search_result.relevance_score = result['relevance_score']
+                search_result.processing_status = 'completed'
+                search_result.save()
+                break
+
+        logger.info(f"Completed search {search_id}")
+
+    except Exception as e:
+        logger.error(f"Error processing search {search_id}: {str(e)}")
+        SearchResult.objects.filter(id=search_id).update(processing_status='failed', error_message=str(e))
+        raise
+
+
+def _store_api_usage(usage_data, search_result, document, user, context) -> None:
+    """An aggregated AIAPIUsage record for the search plus one per API call"""
+    AIAPIUsage.objects.create(
+        user=user,
+        search_result=search_result,
+        document=document,
+        model_name="multiple",  # Will be a mix of models
+        prompt=context[:1000],  # Store a truncated version of prompt
+        prompt_tokens=sum(usage['prompt_tokens'] for usage in usage_data['details']),
+        completion_tokens=sum(usage['completion_tokens'] for usage in usage_data['details']),
+        total_tokens=usage_data['tokens'],
+        total_cost=Decimal(str(usage_data['cost'])),
+        is_aggregated=True,
+        api_calls_count=usage_data['calls'],
+        start_time=min(usage['start_time'] for usage in usage_data['details'] if 'start_time' in usage),
+        end_time=max(usage['end_time'] for usage in usage_data['details'] if 'end_time' in usage)
+    )
+
+    for usage in usage_data['details']:
+        try:
+            AIAPIUsage.objects.create(
+                user=user,
+                search_result=search_result,
+                document=DocumentMetadata.objects.get(id=usage['document_id']) if 'document_id' in usage else None,
+                model_name=usage['model_name'],
+                prompt=usage['prompt'][:1000],  # Truncate prompt
+                prompt_tokens=usage['prompt_tokens'],
+                completion_tokens=usage['completion_tokens'],
+                total_tokens=usage['total_tokens'],
+                cost_per_1k_prompt_tokens=Decimal(str(usage['cost_per_1k_prompt_tokens'])),
+                cost_per_1k_completion_tokens=Decimal(str(usage['cost_per_1k_completion_tokens'])),
+                total_cost=Decimal(str(usage['total_cost'])),
+                start_time=usage['start_time'],
+                end_time=usage['end_time'],
+                duration_ms=usage['duration_ms'],
+                is_aggregated=False
+            )
+        except Exception as e:
+            logger.error(f"Error storing API usage record: {str(e)}")
+
+
+def extract_literature_review(payload: Dict[str, Any]) -> None:
+    """Extract the literature review of a document, payload: document_id, user_id"""
+    document_id = payload['document_id']
+    try:
+        logger.info(f"Starting literature review extraction for: {document_id}")
+        document = DocumentMetadata.objects.get(id=document_id)
+        user = User.objects.get(id=payload['user_id'])
+
+        if LiteratureReview.objects.filter(document=document, processing_status='completed').exists():
+            logger.info(f"Literature review already exists for: {document_id}")
+            return
+
+        literature_review, created = LiteratureReview.objects.get_or_create(
+            document=document,
+            user=user,
+            defaults={
+                'processing_status': 'processing'
+            }
+        )
+        if not created:
+            literature_review.processing_status = 'processing'
+            literature_review.save()
+
+        sections = list(
+            DocumentSection.objects.filter(document=document).order_by('section_start_page_number', 'section_index')
+        )
+        if not sections:
+            raise ValueError("Document has no sections to analyze")
+
+        extraction_result = LiteratureExtractor().extract_literature_review(
+            document_id=str(document.id),
+            sections=sections,
+            reference_data=document.reference or {}
+        )
+
+        if extraction_result.get('status') == 'success':
+            extraction_data = extraction_result.get('extraction_data', {})
+
+            literature_review.research_area = extraction_data.get('research_area', '')
+            literature_review.themes = extraction_data.get('themes', [])
+            literature_review.chronological_development = extraction_data.get('chronological_development')
+            literature_review.theoretical_frameworks = extraction_data.get('theoretical_frameworks')
+            literature_review.methodological_approaches = extraction_data.get('methodological_approaches', {})
+            literature_review.key_findings = extraction_data.get('key_findings', [])
+            literature_review.method_strengths = extraction_data.get('method_strengths', [])
+            literature_review.method_limitations = extraction_data.get('method_limitations', [])
+            literature_review.result_strengths = extraction_data.get('result_strengths', [])
+            literature_review.result_weaknesses = extraction_data.get('result_weaknesses', [])
+            literature_review.potential_biases = extraction_data.get('potential_biases', [])
+
+            literature_review.extraction_time = extraction_result.get('processing_time', 0)
+            literature_review.processing_status = 'completed'
+            literature_review.save()
+            logger.info(f"Successfully extracted literature review for: {document_id}")
+        else:
+            literature_review.processing_status = 'failed'
+            literature_review.error_message = extraction_result.get('error_message', 'Unknown error during extraction')
+            literature_review.save()
+            logger.info(f"Failed to extract literature review for: {document_id}")
+
+    except Exception as e:
+        logger.error(f"Error processing literature review for {document_id}: {str(e)}")
+        LiteratureReview.objects.filter(document_id=document_id).update(
+            processing_status='failed',
+            error_message=str(e)
+        )
+        raise
@@ -0,0 +1,403 @@
+# src/research_assistant/services/job_queue.py
+
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+import uuid
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from ..models import DocumentMetadata, Job, LiteratureReview, SearchResult
+from .concurrency import LeaseSemaphore, available, concurrency_limit
+
+logger = logging.getLogger(__name__)
+
+# Job kind -> handler taking the payload, imported by the worker only so
+# the web processes that enqueue never load the parsing and LLM stacks
+JOB_HANDLERS = {
+    'ingest': 'research_assistant.services.job_handlers.ingest_document',
+    'search': 'research_assistant.services.job_handlers.run_search',
+    'literature_review': 'research_assistant.services.job_handlers.extract_literature_review',
+}
+
+# Worker processes run_workers starts without PROCESSING_SETTINGS JOB_WORKERS
+JOB_WORKERS = 2
+# Seconds between polls of an empty queue
+POLL_INTERVAL_SECONDS = 1.0
+# A running job's heartbeat is refreshed this often
+HEARTBEAT_SECONDS = 30
+# and a job without a heartbeat for this long lost its worker
+JOB_STALE_SECONDS = 300
+# A failed job is queued again after this many seconds, doubled on each further attempt
+RETRY_BACKOFF_SECONDS = 30
+# Queued jobs of one kind beyond which new work is turned away
+QUEUE_MAX_PENDING = 100
+# Assumed run time of a job before any of its kind completed
+DEFAULT_JOB_SECONDS = 30
+# Completed jobs averaged for the run time estimate
+DURATION_SAMPLE = 20
+
+
+def _queue_settings() -> Dict[str, Any]:
+    return getattr(settings, 'PROCESSING_SETTINGS', {})
+
+
+def enqueue(kind: str, payload: Dict[str, Any], document: DocumentMetadata = None, run_after=None) -> Job:
+    """
+    Queue a job, the only thing the web processes do with background work.
+
+    Inside a transaction the job becomes visible to workers on commit, so
+    a worker never picks up a job for rows that were rolled back.
+    """
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind '{kind}'")
+    return Job.objects.create(
+        kind=kind,
+        payload=payload,
+        document=document,
+        run_after=run_after or timezone.now()
+    )
+
+
+def queue_position(job: Job) -> int:
+    """
+    1 for the next job of its kind a worker will claim, 0 once the job is no
+    longer queued. Jobs of other kinds run under their own concurrency
+    limits and do not count.
+    """
+    if job.status != 'queued':
+        return 0
+    ahead = Job.objects.filter(kind=job.kind, status='queued').filter(
+        Q(run_after__lt=job.run_after) | Q(run_after=job.run_after, created_at__lt=job.created_at)
+    )
+    return ahead.count() + 1
+
+
+def queue_positions(kind: str, job_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, int]:
+    """queue_position of several queued jobs of kind in one query, jobs no longer queued are left out"""
+    wanted = set(job_ids)
+    if not wanted:
+        return {}
+    positions = {}
+    queued = Job.objects.filter(kind=kind, status='queued').order_by('run_after', 'created_at')
+    for position, job_id in enumerate(queued.values_list('id', flat=True).iterator(), start=1):
+        if job_id in wanted:
+            positions[job_id] = position
+            if len(positions) == len(wanted):
+                break
+    return positions
+
+
+def queued_count(kind: str) -> int:
+    return Job.objects.filter(kind=kind, status='queued').count()
+
+
+def admission_retry_after(kind: str, incoming: int = 1) -> Optional[int]:
+    """
+    None when incoming more jobs of kind fit under JOB_QUEUE_MAX_PENDING,
+    otherwise the seconds until the workers have taken enough to make room
+    """
+    limit = _queue_settings().get('JOB_QUEUE_MAX_PENDING', QUEUE_MAX_PENDING)
+    excess = queued_count(kind) + incoming - limit
+    if excess <= 0:
+        return None
+    return estimate_wait_seconds(kind, jobs_ahead=excess)
+
+
+def average_job_seconds(kind: str) -> float:
+    """
+    Average run time of recent jobs of kind that succeeded, DEFAULT_JOB_SECONDS
+    before there are any. Failures end early and would make waits look short:
+    failed jobs are left out, and so are completed ones whose document failed.
+    """
+    recent = (
+        Job.objects.filter(kind=kind, status='completed', locked_at__isnull=False)
+        .exclude(document__processing_status='failed')
+        .order_by('-updated_at')
+    )
+    durations = [
+        (updated_at - locked_at).total_seconds()
+        for locked_at, updated_at in recent.values_list('locked_at', 'updated_at')[:DURATION_SAMPLE]
+    ]
+    return sum(durations) / len(durations) if durations else DEFAULT_JOB_SECONDS
+
+
+def estimate_wait_seconds(kind: str, jobs_ahead: int = None, job_seconds: float = None) -> int:
+    """
+    Seconds until the workers have taken jobs_ahead queued jobs of kind
+    (default: all of them), from the average run time of recently completed
+    jobs spread over the configured workers. Callers estimating for many
+    jobs pass job_seconds from one average_job_seconds call.
+    """
+    if jobs_ahead is None:
+        jobs_ahead = queued_count(kind)
+    if jobs_ahead <= 0:
+        return 0
+    if job_seconds is None:
+        job_seconds = average_job_seconds(kind)
+    # Jobs of one kind run no wider than its concurrency limit, whatever the worker count
+    workers = max(1, min(_queue_settings().get('JOB_WORKERS', JOB_WORKERS), concurrency_limit(kind)))
+    return max(1, int(job_seconds * jobs_ahead / workers))
+
+
+def has_active_job(kind: str, document: DocumentMetadata) -> bool:
+    """Whether a job of kind is queued or running for document"""
+    return Job.objects.filter(kind=kind, document=document, status__in=Job.ACTIVE_STATUSES).exists()
+
+
+def claim_next(worker_id: str, kinds: Iterable[str] = None) -> Optional[Job]:
+    """
+    Claim the oldest runnable job for worker_id, None when the queue is empty.
+
+    On PostgreSQL the candidate row is locked with SELECT ... FOR UPDATE SKIP
+    LOCKED, so concurrent workers each get a different job without waiting.
+    Backends without row locks (SQLite) fall back to the conditional UPDATE
+    below, which still lets only one worker win a given job.
+    """
+    jobs = Job.objects.filter(status='queued', run_after__lte=timezone.now())
+    if kinds:
+        jobs = jobs.filter(kind__in=list(kinds))
+    skip_locked = connection.features.has_select_for_update_skip_locked
+
+    for _ in range(5):
+        with transaction.atomic():
+            candidates = jobs.order_by('run_after', 'created_at')
+            if skip_locked:
+                candidates = candidates.select_for_update(skip_locked=True)
+            job = candidates.first()
+            if job is None:
+                return None
+
+            now = timezone.now()
+            claimed = Job.objects.filter(id=job.id, status='queued').update(
+                status='running',
+                attempts=job.attempts + 1,
+                locked_by=worker_id,
+                locked_at=now,
+                heartbeat_at=now,
+                updated_at=now
+            )
+        if claimed:
+            job.refresh_from_db()
+            return job
+        # Another worker took it between the read and the update
+    return None
+
+
+def requeue_stale_jobs(stale_after_seconds: int = None) -> int:
+    """
+    Queue again the running jobs whose worker stopped sending heartbeats, or
+    fail them once they used up max_attempts. Returns the jobs requeued.
+    """
+    if stale_after_seconds is None:
+        stale_after_seconds = _queue_settings().get('JOB_STALE_SECONDS', JOB_STALE_SECONDS)
+    cutoff = timezone.now() - timedelta(seconds=stale_after_seconds)
+    stale = Job.objects.filter(status='running', heartbeat_at__lt=cutoff)
+
+    requeued = 0
+    for job in stale:
+        if job.attempts >= job.max_attempts:
+            error_message = f"Worker {job.locked_by} stopped responding, gave up after {job.attempts} attempts"
+            updated = Job.objects.filter(id=job.id, status='running', heartbeat_at=job.heartbeat_at).update(
+                status='failed',
+                error_message=error_message,
+                updated_at=timezone.now()
+            )
+            if updated:
+                _fail_subject(job, error_message)
+            continue
+        requeued += Job.objects.filter(id=job.id, status='running', heartbeat_at=job.heartbeat_at).update(
+            status='queued',
+            locked_by=None,
+            locked_at=None,
+            run_after=timezone.now(),
+            updated_at=timezone.now()
+        )
+        logger.warning(f"Requeued {job.kind} job {job.id}, worker {job.locked_by} stopped responding")
+    return requeued
+
+
+def _retry_subject(job: Job) -> None:
+    """What a job failed on goes back to pending while the job waits for its next attempt"""
+    if job.kind == 'ingest':
+        DocumentMetadata.objects.filter(id=job.document_id, processing_status='failed').update(
+            processing_status='pending', error_message=None, updated_at=timezone.now()
+        )
+    elif job.kind == 'search':
+        SearchResult.objects.filter(id=job.payload.get('search_id'), processing_status='failed').update(
+            processing_status='pending', error_message=None
+        )
+    elif job.kind == 'literature_review':
+        LiteratureReview.objects.filter(document_id=job.document_id, processing_status='failed').update(
+            processing_status='pending', error_message=None
+        )
+
+
+def _fail_subject(job: Job, error_message: str) -> None:
+    """A failed job leaves what it worked on failed rather than pending forever"""
+    unfinished = ('pending', 'processing')
+    if job.kind == 'ingest':
+        DocumentMetadata.objects.filter(id=job.document_id, processing_status__in=unfinished).update(
+            processing_status='failed', error_message=error_message, updated_at=timezone.now()
+        )
+    elif job.kind == 'search':
+        SearchResult.objects.filter(id=job.payload.get('search_id'), processing_status__in=unfinished).update(
+            processing_status='failed', error_message=error_message
+        )
+    elif job.kind == 'literature_review':
+        LiteratureReview.objects.filter(document_id=job.document_id, processing_status__in=unfinished).update(
+            processing_status='failed', error_message=error_message
+        )
+
+
+class JobWorker:
+    """
+    Run queued jobs one at a time until stopped.
+
+    A job runs while holding a slot of its kind's LeaseSemaphore, so
+    CONCURRENCY_LIMITS holds across every worker process and host, however
+    many run_workers processes there are.
+
+    A heartbeat thread refreshes the running job's heartbeat_at, so
+    requeue_stale_jobs can tell a long ingest from one whose process was
+    killed. SIGTERM and SIGINT let the current job finish before exiting.
+    Handlers record failures on their own models (the document, search
+    result or review) and re-raise them. A job whose handler raised is
+    queued again with a growing delay until it used up max_attempts, then
+    marked failed.
+    """
+
+    def __init__(self, worker_id: str = None, kinds: Iterable[str] = None, poll_interval: float = None):
+        queue_settings = _queue_settings()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.kinds = list(kinds) if kinds else None
+        self.poll_interval = poll_interval or queue_settings.get('JOB_POLL_INTERVAL_SECONDS', POLL_INTERVAL_SECONDS)
+        self.heartbeat_seconds = queue_settings.get('JOB_HEARTBEAT_SECONDS', HEARTBEAT_SECONDS)
+        self.stale_after_seconds = queue_settings.get('JOB_STALE_SECONDS', JOB_STALE_SECONDS)
+        self.retry_backoff_seconds = queue_settings.get('JOB_RETRY_BACKOFF_SECONDS', RETRY_BACKOFF_SECONDS)
+        self.stopping = False
+        self._last_reap = None
+
+    def install_signal_handlers(self) -> None:
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+    def _stop(self, signum, frame) -> None:
+        logger.info(f"Worker {self.worker_id} stopping after the current job")
+        self.stopping = True
+
+    def run(self, drain: bool = False) -> int:
+        """Process jobs until stopped, or until the queue is empty with drain. Returns the jobs run"""
+        processed = 0
+        while not self.stopping:
+            close_old_connections()
+            try:
+                self._reap_stale()
+                # Only kinds whose workload class has a free slot anywhere
+                kinds = available(self.kinds or Job.KINDS)
+                job = claim_next(self.worker_id, kinds) if kinds else None
+                lease = self._lease(job) if job is not None else None
+            except DatabaseError as e:
+                # A dropped connection or, on SQLite, another writer holding the lock
+                logger.warning(f"Worker {self.worker_id} could not claim a job: {str(e)}")
+                time.sleep(self.poll_interval)
+                continue
+            if lease is None:
+                if drain and not self._runnable_jobs():
+                    break
+                time.sleep(self.poll_interval)
+                continue
+            self.execute(job, lease)
+            processed += 1
+        return processed
+
+    def _lease(self, job: Job) -> Optional[LeaseSemaphore]:
+        """A slot of the job's workload class, or None with the job handed back to the queue"""
+        lease = LeaseSemaphore(job.kind, holder=f"{self.worker_id}:{job.id}")
+        if lease.try_acquire():
+            return lease
+        # Another process took the last slot after the availability check
+        Job.objects.filter(id=job.id, locked_by=self.worker_id, status='running').update(
+            status='queued',
+            attempts=F('attempts') - 1,
+            locked_by=None,
+            locked_at=None,
+            updated_at=timezone.now()
+        )
+        return None
+
+    def _runnable_jobs(self) -> bool:
+        jobs = Job.objects.filter(status='queued', run_after__lte=timezone.now())
+        if self.kinds:
+            jobs = jobs.filter(kind__in=self.kinds)
+        return jobs.exists()
+
+    def _reap_stale(self) -> None:
+        """Requeue abandoned jobs, at most once per stale period from each worker"""
+        now = time.monotonic()
+        if self._last_reap is not None and now - self._last_reap < self.stale_after_seconds / 2:
+            return
+        self._last_reap = now
+        requeue_stale_jobs(self.stale_after_seconds)
+
+    def execute(self, job: Job, lease: LeaseSemaphore) -> None:
+        logger.info(f"Worker {self.worker_id} running {job.kind} job {job.id} (attempt {job.attempts})")
+        done = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job, done), daemon=True)
+        heartbeat.start()
+        try:
+            with lease.hold():
+                import_string(JOB_HANDLERS[job.kind])(job.payload)
+        except Exception as e:
+            logger.exception(f"{job.kind} job {job.id} failed (attempt {job.attempts} of {job.max_attempts})")
+            if job.attempts < job.max_attempts:
+                self._retry(job, str(e))
+            elif self._finish(job, 'failed', str(e)):
+                _fail_subject(job, str(e))
+        else:
+            self._finish(job, 'completed')
+        finally:
+            done.set()
+            heartbeat.join()
+
+    def _retry(self, job: Job, error_message: str) -> None:
+        delay = self.retry_backoff_seconds * 2 ** (job.attempts - 1)
+        now = timezone.now()
+        requeued = Job.objects.filter(id=job.id, locked_by=self.worker_id, status='running').update(
+            status='queued',
+            locked_by=None,
+            locked_at=None,
+            run_after=now + timedelta(seconds=delay),
+            error_message=error_message,
+            updated_at=now
+        )
+        if requeued:
+            _retry_subject(job)
+            logger.warning(f"Retrying {job.kind} job {job.id} in {delay} seconds")
+
+    def _finish(self, job: Job, status: str, error_message: str = None) -> bool:
+        # Only while this worker still holds the job, a requeued one belongs to someone else
+        return Job.objects.filter(id=job.id, locked_by=self.worker_id, status='running').update(
+            status=status,
+            error_message=error_message,
+            updated_at=timezone.now()
+        ) == 1
+
+    def _heartbeat(self, job: Job, done: threading.Event) -> None:
+        try:
+            while not done.wait(self.heartbeat_seconds):
+                Job.objects.filter(id=job.id, locked_by=self.worker_id, status='running').update(
+                    heartbeat_at=timezone.now()
+                )
+        finally:
+            # The thread's own connection
+            connection.close()
@@ -477,6 +477,8 @@ import re
 import time
 import logging
 from .document_processor import DocumentProcessor
+from .citation_scanner import extract_citations
+from .reference_index import ReferenceIndex
 
 # Define Pydantic model for structured data extraction
 class KeyQuote(BaseModel):
@@ -836,43 +838,22 @@ class LiteratureExtractor:
         for section in sections:
             # Access attributes directly on the model instance
             page_num = section.section_start_page_number
+            end_page_num = section.section_end_page_number or page_num
             content = section.content
             
             if content:
-                combined_text += f"\n\n--- START PAGE {page_num} ---\n\n{content} \n\n--- END PAGE {page_num} ---\n\n"
+                combined_text += f"\n\n--- START PAGE {page_num} ---\n\n{content} \n\n--- END PAGE {end_page_num} ---\n\n"
         
         return combined_text
 
-    def _extract_citations(self, text: str, reference_data: Dict[str, Any]) -> Dict:
+    def _extract_citations(
+        self, text: str, reference_data: Dict[str, Any], reference_index: ReferenceIndex = None
+    ) -> Dict:
         """Extract citations from text using the same approach as document_searcher"""
         try:
-            # Use the existing citation extraction pattern
-            cleaned_text = re.sub(r'\s+', ' ', text).strip()
-            
-            # First handle numbered citations
-            citation_data = None
-            for match in re.finditer(r'\[(\d+(?:,\s*\d+)*)\]', cleaned_text):
-                citation_text = match.group(0)
-                ref_numbers = [num.strip() for num in match.group(1).split(',')]
-                
-                citation_data = {
-                    'text': citation_text,
-                    'type': 'numbered',
-                    'position': match.span(),
-                    'ref_numbers': ref_numbers,
-                    'references': []
-                }
-                
-                # Match references
-                if reference_data and 'entries' in reference_data:
-                    for ref_num in ref_numbers:
-                        if ref_num in reference_data['entries']:
-                            citation_data['references'].append(
-                                reference_data['entries'][ref_num]
-                            )
-                break  # Just get the first citation for now
-                
-            return citation_data
+            # Just get the first citation for now, of any style
+            citations = extract_citations(text, reference_data, limit=1, reference_index=reference_index)
+            return citations[0] if citations else None
         except Exception as e:
             print(f"[LiteratureExtractor] Citation extraction error: {str(e)}")
             return None
@@ -959,17 +940,18 @@ class LiteratureExtractor:
                 print("[LiteratureExtractor] Successfully parsed JSON response")
                 
                 # Post-process to add citation data
+                reference_index = ReferenceIndex(reference_data)
                 if 'methodological_approaches' in extracted_data and 'key_quotes' in extracted_data['methodological_approaches']:
                     for quote in extracted_data['methodological_approaches']['key_quotes']:
                         if 'text' in quote and not quote.get('citation_data'):
-                            quote['citation_data'] = self._extract_citations(quote['text'], reference_data)
+                            quote['citation_data'] = self._extract_citations(quote['text'], reference_data, reference_index)
                 
                 if 'key_findings' in extracted_data:
                     for finding in extracted_data['key_findings']:
                         if 'key_quotes' in finding:
                             for quote in finding['key_quotes']:
                                 if 'text' in quote and not quote.get('citation_data'):
-                                    quote['citation_data'] = self._extract_citations(quote['text'], reference_data)
+                                    quote['citation_data'] = self._extract_citations(quote['text'], reference_data, reference_index)
                 
                 # Process other sections with key_quotes similarly
                 
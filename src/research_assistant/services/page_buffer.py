@@ -0,0 +1,109 @@
+# src/research_assistant/services/page_buffer.py
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Tuple
+
+# Pages are separated by a newline in the contiguous text
+PAGE_SEPARATOR = '\n'
+
+
+class PageRecord:
+    """A page's span in a PageBuffer's text"""
+    __slots__ = ('page_number', 'start', 'end')
+
+    def __init__(self, page_number: int, start: int, end: int):
+        self.page_number = page_number
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return f"PageRecord(page_number={self.page_number}, start={self.start}, end={self.end})"
+
+
+class PageBuffer(Mapping):
+    """
+    Page texts of a parse held in one string with per-page offsets.
+
+    Pages are appended in page order while parsing and joined into a single
+    string on first read, page numbers and offsets live in typed arrays, so a
+    document costs one string and three arrays instead of a str object per
+    page. Reads by page number return a slice of that page only. Stages that
+    work on parts of pages (the sectioner, the normaliser) keep offsets into
+    text and slice when they need the characters.
+
+    Behaves as a read-only Mapping of page number to text, so code written
+    for the former {page_number: text} dict keeps working.
+    """
+    __slots__ = ('_parts', '_length', '_text', '_numbers', '_starts', '_ends')
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._length = 0
+        self._text = ''
+        self._numbers = array('l')
+        self._starts = array('q')
+        self._ends = array('q')
+
+    def append(self, page_number: int, text: str) -> None:
+        """Add the next page, page numbers must increase"""
+        if self._numbers and page_number <= self._numbers[-1]:
+            raise ValueError(f"Page {page_number} appended after page {self._numbers[-1]}")
+        if self._text:
+            # Appending after a read, reopen the joined text
+            self._parts = [self._text]
+            self._text = ''
+        if self._numbers:
+            self._parts.append(PAGE_SEPARATOR)
+            self._length += len(PAGE_SEPARATOR)
+        self._numbers.append(page_number)
+        self._starts.append(self._length)
+        self._parts.append(text)
+        self._length += len(text)
+        self._ends.append(self._length)
+
+    @property
+    def text(self) -> str:
+        """All pages as one string, offsets from span() and records() index into it"""
+        if self._parts:
+            self._text = ''.join(self._parts)
+            self._parts = []
+        return self._text
+
+    def _index(self, page_number: int) -> int:
+        index = bisect_left(self._numbers, page_number)
+        if index == len(self._numbers) or self._numbers[index] != page_number:
+            raise KeyError(page_number)
+        return index
+
+    def span(self, page_number: int) -> Tuple[int, int]:
+        """(start, end) offsets of a page in text"""
+        index = self._index(page_number)
+        return self._starts[index], self._ends[index]
+
+    def records(self) -> Iterator[PageRecord]:
+        """Page number and offsets of every page, in page order"""
+        for page_number, start, end in zip(self._numbers, self._starts, self._ends):
+            yield PageRecord(page_number, start, end)
+
+    def to_dict(self) -> Dict[int, str]:
+        """Plain {page_number: text} copy, for JSON output"""
+        return dict(self.items())
+
+    def __getitem__(self, page_number: int) -> str:
+        index = self._index(page_number)
+        return self.text[self._starts[index]:self._ends[index]]
+
+    def __contains__(self, page_number) -> bool:
+        try:
+            self._index(page_number)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._numbers)
+
+    def __len__(self) -> int:
+        return len(self._numbers)
@@ -0,0 +1,145 @@
+# src/research_assistant/services/parse_cache.py
+
+import copy
+import json
+import logging
+import uuid
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from ..models import ParsedDocumentCache
+
+logger = logging.getLogger(__name__)
+
+# Default cap on the total size of cached parse results
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class ParseCache:
+    """
+    Content-addressed, size-bounded LRU cache of DocumentProcessor results.
+
+    Entries are keyed by the SHA-256 of the PDF bytes plus the parser version,
+    so the same file uploaded by different users is only parsed once. When the
+    total cached size exceeds max_bytes the least recently used entries are evicted.
+    """
+
+    def __init__(self, max_bytes: int = None, enabled: bool = None):
+        processing_settings = getattr(settings, 'PROCESSING_SETTINGS', {})
+        self.max_bytes = max_bytes if max_bytes is not None else processing_settings.get(
+            'PARSE_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES
+        )
+        self.enabled = enabled if enabled is not None else processing_settings.get(
+            'PARSE_CACHE_ENABLED', True
+        )
+
+    def contains(self, content_hash: str, parser_version: str) -> bool:
+        """Check for a cached result without touching its LRU position"""
+        if not self.enabled:
+            return False
+        try:
+            return ParsedDocumentCache.objects.filter(
+                content_hash=content_hash,
+                parser_version=parser_version
+            ).exists()
+        except Exception as e:
+            logger.warning(f"Parse cache lookup failed: {str(e)}")
+            return False
+
+    def get(self, content_hash: str, parser_version: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached parse result and mark it as recently used.
+
+        Returns:
+            Dict with 'sections', 'reference_data' and 'total_pages', or None on a miss
+        """
+        if not self.enabled:
+            return None
+        try:
+            entry = ParsedDocumentCache.objects.filter(
+                content_hash=content_hash,
+                parser_version=parser_version
+            ).first()
+            if entry is None:
+                return None
+
+            ParsedDocumentCache.objects.filter(id=entry.id).update(
+                hit_count=F('hit_count') + 1,
+                last_accessed_at=timezone.now()
+            )
+            logger.info(f"Parse cache hit for {content_hash[:12]} ({parser_version})")
+            return {
+                'sections': entry.sections,
+                'reference_data': entry.reference_data,
+                'total_pages': entry.total_pages
+            }
+        except Exception as e:
+            # The cache must never break ingest
+            logger.warning(f"Parse cache lookup failed: {str(e)}")
+            return None
+
+    def put(
+        self,
+        content_hash: str,
+        parser_version: str,
+        sections: List[Dict[str, Any]],
+        reference_data: Dict[str, Any],
+        total_pages: int
+    ) -> None:
+        """Store a parse result and evict least recently used entries over the size cap"""
+        if not self.enabled:
+            return
+        try:
+            size_bytes = len(json.dumps(sections, default=str)) + len(json.dumps(reference_data, default=str))
+            if size_bytes > self.max_bytes:
+                logger.info(f"Parse result for {content_hash[:12]} exceeds cache size cap, not cached")
+                return
+
+            ParsedDocumentCache.objects.create(
+                content_hash=content_hash,
+                parser_version=parser_version,
+                sections=sections,
+                reference_data=reference_data,
+                total_pages=total_pages,
+                size_bytes=size_bytes
+            )
+            self.evict()
+        except IntegrityError:
+            # Another worker stored the same document first
+            pass
+        except Exception as e:
+            logger.warning(f"Parse cache store failed: {str(e)}")
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        total = ParsedDocumentCache.objects.aggregate(total=Sum('size_bytes'))['total'] or 0
+        evicted = 0
+        if total <= self.max_bytes:
+            return evicted
+
+        for entry_id, size_bytes in ParsedDocumentCache.objects.order_by(
+            'last_accessed_at'
+        ).values_list('id', 'size_bytes').iterator():
+            ParsedDocumentCache.objects.filter(id=entry_id).delete()
+            total -= size_bytes
+            evicted += 1
+            if total <= self.max_bytes:
+                break
+
+        logger.info(f"Parse cache evicted {evicted} entries")
+        return evicted
+
+    @staticmethod
+    def rebind_sections(sections: List[Dict[str, Any]], document_id: str) -> List[Dict[str, Any]]:
+        """Copy cached sections and give them the ids of the document being ingested"""
+        rebound = copy.deepcopy(sections)
+        for section in rebound:
+            section['document_id'] = document_id
+            section['section_id'] = (
+                f"{document_id}_p{section['section_start_page_number']}_{uuid.uuid4().hex[:8]}"
+            )
+        return rebound
@@ -0,0 +1,268 @@
+# src/research_assistant/services/parse_pool.py
+
+import atexit
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Processes of a pool, each run_workers process has its own pool
+POOL_WORKERS = 1
+# Parses a pool process runs before it is replaced, so fragmentation and leaks
+# in the PDF libraries do not accumulate in a long-lived process
+MAX_TASKS_PER_CHILD = 20
+# A parse whose process grows past this is stopped, 0 disables the check
+RSS_LIMIT_MB = 2048
+RSS_CHECK_SECONDS = 0.5
+# Exit code of a pool process stopped for going over the limit
+RSS_EXIT_CODE = 70
+# A pool process notices within this many seconds that the process that started it died
+PARENT_CHECK_SECONDS = 1.0
+# Exit code of a pool process that outlived its parent
+ORPHAN_EXIT_CODE = 71
+# How long a caller whose pool process died waits for the process's last message
+LAST_MESSAGE_SECONDS = 1.0
+
+# Set in each pool process by _init_process
+_messages = None
+_rss_limit_bytes = 0
+
+
+class ParseMemoryError(RuntimeError):
+    """A parse went over PARSE_POOL_RSS_LIMIT_MB and its process was stopped"""
+
+
+def _current_rss_bytes() -> Optional[int]:
+    """Resident memory of this process, the peak where the current value is not available"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        pass
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _init_process(messages, rss_limit_bytes: int) -> None:
+    """Start of a pool process: set up Django and import the parsing stack once, so every task starts warm"""
+    global _messages, _rss_limit_bytes
+    _messages = messages
+    _rss_limit_bytes = rss_limit_bytes
+    # A worker killed outright (SIGKILL, the OOM killer) cannot shut its pool down,
+    # without this its pool processes would wait on the call queue forever
+    threading.Thread(target=_watch_parent, args=(os.getppid(),), daemon=True).start()
+
+    import django
+    django.setup()
+    # fitz, pdfplumber and the parser modules
+    from . import document_processor  # noqa: F401
+
+
+def _watch_parent(parent_pid: int) -> None:
+    """Exit once the process is re-parented, which happens when its parent died"""
+    while os.getppid() == parent_pid:
+        time.sleep(PARENT_CHECK_SECONDS)
+    os._exit(ORPHAN_EXIT_CODE)
+
+
+def _watch_rss(task_id: int, done: threading.Event) -> None:
+    """Stop the process when the running parse goes over the RSS limit"""
+    while not done.wait(RSS_CHECK_SECONDS):
+        rss = _current_rss_bytes()
+        if rss is not None and rss > _rss_limit_bytes:
+            _messages.put((task_id, 'rss', rss))
+            # Flush the message before the process disappears
+            _messages.close()
+            _messages.join_thread()
+            os._exit(RSS_EXIT_CODE)
+
+
+def _parse_task(
+    task_id: int,
+    state: Dict[str, Any],
+    pdf_path: str,
+    page_range: Optional[Tuple[int, int]]
+) -> Tuple[list, dict, Dict[str, Any]]:
+    """Run DocumentProcessor.process_document in a pool process, see ParsePool.run"""
+    from .document_processor import DocumentProcessor
+
+    processor = DocumentProcessor(document_id=state['document_id'], document_url=state['document_url'])
+    processor.load_pool_state(state)
+    processor.progress_callback = lambda page_number, page_count: _messages.put((task_id, page_number, page_count))
+
+    done = threading.Event()
+    if _rss_limit_bytes:
+        threading.Thread(target=_watch_rss, args=(task_id, done), daemon=True).start()
+    try:
+        sections, reference_data = processor.process_document(pdf_path=pdf_path, page_range=page_range)
+    finally:
+        done.set()
+    return sections, reference_data, processor.pool_state()
+
+
+class ParsePool:
+    """
+    Long-lived process pool for the CPU-bound parse stage.
+
+    Parsing holds the GIL for seconds at a time, in a separate process it
+    no longer stalls the threads of the process that drives the ingest
+    (job heartbeats, lease renewals, the LLM calls of other stages). Pool
+    processes are spawned, not forked, set up Django and import the parsing
+    stack once when they start, and are replaced after max_tasks_per_child
+    parses. A parse that grows past rss_limit_mb has its process stopped,
+    run raises ParseMemoryError and the pool is rebuilt on next use.
+
+    Page progress is relayed from the pool process to the caller's callback
+    over a queue the pool processes inherit. One reader thread hands each
+    message to the run call of its task, so threads can run parses on the
+    same pool at once. Pool processes exit on their own when the process
+    that owns the pool dies.
+    """
+
+    def __init__(self, workers: int = None, max_tasks_per_child: int = None, rss_limit_mb: int = None):
+        processing_settings = getattr(settings, 'PROCESSING_SETTINGS', {})
+        self.workers = workers or processing_settings.get('PARSE_POOL_WORKERS', POOL_WORKERS)
+        self.max_tasks_per_child = max_tasks_per_child or processing_settings.get(
+            'PARSE_POOL_MAX_TASKS_PER_CHILD', MAX_TASKS_PER_CHILD
+        )
+        if rss_limit_mb is None:
+            rss_limit_mb = processing_settings.get('PARSE_POOL_RSS_LIMIT_MB', RSS_LIMIT_MB)
+        self.rss_limit_mb = rss_limit_mb
+        self._executor = None
+        self._messages = None
+        # Task id -> queue of that task's messages, filled by the reader thread
+        self._task_messages: Dict[int, queue.Queue] = {}
+        self._task_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context('spawn')
+                self._messages = context.Queue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=_init_process,
+                    initargs=(self._messages, self.rss_limit_mb * 1024 * 1024),
+                    max_tasks_per_child=self.max_tasks_per_child
+                )
+                threading.Thread(target=self._route_messages, args=(self._messages,), daemon=True).start()
+            return self._executor
+
+    def _route_messages(self, messages) -> None:
+        """Reader thread: pass each pool process message to the queue of its task, until shutdown"""
+        while True:
+            try:
+                message = messages.get()
+            except (EOFError, OSError, ValueError):
+                return
+            if message is None:
+                return
+            task_id, first, second = message
+            task_messages = self._task_messages.get(task_id)
+            if task_messages is not None:
+                task_messages.put((first, second))
+
+    def run(
+        self,
+        state: Dict[str, Any],
+        pdf_path: str,
+        page_range: Tuple[int, int] = None,
+        progress: Callable[[int, int], None] = None
+    ) -> Tuple[list, dict, Dict[str, Any]]:
+        """
+        Parse pdf_path in a pool process.
+
+        Args:
+            state (Dict): DocumentProcessor.pool_state() of the calling processor
+            pdf_path (str): PDF on disk, pool processes open it themselves
+            page_range (Tuple[int, int]): As for DocumentProcessor.process_document
+            progress (Callable): Called here with (page_number, page_count) as pages are parsed
+
+        Returns:
+            Tuple of the sections, the reference data and the processor state after the parse
+        """
+        executor = self._get_executor()
+        task_id = next(self._task_ids)
+        messages = self._task_messages[task_id] = queue.Queue()
+        rss_exceeded = None
+        try:
+            future = executor.submit(_parse_task, task_id, state, pdf_path, page_range)
+            while True:
+                try:
+                    first, second = messages.get(timeout=0.2)
+                except queue.Empty:
+                    if future.done():
+                        break
+                    continue
+                if first == 'rss':
+                    rss_exceeded = second
+                elif progress is not None:
+                    progress(first, second)
+            return future.result()
+        except BrokenProcessPool:
+            if rss_exceeded is None:
+                rss_exceeded = self._last_rss_message(messages)
+            self.shutdown()
+            if rss_exceeded is not None:
+                raise ParseMemoryError(
+                    f"Parsing {os.path.basename(pdf_path)} used {rss_exceeded // (1024 * 1024)} MB, "
+                    f"over the {self.rss_limit_mb} MB limit"
+                )
+            raise
+        finally:
+            del self._task_messages[task_id]
+
+    @staticmethod
+    def _last_rss_message(messages: queue.Queue) -> Optional[int]:
+        """The RSS a stopped pool process reported, which can arrive after its future failed"""
+        deadline = time.monotonic() + LAST_MESSAGE_SECONDS
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                first, second = messages.get(timeout=remaining)
+            except queue.Empty:
+                return None
+            if first == 'rss':
+                return second
+        return None
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                # Stops the reader thread
+                self._messages.put(None)
+                self._executor = None
+                self._messages = None
+
+
+_pool = None
+
+
+def get_parse_pool() -> ParsePool:
+    """This process's parse pool, started on first use"""
+    global _pool
+    if _pool is None:
+        _pool = ParsePool()
+        atexit.register(_pool.shutdown)
+    return _pool
@@ -281,12 +281,20 @@ import pdfplumber
 import tempfile
 import fitz
 import os
+import csv
+import hashlib
 import json
+from io import BytesIO
 from datetime import datetime
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Tuple, Generator, Any
+from typing import Dict, List, Tuple, Generator, Any, Union, Optional, Set, Callable
 import logging
-import pandas as pd
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .image_store import ImageStore
+from .page_buffer import PageBuffer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -301,42 +309,354 @@ class ImageMetadata:
     image_index: int
     width: int = None
     height: int = None
+    content_hash: str = None
+
+
+# Straight segments shorter than this (in points) across their axis count as rules
+RULING_TOLERANCE = 2.0
+
+
+def _has_ruling_lines(page: fitz.Page, min_horizontal: int = 2, min_vertical: int = 2) -> bool:
+    """
+    Cheap table pre-check from the page vector graphics.
+    
+    Both table engines use the "lines" strategy, which cannot find a table
+    without horizontal and vertical rules, so pages lacking them are skipped.
+    Reading the drawings costs well under a millisecond against tens of
+    milliseconds for a table search.
+    """
+    horizontal = vertical = 0
+    for path in page.get_drawings():
+        for item in path['items']:
+            if item[0] == 'l':
+                p1, p2 = item[1], item[2]
+                if abs(p1.y - p2.y) <= RULING_TOLERANCE:
+                    horizontal += 1
+                elif abs(p1.x - p2.x) <= RULING_TOLERANCE:
+                    vertical += 1
+            elif item[0] in ('re', 'qu'):
+                rect = item[1] if item[0] == 're' else item[1].rect
+                if rect.height <= RULING_TOLERANCE:
+                    horizontal += 1
+                elif rect.width <= RULING_TOLERANCE:
+                    vertical += 1
+                else:
+                    horizontal += 2
+                    vertical += 2
+            if horizontal >= min_horizontal and vertical >= min_vertical:
+                return True
+    return False
+
+
+def _find_tables_pymupdf(page: fitz.Page, precheck: bool = True) -> Tuple[List, float, bool]:
+    """
+    Run PyMuPDF find_tables on a page.
+    
+    Returns:
+        Tuple[List, float, bool]: (tables, seconds spent, whether the search was skipped)
+    """
+    start = time.perf_counter()
+    if precheck and not _has_ruling_lines(page):
+        return [], time.perf_counter() - start, True
+    tables = [table.extract() for table in page.find_tables().tables]
+    return tables, time.perf_counter() - start, False
+
+
+def _extract_page_images(
+    doc: fitz.Document,
+    page: fitz.Page,
+    min_pixels: int = 0,
+    seen_xrefs: Optional[Set[int]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Decode the images on a page, each xref at most once.
+    
+    Images under min_pixels (width * height) are dropped before decoding.
+    An xref already in seen_xrefs comes back as {'xref': xref} without bytes,
+    to be resolved from its first occurrence by the caller.
+    
+    Returns:
+        List[Dict]: extract_image results with their 'xref' added
+    """
+    base_images = []
+    for img in page.get_images(full=True):
+        xref, width, height = img[0], img[2], img[3]
+        if width * height < min_pixels:
+            continue
+        if seen_xrefs is not None:
+            if xref in seen_xrefs:
+                base_images.append({'xref': xref})
+                continue
+            seen_xrefs.add(xref)
+        base_image = doc.extract_image(xref)
+        base_image['xref'] = xref
+        base_images.append(base_image)
+    return base_images
+
+
+# Lines with more words than this are body text, never headings
+HEADING_MAX_WORDS = 15
+# Span flag PyMuPDF sets for bold fonts
+BOLD_FLAG = 16
+
+
+def _page_layout(page: fitz.Page, textpage: fitz.TextPage) -> Dict[str, Any]:
+    """
+    Font statistics and heading candidates of a page, for semantic sectioning.
+    
+    Returns:
+        Dict with 'font_sizes' (size rounded to 0.5pt -> characters set in it) and
+        'headings', the short lines set larger than the page's main size or fully
+        in bold, as {'text', 'size', 'bold'} in reading order
+    """
+    font_sizes = {}
+    lines = []
+    for block in page.get_text("dict", textpage=textpage, flags=fitz.TEXTFLAGS_TEXT)['blocks']:
+        for line in block.get('lines', []):
+            spans = [span for span in line['spans'] if span['text'].strip()]
+            if not spans:
+                continue
+            for span in spans:
+                size = round(span['size'] * 2) / 2
+                font_sizes[size] = font_sizes.get(size, 0) + len(span['text'])
+            text = ''.join(span['text'] for span in line['spans']).strip()
+            if len(text.split()) <= HEADING_MAX_WORDS:
+                lines.append({
+                    'text': text,
+                    'size': max(round(span['size'] * 2) / 2 for span in spans),
+                    'bold': all(span['flags'] & BOLD_FLAG or 'Bold' in span['font'] for span in spans)
+                })
+
+    if not font_sizes:
+        return {'font_sizes': {}, 'headings': []}
+    body_size = max(font_sizes, key=font_sizes.get)
+    return {
+        'font_sizes': font_sizes,
+        'headings': [line for line in lines if line['size'] > body_size or line['bold']]
+    }
+
+
+def _extract_page_content(
+    doc: fitz.Document,
+    page_index: int,
+    with_tables: bool = True,
+    precheck: bool = True,
+    min_image_pixels: int = 0,
+    seen_xrefs: Optional[Set[int]] = None
+) -> Tuple[str, List, List[Dict[str, Any]], Optional[Tuple[float, bool]], Optional[Dict[str, Any]]]:
+    """
+    Extract text, tables and raw images from a single page of an open document.
+    
+    Args:
+        doc (fitz.Document): Open document
+        page_index (int): 0-based page index
+        with_tables (bool): Search for tables with PyMuPDF
+        precheck (bool): Skip the table search on pages without ruling lines
+        min_image_pixels (int): Skip images smaller than this many pixels
+        seen_xrefs (Set[int]): Image xrefs already decoded from this document
+        
+    Returns:
+        Tuple: (stripped text, tables, extract_image results, (table seconds, skipped), layout),
+        the timing is None when tables were not searched, the layout None on pages without text
+    """
+    page = doc[page_index]
+    # Plain text and the font layout share one text extraction
+    textpage = page.get_textpage()
+    text = page.get_text(textpage=textpage).strip()
+    layout = _page_layout(page, textpage) if text else None
+    tables, table_timing = [], None
+    if with_tables:
+        tables, seconds, skipped = _find_tables_pymupdf(page, precheck)
+        table_timing = (seconds, skipped)
+    base_images = _extract_page_images(doc, page, min_image_pixels, seen_xrefs)
+    return text, tables, base_images, table_timing, layout
+
+
+def _open_fitz(source: Union[str, bytes, memoryview]) -> fitz.Document:
+    """Open a fitz.Document from a file path or from in-memory PDF bytes"""
+    if isinstance(source, str):
+        return fitz.open(source)
+    return fitz.open(stream=source, filetype='pdf')
+
+
+def _parse_page_range(
+    source: Union[str, bytes],
+    start: int,
+    end: int,
+    with_tables: bool = True,
+    precheck: bool = True,
+    min_image_pixels: int = 0
+) -> List[Tuple[int, str, List, List[Dict[str, Any]], Optional[Tuple[float, bool]], Optional[Dict[str, Any]]]]:
+    """
+    Worker entry point for parallel parsing, opens its own copy of the document.
+    
+    Args:
+        source (str | bytes): PDF file path or PDF bytes
+        start (int): First 0-based page index
+        end (int): Page index to stop before
+        with_tables (bool): Search for tables with PyMuPDF
+        precheck (bool): Skip the table search on pages without ruling lines
+        min_image_pixels (int): Skip images smaller than this many pixels
+    
+    Returns:
+        List of (page_index, text, tables, base_images, table_timing, layout) for pages [start, end)
+    """
+    seen_xrefs = set()
+    with _open_fitz(source) as doc:
+        return [
+            (page_index, *_extract_page_content(
+                doc, page_index, with_tables, precheck, min_image_pixels, seen_xrefs
+            ))
+            for page_index in range(start, end)
+        ]
+
 
 class PDFParser:
-    def __init__(self, pdf_path: str):
+    # Available parse engines:
+    #   'pymupdf' - single pass over one fitz.Document for text, tables and images
+    #   'legacy'  - pdf2docx for text, pdfplumber for tables, fitz for images
+    ENGINES = ('pymupdf', 'legacy')
+    DEFAULT_ENGINE = 'pymupdf'
+
+    # Documents shorter than this are not worth the process start-up cost
+    PARALLEL_MIN_PAGES = 50
+
+    # Table engines, None picks the parse engine's own:
+    #   'pymupdf'    - fitz find_tables (default for the 'pymupdf' engine)
+    #   'pdfplumber' - pdfplumber extract_tables (default for the 'legacy' engine)
+    TABLE_ENGINES = ('pymupdf', 'pdfplumber')
+
+    def __init__(
+        self,
+        pdf_path: str = None,
+        engine: str = DEFAULT_ENGINE,
+        workers: int = 1,
+        parallel_min_pages: int = PARALLEL_MIN_PAGES,
+        in_memory: bool = False,
+        pdf_bytes: Union[bytes, memoryview] = None,
+        name: str = None,
+        page_range: Tuple[int, int] = None,
+        table_engine: str = None,
+        table_precheck: bool = True,
+        image_store: ImageStore = None,
+        min_image_pixels: int = 0,
+        progress: Callable[[int, int], None] = None
+    ):
         """
         Initialize parser with PDF file path.
         
         Args:
-            pdf_path (str): Path to PDF file
+            pdf_path (str): Path to PDF file, optional when pdf_bytes is given
+            engine (str): Parse engine, one of PDFParser.ENGINES
+            workers (int): Worker processes for the 'pymupdf' engine, 1 parses serially
+            parallel_min_pages (int): Minimum page count before workers are used
+            in_memory (bool): Keep all output in memory and never write to disk
+            pdf_bytes (bytes | memoryview): PDF content, opened directly from memory
+            name (str): Document name used in metadata when parsing from bytes
+            page_range (Tuple[int, int]): First and last page to parse (1-based,
+                inclusive), None parses the whole document
+            table_engine (str): One of PDFParser.TABLE_ENGINES, None uses the engine default
+            table_precheck (bool): Skip the table search on pages without ruling lines
+            image_store (ImageStore): Persistent store for images, written once per
+                unique image. Without it images follow in_memory like other output
+            min_image_pixels (int): Skip decorative images smaller than this many pixels
+            progress (Callable): Called with (page_number, page_count) as each page's
+                text is extracted, page_count being the whole document's
             
         Output: None
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown parse engine '{engine}', expected one of {self.ENGINES}")
+        if table_engine is not None and table_engine not in self.TABLE_ENGINES:
+            raise ValueError(f"Unknown table engine '{table_engine}', expected one of {self.TABLE_ENGINES}")
+        if pdf_path is None and pdf_bytes is None:
+            raise ValueError("Either pdf_path or pdf_bytes must be provided")
+        if page_range is not None and (page_range[0] < 1 or page_range[1] < page_range[0]):
+            raise ValueError(f"Invalid page range {page_range}, expected (first, last) with 1 <= first <= last")
+
         self.pdf_path = pdf_path
-        self.pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
+        self.pdf_bytes = pdf_bytes
+        if name:
+            self.pdf_name = name
+        elif pdf_path:
+            self.pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
+        else:
+            self.pdf_name = 'document'
+
+        self.engine = engine
+        self.workers = max(1, workers or 1)
+        self.parallel_min_pages = parallel_min_pages
+        self.in_memory = in_memory
+        self.page_range = page_range
+        self.table_engine = table_engine or ('pymupdf' if engine == 'pymupdf' else 'pdfplumber')
+        self.table_precheck = table_precheck
+
+        self.image_store = image_store
+        self.min_image_pixels = min_image_pixels or 0
+        self.progress = progress
+
+        # Raw image bytes keyed by image filename, only filled in memory mode
+        self.image_bytes: Dict[str, bytes] = {}
+        # Images already written, so repeated logos are decoded and saved once
+        self._images_by_xref: Dict[int, Dict[str, Any]] = {}
+        self._images_by_hash: Dict[str, Dict[str, Any]] = {}
         
         # Setup output structure
-        self.output_dir = tempfile.mkdtemp()
-        self.output_text_dir = os.path.join(self.output_dir, 'text')
-        self.output_tables_dir = os.path.join(self.output_dir, 'tables')
-        self.output_images_dir = os.path.join(self.output_dir, 'images')
-        
-        # Create output directories
-        for dir_path in [self.output_text_dir, self.output_tables_dir, self.output_images_dir]:
-            os.makedirs(dir_path, exist_ok=True)
+        if in_memory:
+            self.output_dir = None
+        else:
+            self.output_dir = tempfile.mkdtemp()
+            self.output_text_dir = os.path.join(self.output_dir, 'text')
+            self.output_tables_dir = os.path.join(self.output_dir, 'tables')
+            self.output_images_dir = os.path.join(self.output_dir, 'images')
+            
+            # Create output directories
+            for dir_path in [self.output_text_dir, self.output_tables_dir, self.output_images_dir]:
+                os.makedirs(dir_path, exist_ok=True)
         
         # Initialize result dictionary
         self.result = {
             "metadata": {
                 "filename": self.pdf_name,
                 "extraction_date": datetime.now().isoformat(),
-                "path": pdf_path
+                "path": pdf_path,
+                "engine": engine,
+                "page_range": list(page_range) if page_range else None,
+                "page_count": None,
+                "table_extraction": {
+                    "engine": self.table_engine,
+                    "precheck": table_precheck,
+                    "pages_searched": 0,
+                    "pages_skipped": 0,
+                    "total_seconds": 0.0,
+                    # Seconds spent on tables per page number, including skipped pages
+                    "page_seconds": {}
+                },
+                # Wall time per parse stage, filled in by parse()
+                "stage_seconds": {}
             },
-            "pages": {},
+            # Page texts in one contiguous buffer, read like a {page_number: text} dict
+            "pages": PageBuffer(),
             "tables": {},
-            "images": {}
+            "images": {},
+            # Font sizes and heading candidates per page, 'pymupdf' engine only
+            "layout": {}
         }
 
+    def _open_document(self) -> fitz.Document:
+        """Open the PDF with PyMuPDF, straight from memory when bytes were given"""
+        if self.pdf_bytes is not None:
+            return _open_fitz(self.pdf_bytes)
+        return _open_fitz(self.pdf_path)
+
+    def _page_indices(self, page_count: int) -> range:
+        """0-based indices of the pages to parse, clipped to the document length"""
+        self.result["metadata"]["page_count"] = page_count
+        if self.page_range is None:
+            return range(page_count)
+        first, last = self.page_range
+        return range(first - 1, min(last, page_count))
+
     def extract_pages(self) -> Generator[Tuple[int, str], None, None]:
         """
         Extract text page by page using generator pattern.
@@ -348,21 +668,126 @@ class PDFParser:
         (1, "Page 1 text...")
         (2, "Page 2 text...")
         """
+        if self.pdf_bytes is not None:
+            # pdf2docx only accepts paths, its fitz_doc gives the same text
+            doc = self._open_document()
+            try:
+                for page_num in self._page_indices(len(doc)):
+                    yield page_num + 1, doc[page_num].get_text()
+            finally:
+                doc.close()
+            return
+
         cv = Converter(self.pdf_path)
         try:
-            for page_num in range(len(cv.fitz_doc)):
+            for page_num in self._page_indices(len(cv.fitz_doc)):
                 page = cv.fitz_doc[page_num]
                 text = page.get_text()
                 yield page_num + 1, text
         finally:
             cv.close()
 
+    def _save_page_text(self, page_num: int, text: str) -> None:
+        """Write extracted page text to the text output directory"""
+        if self.in_memory:
+            return
+        output_file = os.path.join(self.output_text_dir, f'page_{page_num}.txt')
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def _save_tables(self, page_num: int, tables: List[List[List[str]]]) -> None:
+        """Write each table of a page to its own CSV file"""
+        if self.in_memory:
+            return
+        for table_idx, table in enumerate(tables, start=1):
+            if table and len(table) > 0:  # Check if table has content
+                csv_file = os.path.join(
+                    self.output_tables_dir,
+                    f'page_{page_num}_table_{table_idx}.csv'
+                )
+                with open(csv_file, 'w', encoding='utf-8', newline='') as f:
+                    csv.writer(f).writerows(table)
+                logger.info(f"Extracted table {table_idx} from page {page_num}")
+
+    def _save_image(self, page_num: int, img_idx: int, base_image: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store an extracted image once and build its per-page metadata.
+        
+        Images are deduplicated by xref and then by content hash. With an image
+        store the file lands in its content-addressed location, otherwise it is
+        written to the temp output directory, or kept in self.image_bytes with a
+        None path in memory mode.
+        
+        Args:
+            page_num (int): 1-based page number
+            img_idx (int): 1-based image index on the page
+            base_image (Dict): Result of fitz.Document.extract_image plus 'xref',
+                or only {'xref': xref} for an image decoded earlier
+            
+        Returns:
+            Dict[str, Any]: ImageMetadata as a dict
+        """
+        xref = base_image.get('xref')
+        stored = self._images_by_xref.get(xref) if xref is not None else None
+
+        if stored is None:
+            content_hash = hashlib.sha256(base_image["image"]).hexdigest()
+            stored = self._images_by_hash.get(content_hash)
+            if stored is None:
+                stored = self._write_image(page_num, img_idx, base_image, content_hash)
+                self._images_by_hash[content_hash] = stored
+                logger.info(f"Extracted image {img_idx} from page {page_num}")
+            if xref is not None:
+                self._images_by_xref[xref] = stored
+        
+        metadata = ImageMetadata(
+            filename=stored['filename'],
+            path=stored['path'],
+            extraction_date=datetime.now().isoformat(),
+            page_number=page_num,
+            image_index=img_idx,
+            width=stored['width'],
+            height=stored['height'],
+            content_hash=stored['content_hash']
+        )
+        return asdict(metadata)
+
+    def _write_image(
+        self,
+        page_num: int,
+        img_idx: int,
+        base_image: Dict[str, Any],
+        content_hash: str
+    ) -> Dict[str, Any]:
+        """Write the bytes of a newly seen image and return where they went"""
+        if self.image_store is not None:
+            key = self.image_store.put(base_image["image"], base_image['ext'], content_hash)
+            image_filename = os.path.basename(key)
+            image_path = self.image_store.path(key)
+        else:
+            image_filename = f"page_{page_num}_image_{img_idx}.{base_image['ext']}"
+            if self.in_memory:
+                image_path = None
+                self.image_bytes[image_filename] = base_image["image"]
+            else:
+                image_path = os.path.join(self.output_images_dir, image_filename)
+                with open(image_path, "wb") as img_file:
+                    img_file.write(base_image["image"])
+
+        return {
+            'filename': image_filename,
+            'path': image_path,
+            'width': base_image.get('width'),
+            'height': base_image.get('height'),
+            'content_hash': content_hash
+        }
+
     def extract_text(self) -> Dict[int, str]:
         """
         Extract all text from PDF maintaining page boundaries.
         
         Returns:
-            Dict[int, str]: Page numbers mapped to text content
+            PageBuffer: Page numbers mapped to text content
             
         Output Structure:
         {
@@ -371,15 +796,14 @@ class PDFParser:
         }
         """
         try:
-            pages = {}
+            pages = PageBuffer()
             for page_num, text in self.extract_pages():
-                if text.strip():
-                    pages[page_num] = text.strip()
-                    # Save to file
-                    output_file = os.path.join(self.output_text_dir, f'page_{page_num}.txt')
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(text.strip())
+                text = text.strip()
+                if text:
+                    pages.append(page_num, text)
+                    self._save_page_text(page_num, text)
                     logger.info(f"Extracted text from page {page_num}")
+                self._report_progress(page_num)
                     
             self.result["pages"] = pages
             return pages
@@ -388,9 +812,19 @@ class PDFParser:
             logger.error(f"Error extracting text: {str(e)}")
             raise
 
+    def _record_table_timing(self, page_num: int, seconds: float, skipped: bool) -> None:
+        """Add one page's table timing to the result metadata"""
+        stats = self.result["metadata"]["table_extraction"]
+        stats["page_seconds"][page_num] = round(seconds, 6)
+        stats["total_seconds"] += seconds
+        if skipped:
+            stats["pages_skipped"] += 1
+        else:
+            stats["pages_searched"] += 1
+
     def extract_tables(self) -> Dict[int, List[List[List[str]]]]:
         """
-        Extract tables using pdfplumber.
+        Extract tables with the configured table engine.
         
         Returns:
             Dict[int, List[List[List[str]]]]: Page numbers mapped to tables
@@ -404,31 +838,57 @@ class PDFParser:
             2: [...]
         }
         """
-        logger.info("Extracting tables")
+        logger.info(f"Extracting tables (table engine: {self.table_engine})")
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    tables = page.extract_tables()
-                    if tables:
-                        self.result["tables"][page_num] = tables
-                        
-                        # Save each table to CSV
-                        for table_idx, table in enumerate(tables, start=1):
-                            if table and len(table) > 0:  # Check if table has content
-                                df = pd.DataFrame(table[1:], columns=table[0])
-                                csv_file = os.path.join(
-                                    self.output_tables_dir,
-                                    f'page_{page_num}_table_{table_idx}.csv'
-                                )
-                                df.to_csv(csv_file, index=False)
-                                logger.info(f"Extracted table {table_idx} from page {page_num}")
-            
+            if self.table_engine == 'pymupdf':
+                self._extract_tables_pymupdf()
+            else:
+                self._extract_tables_pdfplumber()
+
+            stats = self.result["metadata"]["table_extraction"]
+            logger.info(
+                f"Table search ran on {stats['pages_searched']} pages, skipped {stats['pages_skipped']} "
+                f"in {stats['total_seconds']:.2f}s"
+            )
             return self.result["tables"]
             
         except Exception as e:
             logger.error(f"Error extracting tables: {str(e)}")
             raise
 
+    def _extract_tables_pymupdf(self) -> None:
+        """Table pass with PyMuPDF find_tables"""
+        with self._open_document() as doc:
+            for page_index in self._page_indices(len(doc)):
+                page_num = page_index + 1
+                tables, seconds, skipped = _find_tables_pymupdf(doc[page_index], self.table_precheck)
+                self._record_table_timing(page_num, seconds, skipped)
+                if tables:
+                    self.result["tables"][page_num] = tables
+                    self._save_tables(page_num, tables)
+
+    def _extract_tables_pdfplumber(self) -> None:
+        """Table pass with pdfplumber, pre-checked on the PyMuPDF drawings"""
+        source = BytesIO(self.pdf_bytes) if self.pdf_bytes is not None else self.pdf_path
+        # pdfplumber's own edges cost as much as the table search, fitz reads them cheaply
+        doc = self._open_document() if self.table_precheck else None
+        try:
+            with pdfplumber.open(source) as pdf:
+                for page_index in self._page_indices(len(pdf.pages)):
+                    page_num = page_index + 1
+                    start = time.perf_counter()
+                    if doc is not None and not _has_ruling_lines(doc[page_index]):
+                        self._record_table_timing(page_num, time.perf_counter() - start, True)
+                        continue
+                    tables = pdf.pages[page_index].extract_tables()
+                    self._record_table_timing(page_num, time.perf_counter() - start, False)
+                    if tables:
+                        self.result["tables"][page_num] = tables
+                        self._save_tables(page_num, tables)
+        finally:
+            if doc is not None:
+                doc.close()
+
     def extract_images(self) -> Dict[int, List[ImageMetadata]]:
         """
         Extract images using PyMuPDF.
@@ -447,38 +907,16 @@ class PDFParser:
         """
         logger.info("Extracting images")
         try:
-            doc = fitz.open(self.pdf_path)
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                image_list = page.get_images(full=True)
+            doc = self._open_document()
+            seen_xrefs = set()
+            for page_num in self._page_indices(len(doc)):
+                base_images = _extract_page_images(doc, doc[page_num], self.min_image_pixels, seen_xrefs)
                 
-                if len(image_list) > 0:
-                    self.result["images"][page_num + 1] = []
-                    
-                    for img_idx, img in enumerate(image_list, start=1):
-                        xref = img[0]
-                        base_image = doc.extract_image(xref)
-                        
-                        # Generate filename and save image
-                        image_filename = f"page_{page_num + 1}_image_{img_idx}.{base_image['ext']}"
-                        image_path = os.path.join(self.output_images_dir, image_filename)
-                        
-                        with open(image_path, "wb") as img_file:
-                            img_file.write(base_image["image"])
-                        
-                        # Create and store metadata
-                        metadata = ImageMetadata(
-                            filename=image_filename,
-                            path=image_path,
-                            extraction_date=datetime.now().isoformat(),
-                            page_number=page_num + 1,
-                            image_index=img_idx,
-                            width=base_image.get('width'),
-                            height=base_image.get('height')
-                        )
-                        
-                        self.result["images"][page_num + 1].append(asdict(metadata))
-                        logger.info(f"Extracted image {img_idx} from page {page_num + 1}")
+                if len(base_images) > 0:
+                    self.result["images"][page_num + 1] = [
+                        self._save_image(page_num + 1, img_idx, base_image)
+                        for img_idx, base_image in enumerate(base_images, start=1)
+                    ]
             
             doc.close()
             return self.result["images"]
@@ -487,6 +925,132 @@ class PDFParser:
             logger.error(f"Error extracting images: {str(e)}")
             raise
 
+    def _store_page_content(
+        self,
+        page_num: int,
+        text: str,
+        tables: List[List[List[str]]],
+        base_images: List[Dict[str, Any]],
+        table_timing: Tuple[float, bool] = None,
+        layout: Dict[str, Any] = None
+    ) -> None:
+        """Record the content extracted from one page in self.result"""
+        if table_timing is not None:
+            self._record_table_timing(page_num, *table_timing)
+
+        if text:
+            self.result["pages"].append(page_num, text)
+            if layout is not None:
+                self.result["layout"][page_num] = layout
+            self._save_page_text(page_num, text)
+            logger.info(f"Extracted text from page {page_num}")
+
+        if tables:
+            self.result["tables"][page_num] = tables
+            self._save_tables(page_num, tables)
+
+        if base_images:
+            self.result["images"][page_num] = [
+                self._save_image(page_num, img_idx, base_image)
+                for img_idx, base_image in enumerate(base_images, start=1)
+            ]
+
+        self._report_progress(page_num)
+
+    def _report_progress(self, page_num: int) -> None:
+        """Tell the progress callback, if any, that page_num is done"""
+        if self.progress is not None:
+            self.progress(page_num, self.result["metadata"]["page_count"])
+
+    def extract_all_single_pass(self) -> Dict[str, Any]:
+        """
+        Extract text, tables and images from one fitz.Document in a single walk.
+        
+        Each page is loaded once and text, tables (PyMuPDF find_tables) and
+        image metadata are emitted from it, so the xref table and page tree
+        are only parsed once per document.
+        
+        Returns:
+            Dict[str, Any]: The result dict with pages, tables and images filled in
+        """
+        logger.info("Extracting text, tables and images in a single pass")
+        inline_tables = self.table_engine == 'pymupdf'
+        seen_xrefs = set()
+        doc = self._open_document()
+        try:
+            for page_index in self._page_indices(len(doc)):
+                self._store_page_content(
+                    page_index + 1,
+                    *_extract_page_content(
+                        doc, page_index, inline_tables, self.table_precheck, self.min_image_pixels, seen_xrefs
+                    )
+                )
+        except Exception as e:
+            logger.error(f"Error in single pass extraction: {str(e)}")
+            raise
+        finally:
+            doc.close()
+
+        # pdfplumber needs its own walk over the document
+        if not inline_tables:
+            self.extract_tables()
+        return self.result
+
+    def extract_all_parallel(self) -> Dict[str, Any]:
+        """
+        Extract all content with the page range split across worker processes.
+        
+        Each worker opens the document independently and runs the single pass
+        extraction over its own contiguous page range. Results are merged back
+        in page order, so the result dict is identical to extract_all_single_pass.
+        
+        Returns:
+            Dict[str, Any]: The result dict with pages, tables and images filled in
+        """
+        with self._open_document() as doc:
+            page_indices = self._page_indices(len(doc))
+        page_count = len(page_indices)
+
+        if self.workers <= 1 or page_count < self.parallel_min_pages:
+            return self.extract_all_single_pass()
+
+        chunk_size = -(-page_count // self.workers)  # ceil division
+        page_ranges = [
+            (start, min(start + chunk_size, page_indices.stop))
+            for start in range(page_indices.start, page_indices.stop, chunk_size)
+        ]
+        logger.info(f"Extracting {page_count} pages across {len(page_ranges)} worker processes")
+
+        inline_tables = self.table_engine == 'pymupdf'
+
+        # Workers reopen the file by path when there is one, otherwise they get
+        # a picklable copy of the bytes
+        source = self.pdf_path if self.pdf_path else bytes(self.pdf_bytes)
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=len(page_ranges),
+                mp_context=multiprocessing.get_context('spawn')
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _parse_page_range, source, start, end,
+                        inline_tables, self.table_precheck, self.min_image_pixels
+                    )
+                    for start, end in page_ranges
+                ]
+                # Futures are consumed in submission order to keep pages ordered
+                for future in futures:
+                    for page_index, *page_content in future.result():
+                        self._store_page_content(page_index + 1, *page_content)
+
+            if not inline_tables:
+                self.extract_tables()
+            return self.result
+        except Exception as e:
+            logger.error(f"Error in parallel extraction: {str(e)}")
+            raise
+
     def save_metadata(self) -> None:
         """
         Save extraction results and metadata to JSON.
@@ -503,10 +1067,12 @@ class PDFParser:
             "images": {1: [{metadata1}, {metadata2}], 2: [...]}
         }
         """
+        if self.in_memory:
+            return
         try:
             metadata_file = os.path.join(self.output_dir, f"{self.pdf_name}_metadata.json")
             with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(self.result, f, indent=2, ensure_ascii=False)
+                json.dump({**self.result, "pages": self.result["pages"].to_dict()}, f, indent=2, ensure_ascii=False)
             logger.info(f"Saved metadata to {metadata_file}")
         except Exception as e:
             logger.error(f"Error saving metadata: {str(e)}")
@@ -514,14 +1080,26 @@ class PDFParser:
 
     def parse(self) -> Dict[str, Any]:
         """Parse with better resource management"""
-        logger.info(f"Starting to parse: {self.pdf_path}")
+        logger.info(f"Starting to parse: {self.pdf_path or self.pdf_name} (engine: {self.engine})")
         try:
-            self.extract_text()
-            self.extract_tables()
-            self.extract_images()
-            self.save_metadata()
+            if self.engine == 'pymupdf' and self.workers > 1:
+                stages = [('parallel_pass', self.extract_all_parallel)]
+            elif self.engine == 'pymupdf':
+                stages = [('single_pass', self.extract_all_single_pass)]
+            else:
+                stages = [
+                    ('text', self.extract_text),
+                    ('tables', self.extract_tables),
+                    ('images', self.extract_images)
+                ]
+            stages.append(('save_metadata', self.save_metadata))
+
+            for stage, extract in stages:
+                start = time.perf_counter()
+                extract()
+                self.result["metadata"]["stage_seconds"][stage] = round(time.perf_counter() - start, 6)
             
-            logger.info(f"Successfully parsed: {self.pdf_path}")
+            logger.info(f"Successfully parsed: {self.pdf_path or self.pdf_name}")
             return self.result
         except Exception as e:
             logger.error(f"Error parsing PDF: {str(e)}")
@@ -533,6 +1111,8 @@ class PDFParser:
     
     def cleanup(self):
         """Remove temporary files after processing."""
+        if self.output_dir is None:
+            return
         try:
             import shutil
             shutil.rmtree(self.output_dir, ignore_errors=True)
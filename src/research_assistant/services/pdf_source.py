@@ -0,0 +1,99 @@
+# src/research_assistant/services/pdf_source.py
+
+import hashlib
+import logging
+import mmap
+import tempfile
+from typing import List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Inputs above this size are spooled to disk and memory-mapped
+DEFAULT_SPOOL_THRESHOLD = 32 * 1024 * 1024
+
+
+class PDFSource:
+    """
+    Downloaded PDF content ready to be opened by the parser without a temp file.
+
+    Small documents stay as the downloaded bytes. Large ones are written once to
+    a spool file that is memory-mapped, so the parser reads pages from
+    the page cache instead of holding a second copy in the heap. The spool file
+    is deleted as soon as the source is closed, even if parsing fails.
+
+    Content can be given up front, or streamed in with write() and finish():
+
+        with PDFSource(content) as source:
+            PDFParser(pdf_bytes=source.data, pdf_path=source.path)
+    """
+
+    def __init__(self, content: bytes = None, spool_threshold: int = DEFAULT_SPOOL_THRESHOLD):
+        self.spool_threshold = spool_threshold
+        self.size = 0
+        self.content_hash: Optional[str] = None
+        self.path: Optional[str] = None
+        self.data: Union[bytes, memoryview] = b''
+        self._digest = hashlib.sha256()
+        self._chunks: List[bytes] = []
+        self._spool = None
+        self._mmap = None
+
+        if content is not None:
+            self.write(content)
+            self.finish()
+
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk, switching to the spool file once the threshold is crossed"""
+        self.size += len(chunk)
+        self._digest.update(chunk)
+
+        if self._spool is None and self.size > self.spool_threshold:
+            self._spool = tempfile.NamedTemporaryFile(prefix='research_assistant_', suffix='.pdf')
+            for pending in self._chunks:
+                self._spool.write(pending)
+            self._chunks = []
+
+        if self._spool is not None:
+            self._spool.write(chunk)
+        else:
+            self._chunks.append(chunk)
+
+    def finish(self) -> 'PDFSource':
+        """Seal the content and expose it as self.data (and self.path when spooled)"""
+        self.content_hash = self._digest.hexdigest()
+
+        if self._spool is None:
+            # A single chunk is used as is, without copying
+            self.data = self._chunks[0] if len(self._chunks) == 1 else b''.join(self._chunks)
+            self._chunks = []
+            return self
+
+        self._spool.flush()
+        self._mmap = mmap.mmap(self._spool.fileno(), 0, access=mmap.ACCESS_READ)
+        self.data = memoryview(self._mmap)
+        # Parallel parse workers reopen the document by path
+        self.path = self._spool.name
+        logger.info(f"Spooled {self.size} byte PDF to {self.path}")
+        return self
+
+    def close(self) -> None:
+        """Release the mapping and delete the spool file"""
+        if self._mmap is not None:
+            try:
+                self.data.release()
+                self._mmap.close()
+            except BufferError:
+                # A parser still holds a view, the mapping goes away with it
+                logger.warning("PDF mapping still in use, leaving it to garbage collection")
+            self._mmap = None
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+        self._chunks = []
+        self.data = b''
+
+    def __enter__(self) -> 'PDFSource':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
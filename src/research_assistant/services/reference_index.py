@@ -0,0 +1,101 @@
+# src/research_assistant/services/reference_index.py
+
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Reference entry types whose id is the reference number
+NUMBERED_REFERENCE_TYPES = ('numbered_bracket', 'numbered_dot')
+
+_LEADING_NUMBER = re.compile(r'^\s*(?:\[\d+\]|\(\d+\)|\d+\.)\s*')
+# Words of two or more letters, single letters are initials
+_NAME = re.compile(r"[^\W\d_]{2,}(?:['’-][^\W\d_]+)*")
+_YEAR = re.compile(r'(?<!\d)(1[5-9]\d{2}|20\d{2})([a-z])?(?![\da-z])')
+
+
+def normalize_surname(name: str) -> str:
+    """Casefolded surname without accents, so Müller and MULLER share a key"""
+    decomposed = unicodedata.normalize('NFKD', name)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def parse_author_year(text: str) -> Optional[Tuple[str, str, str]]:
+    """
+    First author surname, year and year suffix in a citation or reference.
+
+    'Kim et al., 2016a' gives ('kim', '2016', 'a'), 'S. Smith, Title, 2001.'
+    gives ('smith', '2001', ''). None when either part is missing.
+    """
+    year = _YEAR.search(text)
+    if not year:
+        return None
+    # The author comes before the year, except in numbered styles that end with it
+    name = _NAME.search(text, 0, year.start()) or _NAME.search(text)
+    if not name:
+        return None
+    return normalize_surname(name.group(0)), year.group(1), year.group(2) or ''
+
+
+class ReferenceIndex:
+    """
+    Lookup from in-text citations to reference entries, built once per document.
+
+    Numbered citations resolve by reference number. Author-year citations
+    resolve by normalised first-author surname and year: "(Kim et al., 2016)"
+    finds every 2016 entry by Kim, "(Kim et al., 2016b)" the one marked 2016b,
+    or the second of them in list order when the list has no suffixes. The
+    author-year table is built on the first author-year lookup, so callers
+    that only resolve numbered citations pay nothing for it.
+    """
+
+    def __init__(self, reference_data: Optional[Dict[str, Any]] = None):
+        self.entries = (reference_data or {}).get('entries') or {}
+        self._by_author_year = None
+
+    def resolve(self, citation_type: str, value: str) -> List[Dict[str, Any]]:
+        """
+        Reference entries a citation refers to.
+
+        Args:
+            citation_type (str): A CITATION_PATTERNS type, e.g. 'numbered' or 'parenthetical'
+            value (str): The citation's value group, e.g. '1, 3' or 'Kim et al., 2016'
+        """
+        if citation_type == 'numbered':
+            return [self.entries[num.strip()] for num in value.split(',') if num.strip() in self.entries]
+
+        parsed = parse_author_year(value)
+        if parsed is None:
+            return []
+        return self.lookup(*parsed)
+
+    def lookup(self, surname: str, year: str, suffix: str = '') -> List[Dict[str, Any]]:
+        """Entries by a normalised surname in a year, narrowed to one by a/b suffix"""
+        if self._by_author_year is None:
+            self._by_author_year = self._build()
+
+        candidates = self._by_author_year.get((surname, year), [])
+        if not suffix:
+            return [entry for _, entry in candidates]
+
+        explicit = [entry for entry_suffix, entry in candidates if entry_suffix == suffix]
+        if explicit or any(entry_suffix for entry_suffix, _ in candidates):
+            return explicit
+        # Lists without suffixes order same-year entries the way the suffixes count
+        position = ord(suffix) - ord('a')
+        return [candidates[position][1]] if position < len(candidates) else []
+
+    def _build(self) -> Dict[Tuple[str, str], List[Tuple[str, Dict[str, Any]]]]:
+        """(surname, year) -> [(suffix, entry)] in reference list order"""
+        by_author_year = defaultdict(list)
+        for ref_id, entry in self.entries.items():
+            if entry.get('type') in NUMBERED_REFERENCE_TYPES:
+                source = _LEADING_NUMBER.sub('', entry.get('text', ''), count=1)
+            else:
+                # Author-year ids are the author and year themselves, e.g. 'Chen(2019a)'
+                source = ref_id
+            parsed = parse_author_year(source)
+            if parsed is not None:
+                surname, year, suffix = parsed
+                by_author_year[(surname, year)].append((suffix, entry))
+        return dict(by_author_year)
@@ -0,0 +1,168 @@
+# src/research_assistant/services/reference_section.py
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Reference section markers - keeping existing ones and adding new
+REFERENCE_SECTION_TITLES = [
+    r'^\s*references?\s*$',
+    r'^\s*bibliography\s*$',
+    r'^\s*works\s+cited\s*$',
+    r'^\s*reference\s+list\s*$',
+    r'^\s*(?:\d+\.|[ivx]+\.|\[\d+\])\s*references?\s*$',
+    r'^[-_*=]{2,}\s*references?\s*[-_*=]{2,}$',
+    r'^\s*references?\s*[-_*=]{2,}$',
+    r'^[-_*=]{2,}\s*references?\s*$',
+    r'^\s*acknowledgements?\s*$',
+]
+
+
+# Define reference patterns, each with exactly one capturing group for the reference id
+REFERENCE_PATTERNS = {
+    'numbered_bracket': r'^\s*\[(\d+)\]',           # [1]
+    'numbered_dot': r'^\s*(\d+)\.',                 # 1.
+    'author_year': r'^\s*\[([A-Za-z]+(?:\s*,\s*[A-Za-z]+)*\s*\(\d{4}[a-z]?\))\]',  # [Author(2023a)]
+    'parenthetical': r'^\s*\(([A-Za-z]+\s*,\s*\d{4})\)',  # (john,2024)
+    'narrative': r'^([A-Za-z]+\s+et\s+al\.\s*\(\d{4}\))',  # AuthorName et al.(2016)
+    'standard': r'^([A-Za-z]+\s*,\s*[A-Za-z]+\s*\.\s*\d{4})',  # Ammann P., Offutt.J. 2008
+    'apa': r"^([^\W\d_][\w'’-]*,\s*[^\W\d_]\.[^()]{0,200}?\(\d{4}[a-z]?\))"  # Kim, J., Lee, S., & Park, H. (2016)
+}
+
+# Lines starting like this begin a new reference when split lines are joined,
+# the lines after them are appended until the next one
+REFERENCE_START_PATTERNS = [
+    r'^\s*\[\d+\]',                    # [1]
+    r'^\s*\d+\.',                      # 1.
+    r'^\s*\[.*?\(\d{4}[a-z]?\)\]',     # [Author(2023a)]
+    r'^\s*\([A-Za-z]+,\s*\d{4}\)',     # (john,2024)
+    REFERENCE_PATTERNS['apa'],          # Kim, J., Lee, S., & Park, H. (2016)
+]
+
+_HEADING = re.compile('|'.join(f'(?:{pattern})' for pattern in REFERENCE_SECTION_TITLES))
+# Every heading contains one of these words, pages without them are never split into lines
+_HEADING_WORDS = ('reference', 'bibliography', 'works', 'acknowledgement')
+
+_REFERENCE = re.compile('|'.join(
+    f'(?P<{ref_type}>{pattern})' for ref_type, pattern in REFERENCE_PATTERNS.items()
+))
+# The reference id group directly follows each type's named group
+_REFERENCE_ID_GROUPS = {ref_type: _REFERENCE.groupindex[ref_type] + 1 for ref_type in REFERENCE_PATTERNS}
+
+_REFERENCE_START = re.compile('|'.join(f'(?:{pattern})' for pattern in REFERENCE_START_PATTERNS))
+
+# A reference is complete once a line ends its year or carries a link
+_REFERENCE_END = re.compile(r'\d{4}\.|\b(?:https?://|www\.)\S+')
+
+# Shorter entries are taken to be noise
+MIN_REFERENCE_LENGTH = 11
+
+
+def is_reference_heading(text: str) -> bool:
+    """Whether a line or outline title marks the start of a reference section"""
+    return _HEADING.search(text.lower().strip()) is not None
+
+
+def might_contain_heading(page_text: str) -> bool:
+    """Cheap page-level check, False means no line of the page is a reference heading"""
+    # Headings are matched lowercased, so plain substring checks on the lowercased page are exact
+    lowered = page_text.lower()
+    return any(word in lowered for word in _HEADING_WORDS)
+
+
+def _joined_lines(page_text: str) -> Iterator[str]:
+    """Lines of a page with each reference's continuation lines appended to its first line"""
+    current = None
+    for line in page_text.split('\n'):
+        if _REFERENCE_START.match(line):
+            if current is not None:
+                yield current
+            current = line
+        elif current is not None:
+            current += " " + line.strip()
+        else:
+            yield line
+    if current is not None:
+        yield current
+
+
+def _page_references(lines: Iterable[str]) -> Iterator[Tuple[str, str, str]]:
+    """
+    Stream (ref_id, ref_type, text) for the references in a page's lines.
+
+    A line matching a reference pattern opens an entry, following lines are
+    appended until the next reference or until a line completes the entry,
+    lines after a completed entry are skipped. Every line is matched once.
+    """
+    entry = None
+    for line in lines:
+        stripped = line.strip()
+        match = _REFERENCE.match(stripped)
+        if match:
+            if entry is not None:
+                yield entry
+            ref_type = match.lastgroup
+            entry = (match.group(_REFERENCE_ID_GROUPS[ref_type]), ref_type, line)
+        elif entry is not None:
+            entry = (entry[0], entry[1], entry[2] + ' ' + stripped)
+            if _REFERENCE_END.search(stripped):
+                yield entry
+                entry = None
+    if entry is not None:
+        yield entry
+
+
+def extract_reference_section(page_texts: Iterable[str]) -> Dict[str, Any]:
+    """
+    Extract the reference section and its entries from page texts in one pass.
+
+    The first page with a reference heading starts the section, entries are
+    read from the line after the heading to the end of the document. Pages
+    before the heading are only split into lines when they contain a heading
+    word. Later entries with the same id replace earlier ones.
+
+    Args:
+        page_texts (Iterable[str]): Text of each page in document order, read once
+
+    Returns:
+        Dict with 'entries' (id -> {'text', 'type'}), 'type', and the 1-based
+        'start_page' and 'end_page' relative to page_texts ('end_page' is None
+        when the section starts on the last page)
+    """
+    reference_data = {
+        'entries': {},
+        'type': 'unknown',
+        'start_page': None,
+        'end_page': None
+    }
+    entries = reference_data['entries']
+
+    for page_idx, page_text in enumerate(page_texts):
+        if reference_data['start_page'] is None:
+            if not page_text or not might_contain_heading(page_text):
+                continue
+            lines = list(_joined_lines(page_text))
+            heading_idx = _find_heading(lines)
+            if heading_idx is None:
+                continue
+            reference_data['start_page'] = page_idx + 1
+            lines = lines[heading_idx + 1:]
+        else:
+            lines = _joined_lines(page_text)
+            reference_data['end_page'] = page_idx + 1
+
+        for ref_id, ref_type, text in _page_references(lines):
+            if len(text) >= MIN_REFERENCE_LENGTH:
+                entries[ref_id] = {
+                    'text': text,
+                    'type': ref_type
+                }
+
+    return reference_data
+
+
+def _find_heading(lines: List[str]) -> Optional[int]:
+    """Index of the first heading line, None when there is none"""
+    for line_idx, line in enumerate(lines):
+        if is_reference_heading(line):
+            return line_idx
+    return None
@@ -21,6 +21,8 @@ class SearchManager:
                 'text': content,
                 'section_id': section_id,
                 'page_number': int(section.section_start_page_number),
+                'end_page_number': section.section_end_page_number or int(section.section_start_page_number),
+                'title': section.title,
                 'section_type': section.section_type,
                 'start_text': content[:100] if content else "",
                 'elements': section.get_elements() if hasattr(section, 'get_elements') else [],
@@ -186,11 +188,13 @@ class SearchManager:
         for document in documents:
             print(f"[SearchManager] Processing document: {document.file_name}")
             
-            # Get all sections for document directly from model
+            # Get all sections for document directly from model, the reference list is not searched
             sections = DocumentSection.objects.filter(
                 document=document,
                 content__isnull=False  # Ensure no empty sections
-            ).order_by('section_start_page_number').select_related('document')
+            ).exclude(section_type='references').order_by(
+                'section_start_page_number', 'section_index'
+            ).select_related('document')
             
             search_sections = self.prepare_sections_for_search(sections)
             
@@ -0,0 +1,283 @@
+# src/research_assistant/services/semantic_sectioner.py
+
+import bisect
+import re
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .page_buffer import PageBuffer, PageRecord
+from .reference_section import is_reference_heading
+
+# Rough token estimate for English prose
+CHARS_PER_TOKEN = 4
+
+# Sections are packed up to the budget, smaller ones are merged into the next
+SECTION_MAX_TOKENS = 2000
+SECTION_MIN_TOKENS = 800
+
+# Headings are set at least this much larger than the body text, or in bold
+HEADING_SIZE_RATIO = 1.15
+HEADING_MAX_CHARS = 120
+# Heading text on more than this share of pages is a running header, not a heading
+RUNNING_HEADER_SHARE = 0.2
+
+_LETTER = re.compile(r'[^\W\d_]')
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN
+
+
+def _normalize(text: str) -> str:
+    return ' '.join(text.split())
+
+
+def _strip_span(source: str, start: int, end: int) -> Tuple[int, int]:
+    """Offsets of source[start:end] without its surrounding whitespace"""
+    while start < end and source[start].isspace():
+        start += 1
+    while end > start and source[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+@dataclass(slots=True)
+class SectionPart:
+    """Span of one page's text that belongs to a section, as offsets into the page buffer"""
+    page_number: int
+    start: int
+    end: int
+
+    @property
+    def tokens(self) -> int:
+        return (self.end - self.start) // CHARS_PER_TOKEN
+
+
+@dataclass
+class LogicalSection:
+    """A heading-delimited run of text, possibly spanning pages"""
+    title: Optional[str] = None
+    section_type: str = 'text'
+    parts: List[SectionPart] = field(default_factory=list)
+    # The PageBuffer text the parts index into, shared, not copied
+    source: str = ''
+
+    @property
+    def start_page(self) -> int:
+        return self.parts[0].page_number
+
+    @property
+    def end_page(self) -> int:
+        return self.parts[-1].page_number
+
+    @property
+    def pages(self) -> List[int]:
+        return sorted({part.page_number for part in self.parts})
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(self.source[part.start:part.end] for part in self.parts)
+
+    @property
+    def tokens(self) -> int:
+        return sum(part.tokens for part in self.parts)
+
+    def page_starts(self) -> List[Tuple[int, int]]:
+        """
+        (offset, page_number) where each part starts in the whitespace-normalised
+        text, the coordinates citation positions are given in
+        """
+        starts = []
+        offset = 0
+        for part in self.parts:
+            starts.append((offset, part.page_number))
+            offset += len(_normalize(self.source[part.start:part.end])) + 1
+        return starts
+
+
+def page_at(page_starts: List[Tuple[int, int]], position: int) -> int:
+    """Page number of a position in a section's normalised text"""
+    index = bisect.bisect_right([offset for offset, _ in page_starts], position) - 1
+    return page_starts[max(index, 0)][1]
+
+
+class SemanticSectioner:
+    """
+    Split a parsed document into logical sections instead of one per page.
+
+    Headings come from the parser's per-page font layout: short lines set
+    noticeably larger than the document's body size, or entirely in bold.
+    Text from one heading to the next becomes a section, across page breaks.
+    Sections over max_tokens are split at page and then line boundaries,
+    sections under min_tokens are merged into the next one when it fits, so
+    title pages and short headings do not become sections of their own.
+    The reference list gets section_type 'references' so search can skip it.
+    Without layout (the legacy engine) pages are only packed to the budget.
+
+    Sections refer to the page buffer's text by offset, the characters are
+    only copied when a section's text is read.
+    """
+
+    def __init__(self, max_tokens: int = SECTION_MAX_TOKENS, min_tokens: int = SECTION_MIN_TOKENS):
+        self.max_tokens = max_tokens
+        self.min_tokens = min_tokens
+
+    def split(self, pages: Mapping, layout: Dict[int, Dict[str, Any]] = None) -> List[LogicalSection]:
+        """
+        Args:
+            pages (PageBuffer): Page number -> page text, pages without text left out,
+                a plain dict is copied into a PageBuffer first
+            layout (Dict[int, Dict]): Page number -> PDFParser layout ('font_sizes', 'headings')
+
+        Returns:
+            List[LogicalSection]: Sections in reading order
+        """
+        if not isinstance(pages, PageBuffer):
+            buffer = PageBuffer()
+            for page_number in sorted(pages):
+                buffer.append(page_number, pages[page_number])
+            pages = buffer
+        headings = self._detect_headings(pages, layout or {})
+        source = pages.text
+
+        sections: List[LogicalSection] = []
+        current = None
+        for record in pages.records():
+            for title, start, end in self._split_page(source, record, headings.get(record.page_number, [])):
+                if title is not None or current is None:
+                    current = LogicalSection(title=title, section_type=self._section_type(title), source=source)
+                    sections.append(current)
+                start, end = _strip_span(source, start, end)
+                if start < end:
+                    current.parts.append(SectionPart(record.page_number, start, end))
+
+        sections = [section for section in sections if section.parts]
+        return self._merge_small(self._split_large(sections))
+
+    def _detect_headings(self, pages: Mapping, layout: Dict[int, Dict[str, Any]]) -> Dict[int, List[str]]:
+        """Heading texts per page, in reading order"""
+        font_sizes = Counter()
+        for page_layout in layout.values():
+            font_sizes.update(page_layout.get('font_sizes', {}))
+        if not font_sizes:
+            return {}
+        body_size = font_sizes.most_common(1)[0][0]
+
+        candidates = {}
+        for page_number, page_layout in layout.items():
+            if page_number not in pages:
+                continue
+            candidates[page_number] = [
+                _normalize(line['text']) for line in page_layout.get('headings', [])
+                if len(line['text']) <= HEADING_MAX_CHARS
+                and _LETTER.search(line['text'])
+                and (line['size'] >= body_size * HEADING_SIZE_RATIO or (line['bold'] and line['size'] >= body_size))
+            ]
+
+        # Running headers and footers repeat on most pages
+        page_counts = Counter(text for texts in candidates.values() for text in set(texts))
+        repeat_limit = max(2, int(len(pages) * RUNNING_HEADER_SHARE))
+        return {
+            page_number: [text for text in texts if page_counts[text] <= repeat_limit]
+            for page_number, texts in candidates.items()
+        }
+
+    @staticmethod
+    def _split_page(source: str, record: PageRecord, headings: List[str]) -> List[Tuple[Optional[str], int, int]]:
+        """(heading or None, start, end) segments of a page, each heading line starts its segment"""
+        segments = [[None, record.start, record.start]]
+        remaining = list(headings)
+        offset = record.start
+        for line in source[record.start:record.end].split('\n'):
+            line_start, offset = offset, offset + len(line) + 1
+            normalized = _normalize(line)
+            if normalized and normalized in remaining:
+                # Headings come in reading order, skip any that never matched a line
+                del remaining[:remaining.index(normalized) + 1]
+                segments.append([normalized, line_start, line_start + len(line)])
+            else:
+                segments[-1][2] = line_start + len(line)
+        return [
+            (title, start, end) for title, start, end in segments
+            if title is not None or end > start
+        ]
+
+    @staticmethod
+    def _section_type(title: Optional[str]) -> str:
+        if title is not None and is_reference_heading(title) and 'acknowledg' not in title.lower():
+            return 'references'
+        return 'text'
+
+    def _split_large(self, sections: List[LogicalSection]) -> List[LogicalSection]:
+        """Split sections over the token budget at page, then line, boundaries"""
+        result = []
+        for section in sections:
+            if section.tokens <= self.max_tokens:
+                result.append(section)
+                continue
+
+            chunk = LogicalSection(title=section.title, section_type=section.section_type, source=section.source)
+            for part in section.parts:
+                for piece in self._split_part(section.source, part):
+                    if chunk.parts and chunk.tokens + piece.tokens > self.max_tokens:
+                        result.append(chunk)
+                        chunk = LogicalSection(
+                            title=section.title, section_type=section.section_type, source=section.source
+                        )
+                    chunk.parts.append(piece)
+            if chunk.parts:
+                result.append(chunk)
+        return result
+
+    def _split_part(self, source: str, part: SectionPart) -> List[SectionPart]:
+        """A page's text as pieces within the budget, cut between lines"""
+        if part.tokens <= self.max_tokens:
+            return [part]
+        max_chars = self.max_tokens * CHARS_PER_TOKEN
+        spans = []
+        piece_start = offset = part.start
+        for line in source[part.start:part.end].split('\n'):
+            if offset > piece_start and offset + len(line) - piece_start > max_chars:
+                spans.append((piece_start, offset - 1))
+                piece_start = offset
+            offset += len(line) + 1
+        spans.append((piece_start, part.end))
+
+        pieces = []
+        for start, end in spans:
+            start, end = _strip_span(source, start, end)
+            if start < end:
+                pieces.append(SectionPart(part.page_number, start, end))
+        return pieces
+
+    def _merge_small(self, sections: List[LogicalSection]) -> List[LogicalSection]:
+        """Merge sections under min_tokens into the following section of the same type"""
+        result = []
+        carry = None
+        for section in sections:
+            if carry is not None:
+                if (carry.section_type == section.section_type
+                        and carry.tokens + section.tokens <= self.max_tokens):
+                    section = LogicalSection(
+                        title=carry.title or section.title,
+                        section_type=section.section_type,
+                        parts=carry.parts + section.parts,
+                        source=section.source
+                    )
+                else:
+                    result.append(carry)
+                carry = None
+            if section.tokens < self.min_tokens:
+                carry = section
+            else:
+                result.append(section)
+        if carry is not None:
+            # A short last section joins the one before it when that fits
+            if (result and result[-1].section_type == carry.section_type
+                    and result[-1].tokens + carry.tokens <= self.max_tokens):
+                result[-1].parts.extend(carry.parts)
+            else:
+                result.append(carry)
+        return result
@@ -0,0 +1,195 @@
+# src/research_assistant/services/text_normalizer.py
+
+import re
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .page_buffer import PageBuffer
+from .semantic_sectioner import estimate_tokens
+
+# Lines examined at the top and bottom of each page for running headers and footers
+EDGE_LINES = 3
+# Lines that only differ in their numbers are only matched this close to the edge,
+# where page numbers and volume lines sit, not numbered body text
+NUMBERED_EDGE_LINES = 2
+# A line repeated at the same edge on this share of pages is boilerplate,
+# low enough to catch headers that alternate between odd and even pages
+BOILERPLATE_MIN_SHARE = 0.4
+# and on at least this many pages, fewer pages than this are never searched for repeats
+BOILERPLATE_MIN_PAGES = 3
+
+_DIGITS = re.compile(r'\d+')
+# A word broken across lines: letters then a hyphen (or soft hyphen) ending the line
+_BROKEN_WORD = re.compile(r'([^\W\d_])[-\u00ad\u2010]$')
+# Its continuation starts the next line in lower case
+_CONTINUATION = re.compile(r'^\s*([a-z][^\s]*)\s*')
+
+
+def _exact_key(line: str) -> str:
+    return ' '.join(line.lower().split())
+
+
+def _digit_key(line: str) -> str:
+    """Key that ignores numbers, so 'Page 3 of 10' and 'Page 4 of 10' match"""
+    return _DIGITS.sub('#', _exact_key(line))
+
+
+@dataclass
+class NormalizationStats:
+    """What normalization removed from a parse"""
+    tokens_before: int = 0
+    tokens_after: int = 0
+    lines_removed: int = 0
+    words_joined: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+    def add(self, other: 'NormalizationStats') -> None:
+        self.tokens_before += other.tokens_before
+        self.tokens_after += other.tokens_after
+        self.lines_removed += other.lines_removed
+        self.words_joined += other.words_joined
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'tokens_before': self.tokens_before,
+            'tokens_after': self.tokens_after,
+            'tokens_saved': self.tokens_saved,
+            'saved_percent': round(100 * self.tokens_saved / self.tokens_before, 1) if self.tokens_before else 0.0,
+            'lines_removed': self.lines_removed,
+            'words_joined': self.words_joined
+        }
+
+
+class TextNormalizer:
+    """
+    Strip running headers, footers and page numbers and rejoin hyphenated words.
+
+    Boilerplate is found by frequency and position: a line is stripped when
+    the same text appears within the first or last EDGE_LINES lines of at
+    least BOILERPLATE_MIN_SHARE of the pages, at the same edge. Lines that
+    only differ in their numbers (page numbers, 'Page 3 of 10', volume and
+    page ranges) count as the same text within the outer NUMBERED_EDGE_LINES
+    lines, unless the parser's layout marks them as headings, so numbered
+    section titles at the top of pages stay.
+
+    Detected boilerplate is remembered, so when a long document is processed
+    in page batches, a short final batch is still cleaned with what the
+    earlier batches found.
+    """
+
+    def __init__(self):
+        # (edge, key) pairs, edge is 'top' or 'bottom'
+        self.exact_boilerplate: Set[Tuple[str, str]] = set()
+        self.numbered_boilerplate: Set[Tuple[str, str]] = set()
+
+    def normalize(
+        self,
+        pages: Mapping,
+        layout: Optional[Dict[int, Dict[str, Any]]] = None
+    ) -> Tuple[PageBuffer, NormalizationStats]:
+        """
+        Two passes over the pages, one page's lines in memory at a time: the
+        first collects the edge lines, the second writes the cleaned pages.
+
+        Args:
+            pages (Mapping[int, str]): Page number -> page text, usually the parser's PageBuffer
+            layout (Dict[int, Dict]): Page number -> PDFParser layout, used to keep headings
+
+        Returns:
+            Tuple of the cleaned pages (pages left without text are dropped) and
+            the token counts before and after
+        """
+        layout = layout or {}
+        stats = NormalizationStats()
+        self._learn(pages)
+
+        cleaned = PageBuffer()
+        for page_num, page_text in pages.items():
+            stats.tokens_before += estimate_tokens(page_text)
+            headings = {_exact_key(line['text']) for line in layout.get(page_num, {}).get('headings', [])}
+            lines, removed = self._strip_boilerplate(page_text.split('\n'), headings)
+            lines, joined = self._dehyphenate(lines)
+            stats.lines_removed += removed
+            stats.words_joined += joined
+
+            text = '\n'.join(lines).strip()
+            if text:
+                cleaned.append(page_num, text)
+                stats.tokens_after += estimate_tokens(text)
+        return cleaned, stats
+
+    def _learn(self, pages: Mapping) -> None:
+        """Add the lines repeated at the same page edge to the known boilerplate"""
+        if len(pages) < BOILERPLATE_MIN_PAGES:
+            return
+        exact_counts = Counter()
+        numbered_counts = Counter()
+        for page_text in pages.values():
+            lines = page_text.split('\n')
+            exact, numbered = set(), set()
+            for edge, depth, line in self._edge_lines(lines):
+                exact.add((edge, _exact_key(line)))
+                if depth < NUMBERED_EDGE_LINES:
+                    numbered.add((edge, _digit_key(line)))
+            exact_counts.update(exact)
+            numbered_counts.update(numbered)
+
+        min_pages = max(BOILERPLATE_MIN_PAGES, int(len(pages) * BOILERPLATE_MIN_SHARE))
+        self.exact_boilerplate.update(key for key, count in exact_counts.items() if count >= min_pages)
+        self.numbered_boilerplate.update(key for key, count in numbered_counts.items() if count >= min_pages)
+
+    @staticmethod
+    def _edge_positions(lines: List[str]) -> Dict[int, Tuple[str, int]]:
+        """Line index -> (edge, depth) for the first and last EDGE_LINES non-empty lines"""
+        indexes = [index for index, line in enumerate(lines) if line.strip()]
+        positions = {index: ('bottom', depth) for depth, index in enumerate(reversed(indexes[-EDGE_LINES:]))}
+        positions.update((index, ('top', depth)) for depth, index in enumerate(indexes[:EDGE_LINES]))
+        return positions
+
+    def _edge_lines(self, lines: List[str]) -> List[Tuple[str, int, str]]:
+        """(edge, depth, line) for the lines at the top and bottom of a page"""
+        return [(edge, depth, lines[index]) for index, (edge, depth) in self._edge_positions(lines).items()]
+
+    def _strip_boilerplate(self, lines: List[str], headings: Set[str]) -> Tuple[List[str], int]:
+        if not self.exact_boilerplate and not self.numbered_boilerplate:
+            return lines, 0
+
+        positions = self._edge_positions(lines)
+        kept = []
+        for index, line in enumerate(lines):
+            if index in positions:
+                edge, depth = positions[index]
+                exact = _exact_key(line)
+                if (edge, exact) in self.exact_boilerplate or (
+                    depth < NUMBERED_EDGE_LINES
+                    and exact not in headings
+                    and (edge, _digit_key(line)) in self.numbered_boilerplate
+                ):
+                    continue
+            kept.append(line)
+        return kept, len(lines) - len(kept)
+
+    @staticmethod
+    def _dehyphenate(lines: List[str]) -> Tuple[List[str], int]:
+        """Move the rest of a word broken at a line end back onto its line"""
+        joined = 0
+        lines = list(lines)
+        emptied = set()
+        for index in range(len(lines) - 1):
+            line = lines[index].rstrip()
+            if not _BROKEN_WORD.search(line):
+                continue
+            continuation = _CONTINUATION.match(lines[index + 1])
+            if not continuation:
+                continue
+            lines[index] = line[:-1] + continuation.group(1)
+            lines[index + 1] = lines[index + 1][continuation.end():]
+            if not lines[index + 1]:
+                emptied.add(index + 1)
+            joined += 1
+        return [line for index, line in enumerate(lines) if index not in emptied], joined
@@ -0,0 +1,178 @@
+# src/research_assistant/tests/test_job_queue.py
+
+from datetime import timedelta
+from unittest import mock
+
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from research_assistant.models import DocumentMetadata, Job
+from research_assistant.services import job_queue
+from research_assistant.services.job_queue import JobWorker, claim_next, enqueue, requeue_stale_jobs
+
+
+def _document(**fields):
+    fields.setdefault('processing_status', 'pending')
+    return DocumentMetadata.objects.create(file_name='paper.pdf', url='http://example.com/paper.pdf', **fields)
+
+
+# JobWorker closes old connections between jobs, so these tests commit for real
+class ClaimNextTests(TransactionTestCase):
+
+    def test_claims_oldest_runnable_job(self):
+        first = enqueue('ingest', {'n': 1})
+        enqueue('ingest', {'n': 2})
+        enqueue('ingest', {'n': 3}, run_after=timezone.now() + timedelta(hours=1))
+
+        job = claim_next('worker-a')
+
+        self.assertEqual(job.id, first.id)
+        self.assertEqual(job.status, 'running')
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(job.locked_by, 'worker-a')
+        self.assertIsNotNone(job.heartbeat_at)
+
+    def test_only_claims_requested_kinds(self):
+        enqueue('ingest', {})
+        search = enqueue('search', {'search_id': 'x'})
+
+        self.assertEqual(claim_next('worker-a', kinds=['search']).id, search.id)
+        self.assertIsNone(claim_next('worker-a', kinds=['search']))
+
+    def test_empty_queue(self):
+        enqueue('ingest', {}, run_after=timezone.now() + timedelta(hours=1))
+        self.assertIsNone(claim_next('worker-a'))
+
+    def test_locks_candidate_with_skip_locked_when_supported(self):
+        job = enqueue('ingest', {})
+        original = QuerySet.select_for_update
+        calls = []
+
+        def select_for_update(queryset, *args, **kwargs):
+            calls.append(kwargs)
+            return original(queryset, *args, **kwargs)
+
+        with mock.patch.object(connection.features, 'has_select_for_update_skip_locked', True), \
+                mock.patch.object(QuerySet, 'select_for_update', select_for_update):
+            claimed = claim_next('worker-a')
+
+        self.assertEqual(claimed.id, job.id)
+        self.assertEqual(calls, [{'skip_locked': True}])
+
+    def test_conditional_update_skips_job_taken_by_another_worker(self):
+        raced = enqueue('ingest', {'n': 1})
+        other = enqueue('ingest', {'n': 2})
+        original = QuerySet.first
+        taken = []
+
+        def first(queryset):
+            candidate = original(queryset)
+            if not taken:
+                # Another worker claims the job between this worker's read and its update
+                Job.objects.filter(id=candidate.id).update(status='running', locked_by='worker-b')
+                taken.append(candidate.id)
+            return candidate
+
+        with mock.patch.object(connection.features, 'has_select_for_update_skip_locked', False), \
+                mock.patch.object(QuerySet, 'first', first):
+            claimed = claim_next('worker-a')
+
+        self.assertEqual(taken, [raced.id])
+        self.assertEqual(claimed.id, other.id)
+        raced.refresh_from_db()
+        self.assertEqual(raced.locked_by, 'worker-b')
+        self.assertEqual(raced.attempts, 0)
+
+
+class RequeueStaleJobsTests(TransactionTestCase):
+
+    def _running(self, document=None, attempts=1, heartbeat_age=600, max_attempts=3):
+        now = timezone.now()
+        return Job.objects.create(
+            kind='ingest',
+            document=document,
+            status='running',
+            attempts=attempts,
+            max_attempts=max_attempts,
+            locked_by='dead-worker',
+            locked_at=now - timedelta(seconds=heartbeat_age),
+            heartbeat_at=now - timedelta(seconds=heartbeat_age)
+        )
+
+    def test_requeues_job_without_heartbeat(self):
+        stale = self._running()
+        alive = self._running(heartbeat_age=10)
+
+        self.assertEqual(requeue_stale_jobs(stale_after_seconds=300), 1)
+
+        stale.refresh_from_db()
+        alive.refresh_from_db()
+        self.assertEqual(stale.status, 'queued')
+        self.assertIsNone(stale.locked_by)
+        self.assertEqual(stale.attempts, 1)
+        self.assertEqual(alive.status, 'running')
+        self.assertEqual(alive.locked_by, 'dead-worker')
+
+    def test_fails_job_after_max_attempts(self):
+        document = _document(processing_status='processing')
+        stale = self._running(document=document, attempts=3, max_attempts=3)
+
+        self.assertEqual(requeue_stale_jobs(stale_after_seconds=300), 0)
+
+        stale.refresh_from_db()
+        document.refresh_from_db()
+        self.assertEqual(stale.status, 'failed')
+        self.assertIn('gave up after 3 attempts', stale.error_message)
+        self.assertEqual(document.processing_status, 'failed')
+        self.assertEqual(document.error_message, stale.error_message)
+
+
+class HandlerFailureTests(TransactionTestCase):
+
+    def _run_ingest(self, max_attempts):
+        document = _document()
+        job = enqueue('ingest', {'document_id': str(document.id)}, document=document)
+        Job.objects.filter(id=job.id).update(max_attempts=max_attempts)
+        worker = JobWorker(worker_id='worker-a', kinds=['ingest'], poll_interval=0.01)
+        with mock.patch(
+            'research_assistant.services.job_handlers.IngestPipeline.run',
+            side_effect=RuntimeError('parse exploded')
+        ):
+            worker.run(drain=True)
+        job.refresh_from_db()
+        document.refresh_from_db()
+        return job, document
+
+    def test_failed_handler_fails_job_after_last_attempt(self):
+        job, document = self._run_ingest(max_attempts=1)
+
+        self.assertEqual(job.status, 'failed')
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(job.error_message, 'parse exploded')
+        self.assertEqual(document.processing_status, 'failed')
+        self.assertEqual(document.error_message, 'parse exploded')
+
+    def test_failed_handler_is_retried_with_backoff(self):
+        before = timezone.now()
+        job, document = self._run_ingest(max_attempts=3)
+
+        self.assertEqual(job.status, 'queued')
+        self.assertEqual(job.attempts, 1)
+        self.assertIsNone(job.locked_by)
+        self.assertEqual(job.error_message, 'parse exploded')
+        self.assertGreaterEqual(job.run_after, before + timedelta(seconds=job_queue.RETRY_BACKOFF_SECONDS))
+        # Pending again while the retry waits
+        self.assertEqual(document.processing_status, 'pending')
+        self.assertIsNone(document.error_message)
+
+    def test_successful_handler_completes_job(self):
+        document = _document()
+        job = enqueue('ingest', {'document_id': str(document.id)}, document=document)
+        with mock.patch('research_assistant.services.job_handlers.IngestPipeline.run'):
+            JobWorker(worker_id='worker-a', kinds=['ingest'], poll_interval=0.01).run(drain=True)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'completed')
+        self.assertIsNone(job.error_message)
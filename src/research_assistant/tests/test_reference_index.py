@@ -0,0 +1,76 @@
+# src/research_assistant/tests/test_reference_index.py
+
+from django.test import SimpleTestCase
+
+from research_assistant.services.reference_index import ReferenceIndex, parse_author_year
+from research_assistant.services.reference_section import extract_reference_section
+
+
+def _numbered(*texts):
+    return {'entries': {
+        str(number): {'text': f'[{number}] {text}', 'type': 'numbered_bracket'}
+        for number, text in enumerate(texts, start=1)
+    }}
+
+
+class ParseAuthorYearTests(SimpleTestCase):
+
+    def test_author_year_and_suffix(self):
+        self.assertEqual(parse_author_year('Kim et al., 2016a'), ('kim', '2016', 'a'))
+        self.assertEqual(parse_author_year('S. Smith, Title, 2001.'), ('smith', '2001', ''))
+        self.assertIsNone(parse_author_year('Kim et al.'))
+
+
+class ReferenceIndexTests(SimpleTestCase):
+
+    def test_numbered_citation_resolves_by_number(self):
+        index = ReferenceIndex(_numbered('Kim, J. First. 2016.', 'Lee, S. Second. 2017.', 'Park, H. Third. 2018.'))
+
+        resolved = index.resolve('numbered', '1, 3')
+
+        self.assertEqual([entry['text'] for entry in resolved],
+                         ['[1] Kim, J. First. 2016.', '[3] Park, H. Third. 2018.'])
+        self.assertEqual(index.resolve('numbered', '7'), [])
+
+    def test_explicit_suffix_picks_matching_entry(self):
+        index = ReferenceIndex(_numbered('Kim, J. Later. 2016b.', 'Kim, J. Earlier. 2016a.'))
+
+        self.assertEqual(index.resolve('parenthetical', 'Kim et al., 2016a')[0]['text'], '[2] Kim, J. Earlier. 2016a.')
+        self.assertEqual(index.resolve('parenthetical', 'Kim et al., 2016b')[0]['text'], '[1] Kim, J. Later. 2016b.')
+
+    def test_missing_suffix_in_suffixed_list_resolves_nothing(self):
+        index = ReferenceIndex(_numbered('Kim, J. Earlier. 2016a.', 'Kim, J. Later. 2016b.'))
+
+        self.assertEqual(index.resolve('parenthetical', 'Kim et al., 2016c'), [])
+
+    def test_citation_without_suffix_finds_every_entry_of_the_year(self):
+        index = ReferenceIndex(_numbered('Kim, J. Earlier. 2016a.', 'Kim, J. Later. 2016b.', 'Kim, J. Other. 2017.'))
+
+        self.assertEqual(len(index.resolve('parenthetical', 'Kim, 2016')), 2)
+
+    def test_suffix_counts_list_order_when_list_has_no_suffixes(self):
+        index = ReferenceIndex(_numbered('Kim, J. Earlier. 2016.', 'Kim, J. Later. 2016.'))
+
+        self.assertEqual(index.lookup('kim', '2016', 'a')[0]['text'], '[1] Kim, J. Earlier. 2016.')
+        self.assertEqual(index.lookup('kim', '2016', 'b')[0]['text'], '[2] Kim, J. Later. 2016.')
+        self.assertEqual(index.lookup('kim', '2016', 'c'), [])
+
+    def test_surnames_match_without_accents(self):
+        index = ReferenceIndex(_numbered('Müller, K. Title. 2019.'))
+
+        self.assertEqual(len(index.resolve('narrative', 'Muller et al. (2019)')), 1)
+        self.assertEqual(len(index.resolve('parenthetical', 'MÜLLER, 2019')), 1)
+
+    def test_resolves_against_extracted_apa_section(self):
+        reference_data = extract_reference_section([
+            'Introduction text citing (Kim et al., 2016b).',
+            'References\n'
+            'Kim, J., Lee, S., & Park, H. (2016a). Early results. Journal, 1, 1-10.\n'
+            'Kim, J., & Chen, L. (2016b). Later results. Journal, 2, 11-20.',
+        ])
+
+        resolved = ReferenceIndex(reference_data).resolve('parenthetical', 'Kim et al., 2016b')
+
+        self.assertEqual(len(resolved), 1)
+        self.assertIn('Later results', resolved[0]['text'])
+        self.assertEqual(resolved[0]['type'], 'apa')
@@ -0,0 +1,127 @@
+# src/research_assistant/tests/test_semantic_sectioner.py
+
+from django.test import SimpleTestCase
+
+from research_assistant.services.semantic_sectioner import SemanticSectioner, page_at
+
+# 100 characters, 25 tokens
+BODY_LINE = ' '.join(['word'] * 20) + '.'
+
+
+def _body(lines):
+    return '\n'.join([BODY_LINE] * lines)
+
+
+def _layout(*headings, size=14.0, bold=False):
+    """PDFParser page layout with 10pt body text and the given heading lines"""
+    return {
+        'font_sizes': {10.0: 2000, size: 20},
+        'headings': [{'text': text, 'size': size, 'bold': bold} for text in headings]
+    }
+
+
+class SemanticSectionerTests(SimpleTestCase):
+
+    def test_headings_start_sections_across_pages(self):
+        pages = {
+            1: 'Introduction\n' + _body(2),
+            2: _body(1) + '\nMethods\n' + _body(2),
+        }
+        layout = {1: _layout('Introduction'), 2: _layout('Methods')}
+
+        sections = SemanticSectioner(max_tokens=1000, min_tokens=0).split(pages, layout)
+
+        self.assertEqual([section.title for section in sections], ['Introduction', 'Methods'])
+        self.assertEqual(sections[0].pages, [1, 2])
+        self.assertEqual(sections[1].pages, [2])
+        self.assertTrue(sections[1].text.startswith('Methods\n'))
+
+    def test_bold_line_at_body_size_is_a_heading(self):
+        pages = {1: 'Background\n' + _body(2) + '\nsmall print\n' + _body(2)}
+        layout = {1: {
+            'font_sizes': {10.0: 2000, 8.0: 20},
+            'headings': [
+                {'text': 'Background', 'size': 10.0, 'bold': True},
+                {'text': 'small print', 'size': 8.0, 'bold': True},
+            ]
+        }}
+
+        sections = SemanticSectioner(max_tokens=1000, min_tokens=0).split(pages, layout)
+
+        self.assertEqual([section.title for section in sections], ['Background'])
+
+    def test_running_header_is_not_a_heading(self):
+        pages = {number: 'Journal of Tests\n' + _body(1) for number in range(1, 11)}
+        pages[4] = 'Journal of Tests\nDiscussion\n' + _body(1)
+        layout = {number: _layout('Journal of Tests') for number in pages}
+        layout[4] = _layout('Journal of Tests', 'Discussion')
+
+        sections = SemanticSectioner(max_tokens=10000, min_tokens=0).split(pages, layout)
+
+        self.assertEqual([section.title for section in sections], [None, 'Discussion'])
+        self.assertEqual(sections[1].pages, list(range(4, 11)))
+
+    def test_large_section_is_split_at_page_then_line_boundaries(self):
+        pages = {1: 'Results\n' + _body(2), 2: _body(10)}
+        layout = {1: _layout('Results')}
+
+        sections = SemanticSectioner(max_tokens=60, min_tokens=0).split(pages, layout)
+
+        self.assertGreater(len(sections), 2)
+        self.assertTrue(all(section.tokens <= 60 for section in sections))
+        self.assertTrue(all(section.title == 'Results' for section in sections))
+        # The first page fits the budget and stays whole
+        self.assertEqual(sections[0].pages, [1])
+        self.assertEqual(sum(section.text.count(BODY_LINE) for section in sections), 12)
+
+    def test_small_section_merges_into_next(self):
+        pages = {1: 'A Study of Tests\nJ. Author', 2: 'Introduction\n' + _body(4)}
+        layout = {2: _layout('Introduction')}
+
+        sections = SemanticSectioner(max_tokens=1000, min_tokens=50).split(pages, layout)
+
+        self.assertEqual(len(sections), 1)
+        self.assertEqual(sections[0].title, 'Introduction')
+        self.assertEqual(sections[0].pages, [1, 2])
+
+    def test_references_are_typed_and_not_merged_with_text(self):
+        pages = {
+            1: 'Conclusion\n' + _body(1),
+            2: 'References\n[1] Kim, J. Title. 2016.',
+        }
+        layout = {1: _layout('Conclusion'), 2: _layout('References')}
+
+        sections = SemanticSectioner(max_tokens=1000, min_tokens=500).split(pages, layout)
+
+        self.assertEqual([section.section_type for section in sections], ['text', 'references'])
+        self.assertEqual(sections[1].title, 'References')
+
+    def test_acknowledgements_are_text(self):
+        pages = {1: 'Acknowledgements\n' + _body(1)}
+        layout = {1: _layout('Acknowledgements')}
+
+        sections = SemanticSectioner(max_tokens=1000, min_tokens=0).split(pages, layout)
+
+        self.assertEqual(sections[0].section_type, 'text')
+
+    def test_without_layout_pages_are_packed(self):
+        pages = {1: _body(1), 2: _body(1), 3: _body(1)}
+
+        sections = SemanticSectioner(max_tokens=60, min_tokens=0).split(pages)
+
+        self.assertEqual([section.pages for section in sections], [[1, 2], [3]])
+        self.assertEqual([section.title for section in sections], [None, None])
+
+    def test_page_at_maps_normalised_positions_to_pages(self):
+        pages = {1: 'Methods\n  ' + _body(1), 2: _body(1)}
+        section = SemanticSectioner(max_tokens=1000, min_tokens=0).split(pages, {1: _layout('Methods')})[0]
+
+        page_starts = section.page_starts()
+        normalized = ' '.join(section.text.split())
+        second_page = normalized.index(BODY_LINE, normalized.index(BODY_LINE) + 1)
+
+        self.assertEqual(page_starts[0], (0, 1))
+        self.assertEqual(page_at(page_starts, 0), 1)
+        self.assertEqual(page_at(page_starts, second_page - 1), 1)
+        self.assertEqual(page_at(page_starts, second_page), 2)
+        self.assertEqual(page_at(page_starts, len(normalized) + 50), 2)
@@ -0,0 +1,145 @@
+# src/research_assistant/tests/test_text_normalizer.py
+
+from django.test import SimpleTestCase
+
+from research_assistant.services.text_normalizer import NormalizationStats, TextNormalizer
+
+WORDS = ['alpha', 'bravo', 'charlie', 'delta', 'echo', 'foxtrot', 'golf', 'hotel', 'india', 'juliet', 'kilo']
+# Body lines per page
+BODY_LINES = 6
+
+
+def _body(number, line=0):
+    """A body line that appears once in a document"""
+    return f'The {WORDS[number]} {WORDS[line]} results are described in this paragraph.'
+
+
+def _pages(count, top=None, bottom=None):
+    """
+    Page number -> text with BODY_LINES body lines, long enough that the top
+    and bottom edges do not overlap. top and bottom are callables of the page number.
+    """
+    pages = {}
+    for number in range(1, count + 1):
+        lines = [_body(number, line) for line in range(BODY_LINES)]
+        if top:
+            lines.insert(0, top(number))
+        if bottom:
+            lines.append(bottom(number))
+        pages[number] = '\n'.join(lines)
+    return pages
+
+
+class BoilerplateTests(SimpleTestCase):
+
+    def test_header_on_min_share_of_pages_is_stripped(self):
+        # 4 of 10 pages is BOILERPLATE_MIN_SHARE
+        pages = _pages(10, top=lambda number: 'Journal of Tests' if number % 5 in (1, 2) else _body(number, BODY_LINES))
+
+        cleaned, stats = TextNormalizer().normalize(pages)
+
+        self.assertNotIn('Journal of Tests', cleaned.text)
+        self.assertEqual(stats.lines_removed, 4)
+
+    def test_header_below_min_share_is_kept(self):
+        pages = _pages(10, top=lambda number: 'Journal of Tests' if number <= 3 else _body(number, BODY_LINES))
+
+        cleaned, stats = TextNormalizer().normalize(pages)
+
+        self.assertEqual(cleaned.text.count('Journal of Tests'), 3)
+        self.assertEqual(stats.lines_removed, 0)
+
+    def test_too_few_pages_are_not_searched(self):
+        pages = _pages(2, top=lambda number: 'Journal of Tests')
+
+        cleaned, stats = TextNormalizer().normalize(pages)
+
+        self.assertEqual(cleaned.text.count('Journal of Tests'), 2)
+        self.assertEqual(stats.lines_removed, 0)
+
+    def test_numbered_footer_is_matched_ignoring_numbers(self):
+        pages = _pages(5, bottom=lambda number: f'Page {number} of 5')
+
+        cleaned, _ = TextNormalizer().normalize(pages)
+
+        self.assertNotIn('Page', cleaned.text)
+        self.assertEqual(cleaned[1], '\n'.join(_body(1, line) for line in range(BODY_LINES)))
+
+    def test_numbered_lines_away_from_the_edge_are_kept(self):
+        pages = {
+            number: '\n'.join(
+                [_body(number, 0), _body(number, 1), f'Figure {number} shows the results']
+                + [_body(number, line) for line in range(2, 7)]
+            )
+            for number in range(1, 6)
+        }
+
+        cleaned, _ = TextNormalizer().normalize(pages)
+
+        self.assertEqual(cleaned.text.count('shows the results'), 5)
+
+    def test_numbered_layout_heading_is_kept(self):
+        pages = _pages(5, top=lambda number: f'{number} Section')
+        layout = {3: {'font_sizes': {}, 'headings': [{'text': '3 Section', 'size': 14.0, 'bold': True}]}}
+
+        cleaned, stats = TextNormalizer().normalize(pages, layout)
+
+        self.assertEqual(cleaned[3].split('\n')[0], '3 Section')
+        self.assertNotIn('1 Section', cleaned.text)
+        self.assertEqual(stats.lines_removed, 4)
+
+    def test_boilerplate_is_remembered_across_batches(self):
+        normalizer = TextNormalizer()
+        normalizer.normalize(_pages(5, top=lambda number: 'Journal of Tests'))
+
+        cleaned, stats = normalizer.normalize({6: f'Journal of Tests\n{_body(6)}'})
+
+        self.assertEqual(cleaned[6], _body(6))
+        self.assertEqual(stats.lines_removed, 1)
+
+
+class DehyphenationTests(SimpleTestCase):
+
+    def test_broken_word_is_rejoined(self):
+        cleaned, stats = TextNormalizer().normalize({1: 'trade between inter-\nnational partners'})
+
+        self.assertEqual(cleaned[1], 'trade between international\npartners')
+        self.assertEqual(stats.words_joined, 1)
+
+    def test_whole_continuation_line_is_dropped(self):
+        cleaned, _ = TextNormalizer().normalize({1: 'a single inter-\nnational\nnext line'})
+
+        self.assertEqual(cleaned[1], 'a single international\nnext line')
+
+    def test_capitalised_continuation_is_not_joined(self):
+        cleaned, stats = TextNormalizer().normalize({1: 'the well-\nKnown result'})
+
+        self.assertEqual(cleaned[1], 'the well-\nKnown result')
+        self.assertEqual(stats.words_joined, 0)
+
+
+class NormalizationStatsTests(SimpleTestCase):
+
+    def test_counts_and_dict(self):
+        stats = NormalizationStats(tokens_before=200, tokens_after=150, lines_removed=3)
+        stats.add(NormalizationStats(tokens_before=200, tokens_after=200, words_joined=2))
+
+        self.assertEqual(stats.tokens_saved, 50)
+        self.assertEqual(stats.to_dict(), {
+            'tokens_before': 400,
+            'tokens_after': 350,
+            'tokens_saved': 50,
+            'saved_percent': 12.5,
+            'lines_removed': 3,
+            'words_joined': 2
+        })
+        self.assertEqual(NormalizationStats().to_dict()['saved_percent'], 0.0)
+
+    def test_normalize_counts_tokens(self):
+        pages = _pages(5, bottom=lambda number: f'Page {number} of 5')
+
+        cleaned, stats = TextNormalizer().normalize(pages)
+
+        self.assertEqual(stats.lines_removed, 5)
+        self.assertGreater(stats.tokens_before, stats.tokens_after)
+        self.assertEqual(stats.tokens_after, sum(len(text) // 4 for text in cleaned.values()))
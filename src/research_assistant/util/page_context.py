@@ -0,0 +1,35 @@
+# src/research_assistant/util/page_context.py
+# Neighbouring-page context for a page, computed on demand instead of stored with it
+
+from typing import Optional
+
+
+def context_window(
+    text: str,
+    prev_text: Optional[str] = None,
+    next_text: Optional[str] = None,
+    window_size: int = 0
+) -> str:
+    """
+    Page text with the last window_size words of the previous page before it
+    and the first window_size words of the next page after it.
+
+    Args:
+        text (str): The page's own text
+        prev_text (str): Previous page text, None when there is no previous page
+        next_text (str): Next page text, None when there is no next page
+        window_size (int): Words to take from each neighbour, 0 returns text unchanged
+
+    Returns:
+        str: Context parts joined by newlines
+    """
+    if window_size <= 0:
+        return text
+
+    context = []
+    if prev_text:
+        context.append(' '.join(prev_text.split()[-window_size:]))
+    context.append(text)
+    if next_text:
+        context.append(' '.join(next_text.split()[:window_size]))
+    return '\n'.join(context)
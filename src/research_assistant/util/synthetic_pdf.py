@@ -0,0 +1,180 @@
+# src/research_assistant/util/synthetic_pdf.py
+# Generate synthetic PDFs offline with PyMuPDF for parser benchmarks
+
+import random
+from typing import Tuple
+
+import fitz
+
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+MARGIN = 72
+
+WORDS = (
+    "model data analysis results method study participants sample research "
+    "framework evidence learning network approach performance evaluation "
+    "experiment significant effect measure theory literature review system"
+).split()
+
+SURNAMES = (
+    "Smith Johnson Garcia Chen Patel Kim Nguyen Okafor Schmidt Rossi "
+    "Tanaka Silva Kowalski Andersen Moreau Haddad Novak Murphy Ivanova Costa"
+).split()
+
+# Reference list styles, mirroring what DocumentProcessor has to recognise
+REFERENCE_STYLES = ('numbered_bracket', 'numbered_dot', 'author_year')
+
+REFERENCES_PER_PAGE = 25
+
+
+def _reference_author(index: int) -> Tuple[str, int]:
+    """Deterministic first author and year for reference number index"""
+    return SURNAMES[index % len(SURNAMES)], 1990 + (index * 7) % 34
+
+
+def _citation(rng: random.Random, style: str, reference_count: int) -> str:
+    """Build an in-text citation for a reference style"""
+    index = rng.randint(1, reference_count)
+    if style == 'author_year':
+        surname, year = _reference_author(index)
+        return f"({surname} et al., {year})"
+    return f"[{index}]"
+
+
+def _reference_entry(rng: random.Random, style: str, index: int) -> str:
+    """Build one reference list entry"""
+    surname, year = _reference_author(index)
+    title = ' '.join(rng.choices(WORDS, k=rng.randint(5, 9))).capitalize()
+    venue = f"Journal of {rng.choice(WORDS).capitalize()} {rng.choice(WORDS).capitalize()}"
+    details = f"{rng.randint(1, 40)}({rng.randint(1, 12)}), {rng.randint(1, 300)}-{rng.randint(301, 600)}"
+    if style == 'numbered_bracket':
+        return f"[{index}] {surname[0]}. {surname}, {title}. {venue}, {details}, {year}."
+    if style == 'numbered_dot':
+        return f"{index}. {surname}, {surname[0]}. {title}. {venue}, {details}, {year}."
+    return f"{surname}, {surname[0]}. ({year}). {title}. {venue}, {details}."
+
+
+def _paragraph(
+    rng: random.Random,
+    sentences: int = 6,
+    reference_style: str = None,
+    reference_count: int = 0
+) -> str:
+    """Build a paragraph of pseudo academic prose, with citations when a reference style is given"""
+    lines = []
+    for _ in range(sentences):
+        words = rng.choices(WORDS, k=rng.randint(8, 16))
+        sentence = ' '.join(words).capitalize()
+        if reference_style and rng.random() < 0.3:
+            sentence += ' ' + _citation(rng, reference_style, reference_count)
+        lines.append(sentence + '.')
+    return ' '.join(lines)
+
+
+def _draw_table(page: fitz.Page, top: float, rows: int = 4, cols: int = 3) -> float:
+    """Draw a ruled table and return the y coordinate below it"""
+    cell_width = (PAGE_WIDTH - 2 * MARGIN) / cols
+    cell_height = 18
+    for r in range(rows + 1):
+        y = top + r * cell_height
+        page.draw_line((MARGIN, y), (PAGE_WIDTH - MARGIN, y))
+    for c in range(cols + 1):
+        x = MARGIN + c * cell_width
+        page.draw_line((x, top), (x, top + rows * cell_height))
+    for r in range(rows):
+        for c in range(cols):
+            label = f"H{c + 1}" if r == 0 else f"{r}.{c}"
+            page.insert_text((MARGIN + c * cell_width + 4, top + r * cell_height + 13), label, fontsize=9)
+    return top + rows * cell_height + 20
+
+
+def _draw_image(page: fitz.Page, top: float, size: int = 96) -> float:
+    """Insert a solid colour bitmap and return the y coordinate below it"""
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, size, size), 0)
+    pix.clear_with(180)
+    page.insert_image(fitz.Rect(MARGIN, top, MARGIN + size, top + size), pixmap=pix)
+    return top + size + 20
+
+
+def generate_text(
+    paragraphs: int = 5,
+    seed: int = 0,
+    reference_style: str = None,
+    reference_count: int = 40
+) -> str:
+    """Page-like block of synthetic prose, with citations when a reference style is given"""
+    rng = random.Random(seed)
+    return '\n\n'.join(
+        _paragraph(rng, reference_style=reference_style, reference_count=reference_count)
+        for _ in range(paragraphs)
+    )
+
+
+def generate_pdf(
+    path: str,
+    page_count: int,
+    table_every: int = 0,
+    image_every: int = 0,
+    seed: int = 0,
+    reference_style: str = None,
+    reference_count: int = 40
+) -> str:
+    """
+    Write a synthetic PDF to path.
+
+    Args:
+        path (str): Output file path
+        page_count (int): Number of pages
+        table_every (int): Draw a ruled table on every Nth page (0 disables)
+        image_every (int): Insert a bitmap on every Nth page (0 disables)
+        seed (int): Random seed so runs are reproducible
+        reference_style (str): One of REFERENCE_STYLES to add in-text citations and
+            a trailing "References" section, None for no references
+        reference_count (int): Number of reference list entries
+
+    Returns:
+        str: The output path
+    """
+    if reference_style is not None and reference_style not in REFERENCE_STYLES:
+        raise ValueError(f"Unknown reference style '{reference_style}', expected one of {REFERENCE_STYLES}")
+
+    rng = random.Random(seed)
+    doc = fitz.open()
+    text_rect_width = PAGE_WIDTH - 2 * MARGIN
+
+    for page_num in range(1, page_count + 1):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        top = MARGIN
+
+        page.insert_text((MARGIN, top), f"Section {page_num}", fontsize=14)
+        top += 24
+
+        if table_every and page_num % table_every == 0:
+            top = _draw_table(page, top)
+        if image_every and page_num % image_every == 0:
+            top = _draw_image(page, top)
+
+        page.insert_textbox(
+            fitz.Rect(MARGIN, top, MARGIN + text_rect_width, PAGE_HEIGHT - MARGIN),
+            '\n\n'.join(_paragraph(rng, reference_style=reference_style, reference_count=reference_count)
+                       for _ in range(3)),
+            fontsize=10
+        )
+
+    if reference_style:
+        entries = [_reference_entry(rng, reference_style, index) for index in range(1, reference_count + 1)]
+        for offset in range(0, len(entries), REFERENCES_PER_PAGE):
+            page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+            top = MARGIN
+            if offset == 0:
+                page.insert_text((MARGIN, top), "References", fontsize=14)
+                top += 24
+            page.insert_textbox(
+                fitz.Rect(MARGIN, top, MARGIN + text_rect_width, PAGE_HEIGHT - MARGIN),
+                '\n'.join(entries[offset:offset + REFERENCES_PER_PAGE]),
+                fontsize=8
+            )
+
+    doc.save(path)
+    doc.close()
+    return path
@@ -12,15 +12,15 @@ from typing import Dict, List
 import logging
 from concurrent.futures import ThreadPoolExecutor
 
-import threading
-from threading import Lock
-import time
-
 from rest_framework.permissions import IsAuthenticated
+from django.db.models import Count
 
-from ..models import DocumentMetadata, DocumentSection, SearchResult, DocumentRelationship, LLMResponseCache
-from ..services.document_processor import DocumentProcessor
-from ..services.document_summarizer import DocumentSummarizer
+from ..models import DocumentMetadata, DocumentSection, SearchResult, DocumentRelationship, LLMResponseCache, Job
+from ..services.concurrency import utilisation
+from ..services.job_queue import (
+    admission_retry_after, average_job_seconds, enqueue, estimate_wait_seconds, queue_position, queue_positions
+)
+from ..services.ingest_progress import suggest_poll_seconds
 
 
 
@@ -30,93 +30,13 @@ class DocumentManagementViewSet(viewsets.ViewSet):
 
     permission_classes = [IsAuthenticated]
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.processing_threads = {}
-        self.thread_lock = Lock()  # Add thread lock for thread safety
-        self.max_concurrent_processes = 3  # Limit concurrent processing tasks
-
-    # The _process_document_background method needs this fix to properly handle thread cleanup
-    def _process_document_background(self, document_id, file_data, user):
-        """Background processing task for a single document"""
-        document_id_str = str(document_id)  # Ensure we have string version
-        try:
-            print(f"[_process_document_background] Starting background processing for: {file_data['file_name']}")
-            
-            # Get the document
-            document = DocumentMetadata.objects.get(id=document_id)
-            document.processing_status = 'processing'
-            document.save()
-            
-            # Initialize processors
-            doc_processor = DocumentProcessor(
-                document_id=file_data["file_id"],
-                document_url=file_data['file_url']
-            )
-            
-            # Process document
-            sections, reference_data = doc_processor.process_document_from_url(
-                file_data['file_url']
-            )
-            
-            summarizer = DocumentSummarizer()
-            total_pages = doc_processor.get_total_pages()
-            
-            # Get metadata
-            metadata = summarizer.generate_summary(
-                sections[:2],
-                document.id
-            )
-            
-            # Update document metadata
-            for field, value in metadata.items():
-                setattr(document, field, value)
-            
-            document.reference = reference_data
-            document.processing_status = 'completed'
-            document.total_pages = total_pages
-            document.save()
-            
-            # Store sections
-            for section_data in sections:
-                section = DocumentSection.objects.create(
-                    document=document,
-                    section_type=section_data['content'].get('type', 'text'),
-                    content=section_data['content'].get('text', ''),
-                    section_start_page_number=int(section_data['section_start_page_number']),
-                    prev_page_text=section_data.get('prev_page_text'),
-                    next_page_text=section_data.get('next_page_text'),
-                    has_citations=bool(section_data['content'].get('has_citations', False)),
-                    citations=section_data.get('citations', {})
-                )
-                
-                # Handle tables and images
-                if 'elements' in section_data:
-                    section.set_elements(section_data['elements'])
-                    section.save()
-            
-            print(f"[_process_document_background] Completed processing document: {document.id}")
-            
-        except Exception as e:
-            print(f"[_process_document_background] Error processing document: {str(e)}")
-            # Update document status to failed
-            try:
-                document = DocumentMetadata.objects.get(id=document_id)
-                document.processing_status = 'failed'
-                document.error_message = str(e)
-                document.save()
-            except Exception as inner_e:
-                print(f"[_process_document_background] Failed to update document status: {str(inner_e)}")
-        finally:
-            # Remove the thread from tracking with thread safety
-            with self.thread_lock:
-                if document_id_str in self.processing_threads:
-                    del self.processing_threads[document_id_str]
-
-    # Fix to upload_documents to use proper thread safety
     @action(detail=False, methods=['POST'])
     def upload_documents(self, request):
-        """Handle document uploads with immediate response and background processing"""
+        """
+        Queue uploaded documents for run_workers and answer 202 at once with each
+        document's queue position. When the ingest queue is full nothing is
+        created and the answer is 503 with a Retry-After estimate.
+        """
         data = request.data
         if not isinstance(data, list):
             data = [data]
@@ -134,14 +54,27 @@ class DocumentManagementViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        # Basic validation
+        data = [file_data for file_data in data if all(k in file_data for k in ['file_url', 'file_id', 'file_type'])]
+
+        # Admission control, the request never waits for ingest capacity
+        retry_after = admission_retry_after('ingest', len(data)) if data else None
+        if retry_after is not None:
+            return Response(
+                {
+                    'status': 'error',
+                    'message': 'The processing queue is full, please retry later',
+                    'retry_after': retry_after
+                },
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': str(retry_after)}
+            )
+
         # Create pending documents and return immediately
         pending_documents = []
+        job_seconds = average_job_seconds('ingest')
         for file_data in data:
             try:
-                # Basic validation
-                if not all(k in file_data for k in ['file_url', 'file_id', 'file_type']):
-                    continue
-                
                 # Create pending document
                 document = DocumentMetadata.objects.create(
                     user=request.user, 
@@ -150,6 +83,11 @@ class DocumentManagementViewSet(viewsets.ViewSet):
                     processing_status='pending'
                 )
                 
+                # A run_workers process picks the job up, it survives restarts of this one
+                job = enqueue('ingest', {'document_id': str(document.id), 'file_id': file_data['file_id']}, document=document)
+                position = queue_position(job)
+                wait_seconds = estimate_wait_seconds('ingest', jobs_ahead=position - 1, job_seconds=job_seconds)
+
                 pending_documents.append({
                     'document_id': str(document.id),
                     'title': document.file_name,
@@ -161,33 +99,12 @@ class DocumentManagementViewSet(viewsets.ViewSet):
                     'processing_status': 'pending',
                     'file_name': document.file_name,
                     'file_url': document.url,
-                    'created_at': document.created_at
+                    'created_at': document.created_at,
+                    'queue_position': position,
+                    'estimated_start_seconds': wait_seconds,
+                    'poll_after': suggest_poll_seconds(document, wait_seconds=wait_seconds)
                 })
                 
-                # Use thread safety when checking active threads
-                with self.thread_lock:
-                    current_thread_count = len(self.processing_threads)
-                
-                # Wait if we're at max capacity
-                while current_thread_count >= self.max_concurrent_processes:
-                    time.sleep(0.5)
-                    with self.thread_lock:
-                        current_thread_count = len(self.processing_threads)
-                
-                # Create background thread for processing
-                document_id_str = str(document.id)
-                thread = threading.Thread(
-                    target=self._process_document_background,
-                    args=(document.id, file_data, request.user)
-                )
-                thread.daemon = True  # Allow thread to exit when main thread exits
-                
-                # Add to tracking dict with thread safety
-                with self.thread_lock:
-                    self.processing_threads[document_id_str] = thread
-                
-                thread.start()
-                
             except Exception as e:
                 print(f"[upload_documents] Error creating document: {str(e)}")
         
@@ -200,9 +117,36 @@ class DocumentManagementViewSet(viewsets.ViewSet):
         return Response({
             'status': 'success',
             'documents': pending_documents,
-            'message': f"Started processing {len(pending_documents)} documents"
-        })
+            'message': f"Queued {len(pending_documents)} documents for processing"
+        }, status=status.HTTP_202_ACCEPTED)
     
+    @action(detail=False, methods=['GET'], url_path='processing-capacity')
+    def processing_capacity(self, request):
+        """Live use of the background workload classes against their concurrency limits"""
+        try:
+            queued = dict(
+                Job.objects.filter(status='queued').values_list('kind').annotate(count=Count('id'))
+            )
+            workloads = utilisation()
+            for name, workload in workloads.items():
+                workload['queued'] = queued.get(name, 0)
+                # Holders name hosts and processes, only for staff
+                if not request.user.is_staff:
+                    del workload['holders']
+            return Response({
+                'status': 'success',
+                'workloads': workloads
+            })
+
+        except Exception as e:
+            return Response(
+                {
+                    'status': 'error',
+                    'message': str(e)
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
     @action(detail=False, methods=['GET'])
     def get_documents(self, request):
         """Retrieve all documents"""
@@ -231,6 +175,7 @@ class DocumentManagementViewSet(viewsets.ViewSet):
                     'references': doc.reference or {},
                     'citation': doc.citation,
                     'processing_status': doc.processing_status,
+                    'is_searchable': doc.is_searchable,
                     'file_name': doc.file_name,
                     'file_url': doc.url,
                     'created_at': doc.created_at,
@@ -265,6 +210,16 @@ class DocumentManagementViewSet(viewsets.ViewSet):
                 id__in=document_ids,
                 user=request.user
             )
+            # Documents still waiting for a worker, positioned and priced once for the whole request
+            queued_jobs = dict(
+                Job.objects.filter(document__in=documents, kind='ingest', status='queued')
+                .values_list('document_id', 'id')
+            )
+            positions = queue_positions('ingest', queued_jobs.values())
+            queue_position_of = {
+                document_id: positions[job_id] for document_id, job_id in queued_jobs.items() if job_id in positions
+            }
+            job_seconds = average_job_seconds('ingest') if queue_position_of else None
             print(documents[0].citation)
             # print(x)
             # Format response
@@ -279,10 +234,24 @@ class DocumentManagementViewSet(viewsets.ViewSet):
                     'references': doc.reference or {},
                     'citation': doc.citation,
                     'processing_status': doc.processing_status,
+                    'processing_stage': doc.processing_stage,
+                    'processing_progress': doc.processing_progress,
+                    'pages_parsed': doc.pages_parsed,
+                    'page_count': doc.page_count,
+                    'is_searchable': doc.is_searchable,
                     'file_name': doc.file_name,
                     'file_url': doc.url,
                     'created_at': doc.created_at,
-                    'error_message': doc.error_message
+                    'updated_at': doc.updated_at,
+                    'error_message': doc.error_message,
+                    'queue_position': queue_position_of.get(doc.id, 0),
+                    # Seconds until the next poll is worth making, None once processing ended
+                    'poll_after': suggest_poll_seconds(
+                        doc,
+                        wait_seconds=estimate_wait_seconds(
+                            'ingest', jobs_ahead=queue_position_of[doc.id] - 1, job_seconds=job_seconds
+                        ) if doc.id in queue_position_of else None
+                    )
                 } for doc in documents]
             })
             
@@ -320,11 +289,7 @@ class DocumentManagementViewSet(viewsets.ViewSet):
                     'message': 'Document not found'
                 }, status=status.HTTP_404_NOT_FOUND)
 
-            # Cancel any ongoing processing
-            if str(document_id) in self.processing_threads:
-                # We can't actually kill the thread, but we'll remove it from tracking
-                del self.processing_threads[str(document_id)]
-            
+            # Its queued jobs are deleted with it
             # Delete related data
             DocumentSection.objects.filter(document=document).delete()
             SearchResult.objects.filter(document=document).delete()
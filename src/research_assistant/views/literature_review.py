@@ -7,16 +7,13 @@ from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from asgiref.sync import sync_to_async, async_to_sync
 import asyncio
-import threading
-from threading import Lock
-import time
 import uuid
 
 from rest_framework.permissions import IsAuthenticated
 from django.db import transaction
 
-from ..models import DocumentMetadata, DocumentSection, LiteratureReview
-from ..services.literature_extractor import LiteratureExtractor
+from ..models import DocumentMetadata, LiteratureReview
+from ..services.job_queue import enqueue, has_active_job
 
 
 @method_decorator(csrf_exempt, name='dispatch')
@@ -25,110 +22,6 @@ class LiteratureReviewViewSet(viewsets.ViewSet):
     
     permission_classes = [IsAuthenticated]
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.processing_threads = {}
-        self.thread_lock = Lock()
-        self.max_concurrent_processes = 2  # Limit concurrent extraction processes
-
-    def _process_literature_review_background(self, document_id, user):
-        """Background processing task for literature review extraction"""
-        document_id_str = str(document_id)
-        
-        try:
-            print(f"[_process_literature_review_background] Starting extraction for: {document_id}")
-            
-            # Get the document
-            document = DocumentMetadata.objects.get(id=document_id)
-            
-            # Check if literature review already exists and is completed
-            existing_review = LiteratureReview.objects.filter(
-                document=document, 
-                processing_status='completed'
-            ).first()
-            
-            if existing_review:
-                print(f"[_process_literature_review_background] Literature review already exists for: {document_id}")
-                with self.thread_lock:
-                    if document_id_str in self.processing_threads:
-                        del self.processing_threads[document_id_str]
-                return
-            
-            # Create or get pending literature review
-            literature_review, created = LiteratureReview.objects.get_or_create(
-                document=document,
-                user=user,
-                defaults={
-                    'processing_status': 'processing'
-                }
-            )
-            
-            if not created:
-                literature_review.processing_status = 'processing'
-                literature_review.save()
-            
-            # Get document sections
-            sections = list(DocumentSection.objects.filter(document=document).order_by('section_start_page_number'))
-            
-            if not sections:
-                raise ValueError("Document has no sections to analyze")
-            
-            # Get reference data
-            reference_data = document.reference or {}
-            
-            # Initialize extractor and process document
-            extractor = LiteratureExtractor()
-            extraction_result = extractor.extract_literature_review(
-                document_id=str(document.id),
-                sections=sections,
-                reference_data=reference_data
-            )
-            
-            if extraction_result.get('status') == 'success':
-                extraction_data = extraction_result.get('extraction_data', {})
-                
-                # Update literature review with extracted data
-                literature_review.research_area = extraction_data.get('research_area', '')
-                literature_review.themes = extraction_data.get('themes', [])
-                literature_review.chronological_development = extraction_data.get('chronological_development')
-                literature_review.theoretical_frameworks = extraction_data.get('theoretical_frameworks')
-                literature_review.methodological_approaches = extraction_data.get('methodological_approaches', {})
-                literature_review.key_findings = extraction_data.get('key_findings', [])
-                literature_review.method_strengths = extraction_data.get('method_strengths', [])
-                literature_review.method_limitations = extraction_data.get('method_limitations', [])
-                literature_review.result_strengths = extraction_data.get('result_strengths', [])
-                literature_review.result_weaknesses = extraction_data.get('result_weaknesses', [])
-                literature_review.potential_biases = extraction_data.get('potential_biases', [])
-                
-                literature_review.extraction_time = extraction_result.get('processing_time', 0)
-                literature_review.processing_status = 'completed'
-                literature_review.save()
-                
-                print(f"[_process_literature_review_background] Successfully extracted literature review for: {document_id}")
-            else:
-                # Update literature review with error
-                literature_review.processing_status = 'failed'
-                literature_review.error_message = extraction_result.get('error_message', 'Unknown error during extraction')
-                literature_review.save()
-                
-                print(f"[_process_literature_review_background] Failed to extract literature review for: {document_id}")
-                
-        except Exception as e:
-            print(f"[_process_literature_review_background] Error processing literature review: {str(e)}")
-            # Update status to failed
-            try:
-                literature_review = LiteratureReview.objects.get(document_id=document_id)
-                literature_review.processing_status = 'failed'
-                literature_review.error_message = str(e)
-                literature_review.save()
-            except Exception as inner_e:
-                print(f"[_process_literature_review_background] Failed to update literature review status: {str(inner_e)}")
-        finally:
-            # Remove the thread from tracking with thread safety
-            with self.thread_lock:
-                if document_id_str in self.processing_threads:
-                    del self.processing_threads[document_id_str]
-
     @action(detail=False, methods=['POST'])
     def extract(self, request):
         """Extract literature review from a document"""
@@ -191,48 +84,27 @@ class LiteratureReviewViewSet(viewsets.ViewSet):
                         processing_status='pending'
                     )
             
-            # Start extraction in background
-            document_id_str = str(document.id)
-            
-            # Check if already processing
-            with self.thread_lock:
-                if document_id_str in self.processing_threads:
-                    return Response({
-                        'status': 'success',
-                        'message': 'Literature review extraction already in progress',
-                        'literature_review_id': str(existing_review.id),
-                        'processing_status': 'processing'
-                    })
-                
-                # Check if we're at max capacity
-                current_thread_count = len(self.processing_threads)
-                
-                if current_thread_count >= self.max_concurrent_processes:
-                    return Response({
-                        'status': 'success',
-                        'message': 'Maximum extraction processes reached, please try again later',
-                        'literature_review_id': str(existing_review.id),
-                        'processing_status': 'pending'
-                    }, status=status.HTTP_202_ACCEPTED)
-                
-                # Create background thread for processing
-                thread = threading.Thread(
-                    target=self._process_literature_review_background,
-                    args=(document.id, request.user)
-                )
-                thread.daemon = True
-                
-                # Add to tracking dict with thread safety
-                self.processing_threads[document_id_str] = thread
-                
-                # Start the thread
-                thread.start()
-            
+            # A job may still be queued from an earlier request
+            if has_active_job('literature_review', document):
+                return Response({
+                    'status': 'success',
+                    'message': 'Literature review extraction already in progress',
+                    'literature_review_id': str(existing_review.id),
+                    'processing_status': existing_review.processing_status
+                })
+
+            # Run by a run_workers process, see job_handlers.extract_literature_review
+            enqueue(
+                'literature_review',
+                {'document_id': str(document.id), 'user_id': request.user.id},
+                document=document
+            )
+
             return Response({
                 'status': 'success',
-                'message': 'Literature review extraction started',
+                'message': 'Literature review extraction queued',
                 'literature_review_id': str(existing_review.id),
-                'processing_status': 'processing'
+                'processing_status': existing_review.processing_status
             })
             
         except DocumentMetadata.DoesNotExist: